@@ -85,14 +85,17 @@ from .expression_tree.operations.evaluate_python import (
     id_to_python_variable,
     to_python,
     EvaluatorPython,
+    EvaluatorPythonJacobianAction,
 )
 
 from .expression_tree.operations.evaluate_python import EvaluatorJax
 from .expression_tree.operations.evaluate_python import JaxCooMatrix
 
-from .expression_tree.operations.jacobian import Jacobian
+from .expression_tree.operations.jacobian import Jacobian, JacobianAction
+from .expression_tree.operations.jacobian_sparsity import JacobianSparsity
 from .expression_tree.operations.convert_to_casadi import CasadiConverter
 from .expression_tree.operations.unpack_symbols import SymbolUnpacker
+from .expression_tree.operations.substitute_inputs import InputSubstitution
 
 #
 # Model classes
@@ -206,8 +209,11 @@ from .spatial_methods.scikit_finite_element import ScikitFiniteElement
 # Solver classes
 #
 from .solvers.solution import Solution, EmptySolution, make_cycle_solution
+from .solvers.solution_storage import MemmapStorage
+from .solvers.solution_sinks import SolutionSink, DataFileSink
 from .solvers.processed_variable import ProcessedVariable
 from .solvers.processed_variable_computed import ProcessedVariableComputed
+from .solvers.finite_difference_jacobian import FiniteDifferenceJacobian
 from .solvers.base_solver import BaseSolver
 from .solvers.dummy_solver import DummySolver
 from .solvers.algebraic_solver import AlgebraicSolver
@@ -242,6 +248,7 @@ from .plotting.dynamic_plot import dynamic_plot
 #
 # Simulation
 #
+from .model_cache import ModelCache
 from .simulation import Simulation, load_sim, is_notebook
 
 #
@@ -1,9 +1,12 @@
 #
 # BatchStudy class
 #
-import pybamm
+import multiprocessing as mp
+import os
 from itertools import product
 
+import pybamm
+
 
 class BatchStudy:
     """
@@ -98,22 +101,10 @@ class BatchStudy:
                         f" if permutations=False"
                     )
 
-    def solve(
-        self,
-        t_eval=None,
-        solver=None,
-        check_model=True,
-        save_at_cycles=None,
-        calc_esoh=True,
-        starting_solution=None,
-        initial_soc=None,
-        **kwargs,
-    ):
+    def _create_simulations(self):
         """
-        For more information on the parameters used in the solve,
-        See :meth:`pybamm.Simulation.solve`
+        Create the simulations to run, based on the value of self.permutations
         """
-        self.sims = []
         iter_func = product if self.permutations else zip
 
         # Instantiate items in INPUT_LIST based on the value of self.permutations
@@ -127,6 +118,7 @@ class BatchStudy:
                 inp_value = [None] * len(self.models)
             inp_values.append(inp_value)
 
+        sims = []
         for (
             model,
             experiment,
@@ -139,37 +131,173 @@ class BatchStudy:
             output_variable,
             C_rate,
         ) in iter_func(self.models.values(), *inp_values):
-            sim = pybamm.Simulation(
-                model,
-                experiment=experiment,
-                geometry=geometry,
-                parameter_values=parameter_value,
-                submesh_types=submesh_type,
-                var_pts=var_pt,
-                spatial_methods=spatial_method,
-                solver=solver,
-                output_variables=output_variable,
-                C_rate=C_rate,
-            )
-            # Repeat to get average solve time and integration time
-            solve_time = 0
-            integration_time = 0
-            for _ in range(self.repeats):
-                sol = sim.solve(
-                    t_eval,
-                    solver,
-                    check_model,
-                    save_at_cycles,
-                    calc_esoh,
-                    starting_solution,
-                    initial_soc,
-                    **kwargs,
+            sims.append(
+                pybamm.Simulation(
+                    model,
+                    experiment=experiment,
+                    geometry=geometry,
+                    parameter_values=parameter_value,
+                    submesh_types=submesh_type,
+                    var_pts=var_pt,
+                    spatial_methods=spatial_method,
+                    solver=solver,
+                    output_variables=output_variable,
+                    C_rate=C_rate,
                 )
-                solve_time += sol.solve_time
-                integration_time += sol.integration_time
-            sim.solution.solve_time = solve_time / self.repeats
-            sim.solution.integration_time = integration_time / self.repeats
-            self.sims.append(sim)
+            )
+        return sims
+
+    def solve(
+        self,
+        t_eval=None,
+        solver=None,
+        check_model=True,
+        save_at_cycles=None,
+        calc_esoh=True,
+        starting_solution=None,
+        initial_soc=None,
+        nproc=1,
+        **kwargs,
+    ):
+        """
+        Solve all the simulations. If any simulation fails, the error is raised.
+
+        For more information on the parameters used in the solve,
+        See :meth:`pybamm.Simulation.solve`
+
+        Parameters
+        ----------
+        nproc : int, optional
+            The number of processes used to solve the simulations in parallel (see
+            :meth:`solve_iter`). Default is 1, in which case the simulations are
+            solved in series in this process.
+        """
+        for _, sim, error in self._solve_iter(
+            t_eval,
+            solver,
+            check_model,
+            save_at_cycles,
+            calc_esoh,
+            starting_solution,
+            initial_soc,
+            nproc,
+            **kwargs,
+        ):
+            if error is not None:
+                raise error
+
+    def solve_iter(
+        self,
+        t_eval=None,
+        solver=None,
+        check_model=True,
+        save_at_cycles=None,
+        calc_esoh=True,
+        starting_solution=None,
+        initial_soc=None,
+        nproc=None,
+        **kwargs,
+    ):
+        """
+        Solve the simulations in a pool of `nproc` worker processes, yielding each
+        simulation as soon as it has been solved. Simulations that fail are not
+        yielded; their errors are stored in `self.errors` instead.
+
+        `self.sims` holds all the simulations in the same order as in :meth:`solve`,
+        and each one is replaced by its solved copy from the workers as the results
+        arrive. The wall-clock time taken by each simulation, including building
+        the model, is stored in `self.times`. Stopping the iteration early
+        terminates the workers.
+
+        For more information on the other parameters used in the solve,
+        See :meth:`pybamm.Simulation.solve`
+
+        Parameters
+        ----------
+        nproc : int, optional
+            The maximum number of simulations to solve at the same time. Default
+            is None, which uses all the available CPUs. If 1, the simulations are
+            solved in series in this process.
+
+        Yields
+        ------
+        index : int
+            The position of the simulation in `self.sims`
+        sim : :class:`pybamm.Simulation`
+            The solved simulation
+        """
+        for index, sim, error in self._solve_iter(
+            t_eval,
+            solver,
+            check_model,
+            save_at_cycles,
+            calc_esoh,
+            starting_solution,
+            initial_soc,
+            nproc,
+            **kwargs,
+        ):
+            if error is None:
+                yield index, sim
+
+    def _solve_iter(
+        self,
+        t_eval,
+        solver,
+        check_model,
+        save_at_cycles,
+        calc_esoh,
+        starting_solution,
+        initial_soc,
+        nproc,
+        **kwargs,
+    ):
+        self.sims = self._create_simulations()
+        self.times = [None] * len(self.sims)
+        self.errors = {}
+        solve_args = (
+            t_eval,
+            solver,
+            check_model,
+            save_at_cycles,
+            calc_esoh,
+            starting_solution,
+            initial_soc,
+        )
+        tasks = [
+            (index, sim, self.repeats, solve_args, kwargs)
+            for index, sim in enumerate(self.sims)
+        ]
+
+        if nproc == 1:
+            results = map(_solve_simulation, tasks)
+            pool = None
+        else:
+            nproc = min(nproc or os.cpu_count(), len(tasks)) or 1
+            pybamm.logger.info(
+                f"Starting pool of {nproc} worker processes for {len(tasks)} "
+                "simulations"
+            )
+            pool = mp.Pool(processes=nproc)
+            # Each simulation is sent to a worker on its own, so that long and short
+            # simulations are balanced between the workers
+            results = pool.imap_unordered(
+                _solve_simulation_in_worker, tasks, chunksize=1
+            )
+
+        try:
+            for index, sim, error, time in results:
+                self.times[index] = time
+                if error is None:
+                    self.sims[index] = sim
+                else:
+                    pybamm.logger.error(f"Simulation {index} failed: {error}")
+                    self.errors[index] = error
+                yield index, self.sims[index], error
+        finally:
+            if pool is not None:
+                pool.terminate()
+                pool.join()
 
     def plot(self, output_variables=None, **kwargs):
         """
@@ -205,3 +333,33 @@ class BatchStudy:
             duration=duration,
             output_filename=output_filename,
         )
+
+
+def _solve_simulation(task):
+    """
+    Solve a simulation `repeats` times, averaging the solve and integration times.
+    Defined at module level so that it can be sent to worker processes.
+    """
+    index, sim, repeats, solve_args, kwargs = task
+    timer = pybamm.Timer()
+    try:
+        # Repeat to get average solve time and integration time
+        solve_time = 0
+        integration_time = 0
+        for _ in range(repeats):
+            sol = sim.solve(*solve_args, **kwargs)
+            solve_time += sol.solve_time
+            integration_time += sol.integration_time
+        sim.solution.solve_time = solve_time / repeats
+        sim.solution.integration_time = integration_time / repeats
+    except Exception as error:
+        return index, None, error, timer.time()
+    return index, sim, None, timer.time()
+
+
+def _solve_simulation_in_worker(task):
+    """Solve a simulation in a worker process and prepare it to be sent back"""
+    index, sim, error, time = _solve_simulation(task)
+    if sim is not None:
+        sim._clear_solver_problems()
+    return index, sim, error, time
@@ -124,6 +124,10 @@ class Array(pybamm.Symbol):
             (self.__class__, self.name, *self.entries_string, *tuple(self.domain))
         )
 
+    def _digest_data(self):
+        """See :meth:`pybamm.Symbol._digest_data()`."""
+        return (self._entries,)
+
     def _jac(self, variable):
         """See :meth:`pybamm.Symbol._jac()`."""
         # Return zeros of correct size
@@ -1,6 +1,7 @@
 #
 # Interpolating class
 #
+import itertools
 import numpy as np
 from scipy import interpolate
 import warnings
@@ -194,6 +195,7 @@ class Interpolant(pybamm.Function):
         self.x = x
         self.y = y
         self.entries_string = entries_string
+        self.kernel = _InterpolantKernel.create(x, y, interpolator, extrapolate)
         super().__init__(
             interpolating_function, *children, name=name, derivative="derivative"
         )
@@ -246,6 +248,10 @@ class Interpolant(pybamm.Function):
             (self.__class__, self.name, self.entries_string, *tuple([child.id for child in self.children]), *tuple(self.domain))
         )
 
+    def _digest_data(self):
+        """See :meth:`pybamm.Symbol._digest_data()`."""
+        return (self.x, self.y, self.interpolator, self.extrapolate)
+
     def _function_new_copy(self, children):
         """See :meth:`Function._function_new_copy()`"""
         return pybamm.Interpolant(
@@ -266,6 +272,8 @@ class Interpolant(pybamm.Function):
             else:
                 children_eval_flat.append(child)
         if self.dimension == 1:
+            if self.kernel is not None:
+                return self.kernel(*children_eval_flat).flatten()[:, np.newaxis]
             return self.function(*children_eval_flat).flatten()[:, np.newaxis]
         elif self.dimension in [2, 3]:
             # If the children are scalars, we need to add a dimension
@@ -293,6 +301,8 @@ class Interpolant(pybamm.Function):
                     new_evaluated_children.append(child.flatten())
                 else:
                     new_evaluated_children.append(np.reshape(child, shape).flatten())
+            if self.kernel is not None:
+                return self.kernel(*new_evaluated_children)[:, np.newaxis]
 
             # return nans if there are any within the children
             nans = np.isnan(new_evaluated_children)
@@ -325,3 +335,130 @@ class Interpolant(pybamm.Function):
         }
 
         return json_dict
+
+
+class _InterpolantKernel:
+    """
+    Vectorised evaluation of a linear interpolant from precomputed data, used
+    instead of the SciPy interpolator when evaluating an :class:`Interpolant` in
+    python. In 2D and 3D, the values at the corners of the cells containing the
+    points are gathered with a single flat index and then reduced one dimension at
+    a time. On uniform grids, the intervals are found by division rather than by a
+    binary search. Cubic and pchip interpolants are left to the compiled SciPy
+    interpolators, which are faster.
+
+    Parameters
+    ----------
+    grid : tuple of :class:`numpy.ndarray`
+        The (increasing) data point coordinates in each dimension
+    values : :class:`numpy.ndarray`
+        The values at the grid points
+    extrapolate : bool
+        Whether to extrapolate linearly outside of the grid, or return NaN
+    """
+
+    def __init__(self, grid, values, extrapolate):
+        self.grid = grid
+        self.values = values
+        self.extrapolate = extrapolate
+        # inverse of the spacing of each uniform grid, or None, and of the width
+        # of each interval of the other grids
+        self.inverse_spacing = []
+        self.inverse_widths = []
+        for x in grid:
+            dx = np.diff(x)
+            if np.allclose(dx, dx[0], rtol=1e-12, atol=0):
+                self.inverse_spacing.append((x.size - 1) / (x[-1] - x[0]))
+            else:
+                self.inverse_spacing.append(None)
+            self.inverse_widths.append(1 / dx)
+        if len(grid) == 1:
+            self.slopes = np.diff(values) * self.inverse_widths[0]
+        else:
+            self.strides = [stride // values.itemsize for stride in values.strides]
+            self.flat_values = values.reshape(-1)
+            # offsets of the corners of a cell from its first corner in the flat
+            # values, with one axis per dimension
+            self.corner_offsets = np.array(
+                [
+                    np.dot(corner, self.strides)
+                    for corner in itertools.product((0, 1), repeat=len(grid))
+                ]
+            ).reshape((2,) * len(grid) + (1,))
+
+    @classmethod
+    def create(cls, x, y, interpolator, extrapolate):
+        """
+        Create the kernel of an interpolant from its data and options, or return
+        None if the interpolant is not supported (cubic and pchip interpolants, or
+        1D interpolants with multidimensional data)
+        """
+        if interpolator != "linear":
+            return None
+        grid = tuple(np.ascontiguousarray(x_i, dtype=float) for x_i in x)
+        y = np.ascontiguousarray(y, dtype=float)
+        if any(x_i.size < 2 or np.any(np.diff(x_i) <= 0) for x_i in grid):
+            return None
+        if len(grid) == 1 and y.ndim != 1:
+            return None
+        return cls(grid, y, extrapolate)
+
+    def _locate(self, dim, values):
+        """
+        Index of the interval of the grid in dimension `dim` containing each value
+        (or the first or last interval for values outside of the grid), and the
+        offset of the value from the start of that interval
+        """
+        x = self.grid[dim]
+        inverse_spacing = self.inverse_spacing[dim]
+        if inverse_spacing is None:
+            idx = np.searchsorted(x, values, side="right")
+            idx -= 1
+            np.clip(idx, 0, x.size - 2, out=idx)
+        else:
+            position = (values - x[0]) * inverse_spacing
+            # fmax and fmin also map NaN to a valid index
+            idx = np.fmin(np.fmax(position, 0), x.size - 2).astype(np.intp)
+        return idx, values - x.take(idx)
+
+    def __call__(self, *children):
+        """
+        Evaluate the interpolant. The result has the (broadcast) shape of the
+        children, as with the SciPy interpolators.
+        """
+        if len(children) == 1:
+            value = np.asarray(children[0], dtype=float)
+            shape = value.shape
+            value = value.reshape(-1)
+            idx, offset = self._locate(0, value)
+            result = self.slopes.take(idx)
+            result *= offset
+            result += self.values.take(idx)
+            if not self.extrapolate:
+                x = self.grid[0]
+                result[(value < x[0]) | (value > x[-1])] = np.nan
+            return result.reshape(shape)
+
+        values = np.broadcast_arrays(
+            *[np.asarray(child, dtype=float) for child in children]
+        )
+        shape = values[0].shape
+        values = [value.reshape(-1) for value in values]
+        first_corner = 0
+        weights = []
+        for dim, value in enumerate(values):
+            idx, weight = self._locate(dim, value)
+            if self.inverse_spacing[dim] is None:
+                weight *= self.inverse_widths[dim].take(idx)
+            else:
+                weight *= self.inverse_spacing[dim]
+            idx *= self.strides[dim]
+            first_corner = first_corner + idx
+            weights.append(weight)
+        result = self.flat_values.take(first_corner + self.corner_offsets)
+        for weight in weights:
+            result = result[0] + weight * (result[1] - result[0])
+        if not self.extrapolate:
+            for x, value in zip(self.grid, values):
+                result[(value < x[0]) | (value > x[-1])] = np.nan
+        return result.reshape(shape)
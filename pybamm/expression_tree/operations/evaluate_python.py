@@ -145,7 +145,9 @@ def find_symbols(symbol, constant_symbols, variable_symbols, output_jax=False):
     Note that it is important that the arguments `constant_symbols` and
     `variable_symbols` be an *ordered* dict, since the final ordering of the code lines
     are important for the calculations. A dict is specified rather than a list so that
-    identical subtrees (which give identical id's) are not recalculated in the code
+    identical subtrees (which give identical id's) are not recalculated in the code.
+    Subtrees that are already in the dictionaries (e.g. from a previous call with
+    another symbol) are not visited again.
 
     Parameters
     ----------
@@ -164,6 +166,10 @@ def find_symbols(symbol, constant_symbols, variable_symbols, output_jax=False):
         operations are used
 
     """
+    # identical subtrees only need to be processed once
+    if symbol.id in variable_symbols or symbol.id in constant_symbols:
+        return
+
     # constant symbols that are not numbers are stored in a list of constants, which are
     # passed into the generated function constant symbols that are numbers are written
     # directly into the code
@@ -297,6 +303,16 @@ def find_symbols(symbol, constant_symbols, variable_symbols, output_jax=False):
         if isinstance(symbol.function, np.ufunc):
             # write any numpy functions directly
             symbol_str = "np.{}({})".format(symbol.function.__name__, children_str)
+        elif (
+            isinstance(symbol, pybamm.Interpolant)
+            and symbol.kernel is not None
+            and not output_jax
+        ):
+            # evaluate interpolants with their precomputed kernel rather than the
+            # SciPy interpolator
+            constant_symbols[symbol.id] = symbol.kernel
+            funct_var = id_to_python_variable(symbol.id, True)
+            symbol_str = "{}({})".format(funct_var, children_str)
         else:
             # unknown function, store it as a constant and call this in the
             # generated code
@@ -383,8 +399,10 @@ def to_python(symbol, debug=False, output_jax=False):
 
     Parameters
     ----------
-    symbol : :class:`pybamm.Symbol`
-        The symbol to convert to python code
+    symbol : :class:`pybamm.Symbol` or list of :class:`pybamm.Symbol`
+        The symbol to convert to python code. If a list of symbols is given, the code
+        evaluates all of them, and subtrees that are shared between the symbols are
+        only evaluated once
 
     debug : bool
         If set to True, the function also emits debug code
@@ -404,7 +422,9 @@ def to_python(symbol, debug=False, output_jax=False):
     """
     constant_values = OrderedDict()
     variable_symbols = OrderedDict()
-    find_symbols(symbol, constant_values, variable_symbols, output_jax)
+    symbols = symbol if isinstance(symbol, (list, tuple)) else [symbol]
+    for symbol in symbols:
+        find_symbols(symbol, constant_values, variable_symbols, output_jax)
 
     line_format = "{} = {}"
 
@@ -428,6 +448,20 @@ def to_python(symbol, debug=False, output_jax=False):
     return constant_values, "\n".join(variable_lines)
 
 
+def _result_code(symbol):
+    """
+    Code for the result of evaluating `symbol` (or a tuple of results, for a list of
+    symbols), in code generated by :func:`to_python`
+    """
+    if isinstance(symbol, (list, tuple)):
+        return "({},)".format(", ".join(_result_code(s) for s in symbol))
+    if symbol.is_constant():
+        result_value = symbol.evaluate()
+        if isinstance(result_value, numbers.Number):
+            return str(result_value)
+    return id_to_python_variable(symbol.id, symbol.is_constant())
+
+
 class EvaluatorPython:
     """
     Converts a pybamm expression tree into pure python code that will calculate the
@@ -436,8 +470,10 @@ class EvaluatorPython:
     Parameters
     ----------
 
-    symbol : :class:`pybamm.Symbol`
-        The symbol to convert to python code
+    symbol : :class:`pybamm.Symbol` or list of :class:`pybamm.Symbol`
+        The symbol to convert to python code. If a list of symbols is given, calling
+        the evaluator returns a tuple with the result for each symbol, and subtrees
+        that are shared between the symbols are only evaluated once per call.
 
 
     """
@@ -464,15 +500,11 @@ class EvaluatorPython:
 
         # calculate the final variable that will output the result of calling `evaluate`
         # on `symbol`
-        result_var = id_to_python_variable(symbol.id, symbol.is_constant())
-        if symbol.is_constant():
-            result_value = symbol.evaluate()
+        first_symbol = symbol[0] if isinstance(symbol, (list, tuple)) else symbol
+        result_var = id_to_python_variable(first_symbol.id, first_symbol.is_constant())
 
         # add return line
-        if symbol.is_constant() and isinstance(result_value, numbers.Number):
-            python_str = python_str + "\n   return " + str(result_value)
-        else:
-            python_str = python_str + "\n   return " + result_var
+        python_str = python_str + "\n   return " + _result_code(symbol)
 
         # store a copy of examine_jaxpr
         python_str = python_str + "\nself._evaluate = evaluate"
@@ -515,6 +547,29 @@ class EvaluatorPython:
         exec(compiled_function)
 
 
+class EvaluatorPythonJacobianAction(EvaluatorPython):
+    """
+    Converts the action of a Jacobian on a vector, as calculated by
+    :class:`pybamm.JacobianAction`, into pure python code. The vector is passed
+    separately from the state, as for the jacobian-vector product of
+    :class:`pybamm.EvaluatorJax`.
+
+    Parameters
+    ----------
+
+    symbol : :class:`pybamm.Symbol`
+        The Jacobian action to convert to python code. The vector on which the
+        Jacobian acts must be the slice of the state vector that follows the state.
+    """
+
+    def __call__(self, t=None, y=None, v=None, inputs=None):
+        """
+        evaluate jacobian vector product of function
+        """
+        y_and_v = np.concatenate([np.reshape(y, -1), np.reshape(v, -1)])
+        return super().__call__(t, y_and_v, inputs)
+
+
 class EvaluatorJax:
     """
     Converts a pybamm expression tree into pure python code that will calculate the
@@ -528,8 +583,11 @@ class EvaluatorJax:
     Parameters
     ----------
 
-    symbol : :class:`pybamm.Symbol`
-        The symbol to convert to python code
+    symbol : :class:`pybamm.Symbol` or list of :class:`pybamm.Symbol`
+        The symbol to convert to python code. If a list of symbols is given, calling
+        the evaluator returns a tuple with the result for each symbol, and subtrees
+        that are shared between the symbols are only evaluated once per call.
+        Jacobians and sensitivities can only be calculated for a single symbol.
 
 
     """
@@ -578,15 +636,11 @@ class EvaluatorJax:
 
         # calculate the final variable that will output the result of calling `evaluate`
         # on `symbol`
-        result_var = id_to_python_variable(symbol.id, symbol.is_constant())
-        if symbol.is_constant():
-            result_value = symbol.evaluate()
+        first_symbol = symbol[0] if isinstance(symbol, (list, tuple)) else symbol
+        result_var = id_to_python_variable(first_symbol.id, first_symbol.is_constant())
 
         # add return line
-        if symbol.is_constant() and isinstance(result_value, numbers.Number):
-            python_str = python_str + "\n   return " + str(result_value)
-        else:
-            python_str = python_str + "\n   return " + result_var
+        python_str = python_str + "\n   return " + _result_code(symbol)
 
         # store a copy of examine_jaxpr
         python_str = python_str + "\nself._evaluate_jax = evaluate_jax"
@@ -1,6 +1,8 @@
 #
 # Calculate the Jacobian of a symbol
 #
+import numpy as np
+
 import pybamm
 
 
@@ -96,3 +98,124 @@ class Jacobian(object):
         if self._clear_domain:
             jac.clear_domains()
         return jac
+
+
+class JacobianAction(Jacobian):
+    """
+    Helper class to calculate the action of the Jacobian of an expression on a
+    vector, i.e. the directional derivative :math:`(\\partial f / \\partial y) v`.
+
+    The action is calculated in forward mode, by applying the same rules as
+    :class:`pybamm.Jacobian` to vectors instead of matrices: each (slice of a)
+    StateVector is replaced by the corresponding slice of `vector`. The resulting
+    expression only contains vectors of the same size as the nodes of the original
+    expression, so the Jacobian matrix is never formed.
+
+    Parameters
+    ----------
+
+    vector : :class:`pybamm.StateVector`
+        The vector on which the Jacobian acts. Must have the same size as the
+        variable with respect to which the Jacobian is taken, and is usually a
+        slice of the state vector after the variable, so that the action can be
+        evaluated with the state and the vector stacked together.
+
+    known_jacs: dict {variable ids -> :class:`pybamm.Symbol`}
+        cached Jacobian actions
+
+    clear_domain: bool
+        whether or not the Jacobian action clears the domain (default True)
+    """
+
+    def __init__(self, vector, known_jacs=None, clear_domain=True):
+        super().__init__(known_jacs=known_jacs, clear_domain=clear_domain)
+        self._vector = vector
+
+    def jac(self, symbol, variable):
+        """
+        Calculate the action of the Jacobian of `symbol` with respect to `variable`
+        on the vector, recursing down the tree as in :meth:`Jacobian.jac()`.
+
+        Parameters
+        ----------
+        symbol : :class:`pybamm.Symbol`
+            The symbol to calculate the Jacobian action of
+        variable : :class:`pybamm.StateVector`
+            The variable with respect to which to differentiate
+
+        Returns
+        -------
+        :class:`pybamm.Symbol`
+            Symbol representing the Jacobian action, with the same size as `symbol`
+        """
+        jac = super().jac(symbol, variable)
+        # Some rules return a scalar zero rather than zeros of the right size
+        if jac.evaluates_to_constant_number() and symbol.size != 1:
+            jac = pybamm.Vector(np.zeros(symbol.size))
+        return jac
+
+    def _jac(self, symbol, variable):
+        """See :meth:`JacobianAction.jac()`."""
+
+        if isinstance(symbol, pybamm.StateVector):
+            if len(variable.y_slices) > 1 or len(self._vector.y_slices) > 1:
+                raise NotImplementedError(
+                    "Jacobian action is only implemented for a variable and a "
+                    "vector with a single slice"
+                )
+            variable_slice = variable.y_slices[0]
+            if any(
+                y_slice.start < variable_slice.start
+                or y_slice.stop > variable_slice.stop
+                for y_slice in symbol.y_slices
+            ):
+                raise NotImplementedError(
+                    "Jacobian action is only implemented for StateVectors within "
+                    "the variable"
+                )
+            offset = self._vector.y_slices[0].start - variable_slice.start
+            jac = pybamm.StateVector(
+                *[
+                    slice(y_slice.start + offset, y_slice.stop + offset)
+                    for y_slice in symbol.y_slices
+                ]
+            )
+
+        elif isinstance(symbol, pybamm.Index):
+            child_jac = self.jac(symbol.child, variable)
+            jac = pybamm.Index(child_jac, symbol.index)
+
+        elif isinstance(symbol, pybamm.DomainConcatenation):
+            # note that this assumes that the children are in the right order and
+            # only have one domain each, as for the Jacobian
+            children_jacs = [self.jac(child, variable) for child in symbol.children]
+            jacs = []
+            for i in range(symbol.secondary_dimensions_npts):
+                for child_jac, slices in zip(children_jacs, symbol._children_slices):
+                    if len(slices) > 1:
+                        raise NotImplementedError(
+                            "jacobian only implemented for when each child has "
+                            "a single domain"
+                        )
+                    child_slice = next(iter(slices.values()))
+                    jacs.append(pybamm.Index(child_jac, child_slice[i]))
+            jac = pybamm.numpy_concatenation(*jacs)
+
+        elif isinstance(symbol, pybamm.Concatenation):
+            children_jacs = [self.jac(child, variable) for child in symbol.children]
+            jac = pybamm.numpy_concatenation(*children_jacs)
+
+        elif len(symbol.children) == 0:
+            # Any other leaf (e.g. time, inputs, constants) does not depend on the
+            # state
+            jac = pybamm.Scalar(0)
+
+        else:
+            # Use the rules of the Jacobian, which are linear in the Jacobians of
+            # the children and so also apply to their actions
+            return super()._jac(symbol, variable)
+
+        # Jacobian by default removes the domain(s)
+        if self._clear_domain:
+            jac.clear_domains()
+        return jac
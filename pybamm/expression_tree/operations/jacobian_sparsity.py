@@ -0,0 +1,186 @@
+#
+# Calculate the sparsity pattern of the Jacobian of a symbol
+#
+from collections import OrderedDict
+
+import numpy as np
+from scipy.sparse import csr_matrix, issparse, vstack
+
+import pybamm
+
+
+class JacobianSparsity(object):
+    """
+    Helper class to calculate the sparsity pattern of the Jacobian of an expression,
+    without calculating the Jacobian itself.
+
+    The pattern is propagated up the tree as a sparse matrix of ones: element-wise
+    operations and functions take the union of the patterns of their children,
+    matrix multiplications multiply the pattern of their child by the pattern of
+    the matrix, and indices and concatenations select and stack rows. Nodes whose
+    Jacobian is zero (e.g. heaviside functions, see :class:`pybamm.Jacobian`) have
+    an empty pattern. The pattern may therefore contain entries that are
+    numerically zero, but contains all the non-zero entries of the Jacobian.
+
+    Patterns are cached by :meth:`Symbol.id` and the variable, so the pattern is
+    only calculated once for each discretised model structure, e.g. for the models
+    of the steps of an experiment.
+
+    Parameters
+    ----------
+    cache_size : int, optional
+        The number of patterns to keep in the cache. Default is 32.
+    """
+
+    _cache = OrderedDict()
+
+    def __init__(self, cache_size=32):
+        self.cache_size = cache_size
+        self._known_patterns = {}
+
+    def sparsity(self, symbol, variable):
+        """
+        Calculate the sparsity pattern of the Jacobian of `symbol` with respect to
+        `variable`, or return it from the cache.
+
+        Parameters
+        ----------
+        symbol : :class:`pybamm.Symbol`
+            The symbol to calculate the sparsity pattern of the Jacobian of
+        variable : :class:`pybamm.StateVector`
+            The variable with respect to which to differentiate
+
+        Returns
+        -------
+        :class:`scipy.sparse.csr_matrix`
+            Matrix with ones at the entries that may be non-zero in the Jacobian
+        """
+        key = (symbol.id, variable.id)
+        cache = JacobianSparsity._cache
+        try:
+            cache.move_to_end(key)
+            return cache[key]
+        except KeyError:
+            pass
+
+        pattern = self._pattern(symbol, variable)
+        pattern.sort_indices()
+        cache[key] = pattern
+        while len(cache) > self.cache_size:
+            cache.popitem(last=False)
+        return pattern
+
+    @classmethod
+    def clear_cache(cls):
+        """Remove all the patterns from the cache"""
+        cls._cache.clear()
+
+    def _pattern(self, symbol, variable):
+        """
+        Recurse down the tree, calculating the pattern of each node once. See
+        :meth:`JacobianSparsity.sparsity()`.
+        """
+        pattern = self._known_patterns.get(symbol.id)
+        if pattern is None:
+            pattern = self._symbol_pattern(symbol, variable)
+            self._known_patterns[symbol.id] = pattern
+        return pattern
+
+    def _symbol_pattern(self, symbol, variable):
+        n_cols = int(variable.size)
+
+        if isinstance(symbol, pybamm.StateVector):
+            rows = np.flatnonzero(symbol.evaluation_array)
+            start = variable.y_slices[0].start
+            in_variable = np.zeros(len(symbol.evaluation_array), dtype=bool)
+            for y_slice in variable.y_slices:
+                in_variable[y_slice] = True
+            # columns of the variable, which may be made of several slices
+            cols = np.cumsum(in_variable[start:]) - 1
+            selected = in_variable[rows]
+            pattern = csr_matrix(
+                (
+                    np.ones(np.count_nonzero(selected)),
+                    (np.flatnonzero(selected), cols[rows[selected] - start]),
+                ),
+                shape=(len(rows), n_cols),
+            )
+
+        elif isinstance(symbol, pybamm.MatrixMultiplication):
+            left, right = symbol.children
+            if not left.is_constant():
+                raise NotImplementedError(
+                    "Jacobian sparsity of 'MatrixMultiplication' is only implemented "
+                    "for a constant left child"
+                )
+            matrix = left.evaluate()
+            if not issparse(matrix):
+                matrix = csr_matrix(matrix)
+            matrix = abs(matrix)
+            pattern = matrix @ self._pattern(right, variable)
+
+        elif isinstance(symbol, (pybamm.BinaryOperator, pybamm.Function)):
+            children_patterns = [
+                self._pattern(child, variable) for child in symbol.children
+            ]
+            size = max(child_pattern.shape[0] for child_pattern in children_patterns)
+            pattern = csr_matrix((size, n_cols))
+            # the Jacobian of these is zero, see their _binary_jac
+            if not isinstance(
+                symbol,
+                (pybamm.Equality, pybamm.EqualHeaviside, pybamm.NotEqualHeaviside),
+            ):
+                # element-wise operations depend on all their children
+                for child_pattern in children_patterns:
+                    if child_pattern.shape[0] == 1 and size != 1:
+                        # broadcast scalars
+                        child_pattern = child_pattern[np.zeros(size, dtype=int)]
+                    pattern = pattern + child_pattern
+
+        elif isinstance(symbol, (pybamm.Negate, pybamm.AbsoluteValue)):
+            pattern = self._pattern(symbol.child, variable)
+
+        elif isinstance(symbol, (pybamm.Sign, pybamm.Floor, pybamm.Ceiling)):
+            child_pattern = self._pattern(symbol.child, variable)
+            pattern = csr_matrix(child_pattern.shape)
+
+        elif isinstance(symbol, pybamm.Index):
+            pattern = self._pattern(symbol.child, variable)[symbol.slice]
+
+        elif isinstance(symbol, pybamm.DomainConcatenation):
+            children_patterns = [
+                self._pattern(child, variable) for child in symbol.children
+            ]
+            patterns = []
+            for i in range(symbol.secondary_dimensions_npts):
+                for child_pattern, slices in zip(
+                    children_patterns, symbol._children_slices
+                ):
+                    for child_slice in slices.values():
+                        patterns.append(child_pattern[child_slice[i]])
+            pattern = vstack(patterns, format="csr")
+
+        elif isinstance(symbol, pybamm.Concatenation):
+            children_patterns = [
+                self._pattern(child, variable) for child in symbol.children
+            ]
+            pattern = vstack(children_patterns, format="csr")
+
+        elif len(symbol.children) == 0:
+            # Any other leaf (e.g. time, inputs, constants) does not depend on the
+            # state
+            pattern = csr_matrix((int(symbol.size), n_cols))
+
+        else:
+            raise NotImplementedError(
+                "Cannot calculate Jacobian sparsity of symbol of type '{}'".format(
+                    type(symbol)
+                )
+            )
+
+        pattern = csr_matrix(pattern)
+        # only keep the pattern, not the values
+        pattern.eliminate_zeros()
+        pattern.data = np.ones_like(pattern.data)
+        return pattern
+
@@ -6,13 +6,16 @@ import json
 import importlib
 import numpy as np
 import re
+import zipfile
+from scipy.sparse import issparse
 
 from typing import Optional
 
 
 class Serialise:
     """
-    Converts a discretised model to and from a JSON file.
+    Converts a discretised model to and from a JSON file, or a binary file in which
+    the entries of arrays are stored as raw numpy arrays.
 
     """
 
@@ -67,6 +70,71 @@ class Serialise:
             node_dict["json"] = json.JSONEncoder.default(self, node)  # pragma: no cover
             return node_dict  # pragma: no cover
 
+    class _SymbolTable:
+        """
+        Converts PyBaMM symbols into a table of nodes, in which each node refers to its
+        children by their position in the table, so that symbols that appear several
+        times are only stored once. The entries of arrays are stored separately, as
+        little-endian numpy arrays.
+        """
+
+        def __init__(self):
+            self.nodes = []
+            self.arrays = {}
+            self._positions = {}
+
+        def add(self, node):
+            """Add a symbol or event to the table and return its position"""
+            if id(node) in self._positions:
+                return self._positions[id(node)]
+
+            node_dict = {"py/object": str(type(node))[8:-2], "py/id": id(node)}
+            if isinstance(node, pybamm.Array):
+                node_dict.update(self._array_to_json(node))
+                node_dict["children"] = []
+            elif isinstance(node, pybamm.Symbol):
+                node_dict.update(node.to_json())  # this doesn't include children
+                node_dict["children"] = [self.add(c) for c in node.children]
+
+                if hasattr(node, "initial_condition"):  # for ExplicitTimeIntegral
+                    node_dict["initial_condition"] = self.add(node.initial_condition)
+            elif isinstance(node, pybamm.Event):
+                node_dict.update(node.to_json())
+                node_dict["expression"] = self.add(node._expression)
+            else:
+                raise TypeError(  # pragma: no cover
+                    f"Cannot serialise object of type {type(node)}"
+                )
+
+            # Children are always added before their parents
+            self._positions[id(node)] = len(self.nodes)
+            self.nodes.append(node_dict)
+            return self._positions[id(node)]
+
+        def _add_array(self, array):
+            key = f"array_{len(self.arrays)}"
+            self.arrays[key] = np.asarray(array, dtype=array.dtype.newbyteorder("<"))
+            return {"py/array": key}
+
+        def _array_to_json(self, node):
+            """Same as `Array.to_json`, with the entries stored separately"""
+            if issparse(node.entries):
+                entries = node.entries.tocsr()
+                matrix = {
+                    "shape": entries.shape,
+                    "data": self._add_array(entries.data),
+                    "row_indices": self._add_array(entries.indices),
+                    "column_pointers": self._add_array(entries.indptr),
+                }
+            else:
+                matrix = self._add_array(node.entries)
+            return {
+                "name": node.name,
+                "id": node.id,
+                "domains": node.domains,
+                "entries": matrix,
+            }
+
     class _Empty:
         """A dummy class to aid deserialisation"""
 
@@ -83,12 +151,21 @@ class Serialise:
         mesh: Optional[pybamm.Mesh] = None,
         variables: Optional[pybamm.FuzzyDict] = None,
         filename: Optional[str] = None,
+        binary: bool = False,
+        compress: bool = True,
     ):
         """Saves a discretised model to a JSON file.
 
         As the model is discretised and ready to solve, only the right hand side,
         algebraic and initial condition variables are saved.
 
+        If `binary` is True, the model is instead saved to a numpy `.npz` archive,
+        which is much smaller and faster to load for models with large matrices
+        (e.g. finely meshed models). The expression trees are stored as a table of
+        nodes, in which symbols that are shared between several expressions are only
+        stored once, and the entries of arrays are stored as raw little-endian
+        numpy arrays rather than as lists of numbers.
+
         Parameters
         ----------
         model : :class:`pybamm.BaseModel`
@@ -102,12 +179,23 @@ class Serialise:
         filename: str (optional)
             The desired name of the JSON file. If no name is provided, one will be
             created based on the model name, and the current datetime.
+        binary: bool (optional)
+            Whether to save the model to a binary `.npz` file instead of a JSON file.
+            Default is False.
+        compress: bool (optional)
+            Whether to compress the arrays of a binary file. Default is True.
         """
         if model.is_discretised is False:
             raise NotImplementedError(
                 "PyBaMM can only serialise a discretised, ready-to-solve model."
             )
 
+        if binary:
+            symbol_table = self._SymbolTable()
+            encode = symbol_table.add
+        else:
+            encode = self._SymbolEncoder().default
+
         model_json = {
             "py/object": str(type(model))[8:-2],
             "py/id": id(model),
@@ -115,16 +203,14 @@ class Serialise:
             "name": model.name,
             "options": model.options,
             "bounds": [bound.tolist() for bound in model.bounds],
-            "concatenated_rhs": self._SymbolEncoder().default(model._concatenated_rhs),
-            "concatenated_algebraic": self._SymbolEncoder().default(
-                model._concatenated_algebraic
-            ),
-            "concatenated_initial_conditions": self._SymbolEncoder().default(
+            "concatenated_rhs": encode(model._concatenated_rhs),
+            "concatenated_algebraic": encode(model._concatenated_algebraic),
+            "concatenated_initial_conditions": encode(
                 model._concatenated_initial_conditions
             ),
-            "events": [self._SymbolEncoder().default(event) for event in model.events],
-            "mass_matrix": self._SymbolEncoder().default(model.mass_matrix),
-            "mass_matrix_inv": self._SymbolEncoder().default(model.mass_matrix_inv),
+            "events": [encode(event) for event in model.events],
+            "mass_matrix": encode(model.mass_matrix),
+            "mass_matrix_inv": encode(model.mass_matrix_inv),
         }
 
         if mesh:
@@ -133,15 +219,20 @@ class Serialise:
         if variables:
             if model._geometry:
                 model_json["geometry"] = self._deconstruct_pybamm_dicts(model._geometry)
-            model_json["variables"] = {
-                k: self._SymbolEncoder().default(v) for k, v in dict(variables).items()
-            }
+            model_json["variables"] = {k: encode(v) for k, v in dict(variables).items()}
 
         if filename is None:
             filename = model.name + "_" + datetime.now().strftime("%Y_%m_%d-%p%I_%M")
 
-        with open(filename + ".json", "w") as f:
-            json.dump(model_json, f)
+        if binary:
+            model_json["symbols"] = symbol_table.nodes
+            header = np.frombuffer(json.dumps(model_json).encode(), dtype=np.uint8)
+            savez = np.savez_compressed if compress else np.savez
+            with open(filename + ".npz", "wb") as f:
+                savez(f, header=header, **symbol_table.arrays)
+        else:
+            with open(filename + ".json", "w") as f:
+                json.dump(model_json, f)
 
     def load_model(
         self, filename: str, battery_model: Optional[pybamm.BaseModel] = None
@@ -162,7 +253,7 @@ class Serialise:
         ----------
 
         filename: str
-            Path to the JSON file containing the serialised model file
+            Path to the JSON or binary (`.npz`) file containing the serialised model
         battery_model:  :class:`pybamm.BaseModel` (optional)
             PyBaMM model to be created (e.g. pybamm.lithium_ion.SPM), which will
             override any model names within the file. If None, the function will look
@@ -175,30 +266,29 @@ class Serialise:
             `battery_model`.
         """
 
-        with open(filename, "r") as f:
-            model_data = json.load(f)
+        if zipfile.is_zipfile(filename):
+            # Binary file written with `binary=True`
+            with np.load(filename, allow_pickle=False) as data:
+                model_data = json.loads(data["header"].tobytes())
+                symbols = self._reconstruct_symbol_table(model_data["symbols"], data)
+            reconstruct = symbols.__getitem__  # nodes are referred to by position
+        else:
+            with open(filename, "r") as f:
+                model_data = json.load(f)
+            reconstruct = self._reconstruct_expression_tree
 
         recon_model_dict = {
             "name": model_data["name"],
             "options": self._convert_options(model_data["options"]),
             "bounds": tuple(np.array(bound) for bound in model_data["bounds"]),
-            "concatenated_rhs": self._reconstruct_expression_tree(
-                model_data["concatenated_rhs"]
-            ),
-            "concatenated_algebraic": self._reconstruct_expression_tree(
-                model_data["concatenated_algebraic"]
-            ),
-            "concatenated_initial_conditions": self._reconstruct_expression_tree(
+            "concatenated_rhs": reconstruct(model_data["concatenated_rhs"]),
+            "concatenated_algebraic": reconstruct(model_data["concatenated_algebraic"]),
+            "concatenated_initial_conditions": reconstruct(
                 model_data["concatenated_initial_conditions"]
             ),
-            "events": [
-                self._reconstruct_expression_tree(event)
-                for event in model_data["events"]
-            ],
-            "mass_matrix": self._reconstruct_expression_tree(model_data["mass_matrix"]),
-            "mass_matrix_inv": self._reconstruct_expression_tree(
-                model_data["mass_matrix_inv"]
-            ),
+            "events": [reconstruct(event) for event in model_data["events"]],
+            "mass_matrix": reconstruct(model_data["mass_matrix"]),
+            "mass_matrix_inv": reconstruct(model_data["mass_matrix_inv"]),
         }
 
         recon_model_dict["geometry"] = (
@@ -214,10 +304,7 @@ class Serialise:
         )
 
         recon_model_dict["variables"] = (
-            {
-                k: self._reconstruct_expression_tree(v)
-                for k, v in model_data["variables"].items()
-            }
+            {k: reconstruct(v) for k, v in model_data["variables"].items()}
             if "variables" in model_data.keys()
             else None
         )
@@ -327,6 +414,46 @@ class Serialise:
 
         return obj
 
+    def _reconstruct_symbol_table(self, nodes: list, arrays):
+        """
+        Create the pybamm Symbol and Event classes of a table of nodes, written by
+        `_SymbolTable`.
+
+        Parameters
+        ----------
+        nodes: list
+            The nodes, in which children are referred to by their position in the
+            list. Children always come before their parents.
+        arrays: mapping
+            The entries of arrays, referred to by the nodes
+
+        Returns
+        -------
+        list
+            The pybamm object of each node
+        """
+
+        def get_array(ref):
+            return arrays[ref["py/array"]]
+
+        objs = []
+        for node in nodes:
+            if "children" in node:
+                node["children"] = [objs[i] for i in node["children"]]
+            if "initial_condition" in node:
+                node["initial_condition"] = objs[node["initial_condition"]]
+            if "expression" in node:
+                node["expression"] = objs[node["expression"]]
+            entries = node.get("entries")
+            if isinstance(entries, dict):
+                if "py/array" in entries:
+                    node["entries"] = get_array(entries)
+                else:
+                    for key in ["data", "row_indices", "column_pointers"]:
+                        entries[key] = get_array(entries[key])
+            objs.append(self._reconstruct_symbol(node))
+        return objs
+
     def _reconstruct_mesh(self, node: dict):
         """Reconstructs a Mesh object"""
         if "sub_meshes" in node:
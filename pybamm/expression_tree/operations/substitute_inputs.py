@@ -0,0 +1,157 @@
+#
+# Substitute values for the input parameters of an expression tree
+#
+import numbers
+
+import numpy as np
+
+import pybamm
+
+
+class InputSubstitution(object):
+    """
+    Helper class to replace the input parameters of an expression tree, e.g. of a
+    discretised model, by their values, so that the values become part of the
+    tree (as if they had been set by :class:`pybamm.ParameterValues`) without
+    processing the model again.
+
+    Only the nodes that depend on the substituted inputs are rebuilt, and the new
+    nodes are simplified in the same way as when they were first created. The other
+    nodes are shared with the original tree.
+
+    Parameters
+    ----------
+    inputs : dict
+        The values of the input parameters to substitute, with the names of the
+        input parameters as keys. Input parameters with other names are left as
+        they are.
+    """
+
+    def __init__(self, inputs):
+        self.inputs = inputs
+        self._substituted_symbols = {}
+
+    def process_model(self, model):
+        """
+        Substitute the inputs in all the expressions of a discretised model.
+
+        Parameters
+        ----------
+        model : :class:`pybamm.BaseModel`
+            The model in which to substitute the inputs. Not modified.
+
+        Returns
+        -------
+        :class:`pybamm.BaseModel`
+            A copy of the model, with the inputs substituted. Functions generated
+            from the expressions of the original model (e.g. by a solver) are not
+            copied.
+        """
+        new_model = model.new_copy()
+        new_model.rhs = {
+            variable: self.process_symbol(rhs) for variable, rhs in model.rhs.items()
+        }
+        new_model.algebraic = {
+            variable: self.process_symbol(algebraic)
+            for variable, algebraic in model.algebraic.items()
+        }
+        new_model.initial_conditions = {
+            variable: self.process_symbol(initial_condition)
+            for variable, initial_condition in model.initial_conditions.items()
+        }
+        new_model.boundary_conditions = {
+            variable: {
+                side: (self.process_symbol(bc), bc_type)
+                for side, (bc, bc_type) in bcs.items()
+            }
+            for variable, bcs in model.boundary_conditions.items()
+        }
+        new_model.variables = {
+            name: self.process_symbol(variable)
+            for name, variable in model.variables.items()
+        }
+        new_model.events = [
+            pybamm.Event(
+                event.name, self.process_symbol(event.expression), event.event_type
+            )
+            for event in model.events
+        ]
+        for attribute in [
+            "concatenated_rhs",
+            "concatenated_algebraic",
+            "concatenated_initial_conditions",
+        ]:
+            symbol = getattr(model, attribute)
+            if symbol is not None:
+                setattr(new_model, attribute, self.process_symbol(symbol))
+
+        # Reset the attributes that are calculated from the expressions
+        new_model._parameters = None
+        new_model._input_parameters = None
+        new_model._variables_casadi = {}
+        new_model.__dict__.pop("_variables_and_events", None)
+        return new_model
+
+    def process_symbol(self, symbol):
+        """
+        Substitute the inputs in a symbol. If the symbol has already been processed,
+        the stored result is returned.
+
+        Parameters
+        ----------
+        symbol : :class:`pybamm.Symbol`
+            The symbol in which to substitute the inputs
+
+        Returns
+        -------
+        :class:`pybamm.Symbol`
+            The symbol with the inputs substituted, or `symbol` itself if it does
+            not depend on any of the inputs
+        """
+        try:
+            return self._substituted_symbols[symbol]
+        except KeyError:
+            substituted = self._process_symbol(symbol)
+            if substituted is not symbol:
+                # Keep the meshes assigned to discretised symbols
+                for attribute in ["mesh", "secondary_mesh"]:
+                    if hasattr(symbol, attribute):
+                        setattr(substituted, attribute, getattr(symbol, attribute))
+            self._substituted_symbols[symbol] = substituted
+            return substituted
+
+    def _process_symbol(self, symbol):
+        """See :meth:`InputSubstitution.process_symbol()`."""
+        if isinstance(symbol, pybamm.InputParameter):
+            if symbol.name not in self.inputs:
+                return symbol
+            value = self.inputs[symbol.name]
+            if isinstance(value, numbers.Number):
+                new_symbol = pybamm.Scalar(value, name=symbol.name)
+            else:
+                new_symbol = pybamm.Vector(
+                    np.reshape(value, (-1, 1)), name=symbol.name
+                )
+            new_symbol.copy_domains(symbol)
+            return new_symbol
+
+        children = symbol.children
+        new_children = [self.process_symbol(child) for child in children]
+        if all(new is old for new, old in zip(new_children, children)):
+            # Nothing to substitute: keep the original symbol
+            return symbol
+
+        if isinstance(symbol, pybamm.BinaryOperator):
+            new_symbol = symbol._binary_new_copy(*new_children)
+        elif isinstance(symbol, pybamm.UnaryOperator):
+            new_symbol = symbol._unary_new_copy(*new_children)
+        elif isinstance(symbol, pybamm.Function):
+            return symbol._function_new_copy(new_children)
+        elif isinstance(symbol, pybamm.Concatenation):
+            return symbol._concatenation_new_copy(new_children)
+        else:
+            raise NotImplementedError(
+                "Cannot substitute inputs in symbol of type '{}'".format(type(symbol))
+            )
+        new_symbol.copy_domains(symbol)
+        return new_symbol
@@ -166,6 +166,10 @@ class FunctionParameter(pybamm.Symbol):
             (self.__class__, self.name, self.diff_variable, *tuple([child.id for child in self.children]), *tuple(self.domain))
         )
 
+    def _digest_data(self):
+        """See :meth:`pybamm.Symbol._digest_data`"""
+        return (self.diff_variable,)
+
     def diff(self, variable):
         """See :meth:`pybamm.Symbol.diff()`."""
         # return a new FunctionParameter, that knows it will need to be differentiated
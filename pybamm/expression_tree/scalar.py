@@ -59,6 +59,10 @@ class Scalar(pybamm.Symbol):
         # indistinguishable by class and name alone
         self._id = hash((self.__class__, str(self.value)))
 
+    def _digest_data(self):
+        """See :meth:`pybamm.Symbol._digest_data()`."""
+        return (self.value,)
+
     def _base_evaluate(self, t=None, y=None, y_dot=None, inputs=None):
         """See :meth:`pybamm.Symbol._base_evaluate()`."""
         return self._value
@@ -125,6 +125,10 @@ class StateVectorBase(pybamm.Symbol):
             (self.__class__, self.name, tuple(self.evaluation_array), *tuple(self.domain))
         )
 
+    def _digest_data(self):
+        """See :meth:`pybamm.Symbol._digest_data()`"""
+        return (self.y_slices, len(self.evaluation_array))
+
     def _jac_diff_vector(self, variable):
         """
         Differentiate a slice of a StateVector of size m with respect to another slice
@@ -1,6 +1,7 @@
 #
 # Base Symbol Class for the expression tree
 #
+import hashlib
 import numbers
 
 import numpy as np
@@ -51,6 +52,46 @@ def create_object_of_size(size, typ="vector"):
         return np.nan * np.ones((size, size))
 
 
+def update_digest(h, value):
+    """
+    Update a hash object with a representation of `value` that is stable between
+    processes, unlike the builtin `hash` which is salted per process. Used to
+    compute :meth:`Symbol.digest`.
+    """
+    if value is None or isinstance(value, (bool, str, numbers.Number)):
+        h.update(f"{type(value).__name__}:{value!r};".encode())
+    elif isinstance(value, Symbol):
+        h.update(value.digest)
+    elif isinstance(value, np.ndarray):
+        h.update(f"ndarray:{value.dtype}:{value.shape};".encode())
+        h.update(np.ascontiguousarray(value).tobytes())
+    elif issparse(value):
+        value = value.tocsr()
+        update_digest(h, (value.shape, value.data, value.indices, value.indptr))
+    elif isinstance(value, slice):
+        update_digest(h, ("slice", value.start, value.stop, value.step))
+    elif isinstance(value, dict):
+        # Sort the items by the digests of their keys, which (unlike the order of
+        # insertion or the repr of a symbol) do not depend on how the dict was built
+        items = []
+        for k, v in value.items():
+            h_key = hashlib.blake2b(digest_size=20)
+            update_digest(h_key, k)
+            items.append((h_key.digest(), v))
+        h.update(b"dict{")
+        for k, v in sorted(items, key=lambda item: item[0]):
+            h.update(k)
+            update_digest(h, v)
+        h.update(b"}")
+    elif isinstance(value, (list, tuple)):
+        h.update(f"{type(value).__name__}[".encode())
+        for v in value:
+            update_digest(h, v)
+        h.update(b"]")
+    else:
+        raise TypeError(f"Cannot compute a digest of type {type(value)}")
+
+
 def evaluate_for_shape_using_domain(domains, typ="vector"):
     """
     Return a vector of the appropriate shape, based on the domains.
@@ -426,6 +467,46 @@ class Symbol:
             (self.__class__, self.name, *tuple([child.id for child in self.children]), *tuple([(k, tuple(v)) for k, v in self.domains.items() if v != []]))
         )
 
+    @property
+    def digest(self):
+        """
+        A deterministic structural digest (BLAKE2) of the expression tree with this
+        node as its root, as bytes.
+
+        Unlike :meth:`id`, which uses Python's builtin `hash` and is salted per
+        process, the digest is the same in every process, so it can be used as a key
+        for caches that are stored on disk or shared between workers. Two symbols
+        with equal ids have equal digests.
+
+        The digest of a node is computed from its class, name, domains, any data
+        returned by :meth:`_digest_data` and the digests of its children, and is
+        cached until the id of the node changes.
+        """
+        cached = getattr(self, "_cached_digest", None)
+        if cached is not None and cached[0] == self._id:
+            return cached[1]
+
+        h = hashlib.blake2b(digest_size=20)
+        cls = self.__class__
+        update_digest(h, f"{cls.__module__}.{cls.__qualname__}")
+        update_digest(h, self.name)
+        update_digest(h, {k: v for k, v in self.domains.items() if v != []})
+        update_digest(h, self._digest_data())
+        for child in self.children:
+            h.update(child.digest)
+        digest = h.digest()
+
+        self._cached_digest = (self._id, digest)
+        return digest
+
+    def _digest_data(self):
+        """
+        Data that identifies this node in addition to its class, name, domains and
+        children (e.g. the entries of an array), used to compute :meth:`digest`.
+        Subclasses that include extra data in :meth:`set_id` should override this.
+        """
+        return ()
+
     @property
     def scale(self):
         return self._scale
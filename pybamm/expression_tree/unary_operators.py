@@ -328,6 +328,10 @@ class Index(UnaryOperator):
             (self.__class__, self.name, self.slice.start, self.slice.stop, self.children[0].id, *tuple(self.domain))
         )
 
+    def _digest_data(self):
+        """See :meth:`pybamm.Symbol._digest_data()`"""
+        return (self.slice,)
+
     def _unary_evaluate(self, child):
         """See :meth:`UnaryOperator._unary_evaluate()`."""
         return child[self.slice]
@@ -619,6 +623,10 @@ class Integral(SpatialOperator):
             (self.__class__, self.name, *tuple([integration_variable.id for integration_variable in self.integration_variable]), self.children[0].id, *tuple(self.domain))
         )
 
+    def _digest_data(self):
+        """See :meth:`pybamm.Symbol._digest_data()`"""
+        return (self.integration_variable,)
+
     def _unary_new_copy(self, child):
         """See :meth:`UnaryOperator._unary_new_copy()`."""
 
@@ -760,6 +768,10 @@ class DefiniteIntegralVector(SpatialOperator):
             (self.__class__, self.name, self.vector_type, self.children[0].id, *tuple(self.domain))
         )
 
+    def _digest_data(self):
+        """See :meth:`pybamm.Symbol._digest_data()`"""
+        return (self.vector_type,)
+
     def _unary_new_copy(self, child):
         """See :meth:`UnaryOperator._unary_new_copy()`."""
 
@@ -813,6 +825,10 @@ class BoundaryIntegral(SpatialOperator):
             (self.__class__, self.name, self.children[0].id, *tuple(self.domain))
         )
 
+    def _digest_data(self):
+        """See :meth:`pybamm.Symbol._digest_data()`"""
+        return (self.region,)
+
     def _unary_new_copy(self, child):
         """See :meth:`UnaryOperator._unary_new_copy()`."""
 
@@ -854,6 +870,10 @@ class DeltaFunction(SpatialOperator):
             (self.__class__, self.name, self.side, self.children[0].id, *tuple([(k, tuple(v)) for k, v in self.domains.items()]))
         )
 
+    def _digest_data(self):
+        """See :meth:`pybamm.Symbol._digest_data()`"""
+        return (self.side,)
+
     def _evaluates_on_edges(self, dimension):
         """See :meth:`pybamm.Symbol._evaluates_on_edges()`."""
         return False
@@ -912,6 +932,10 @@ class BoundaryOperator(SpatialOperator):
             (self.__class__, self.name, self.side, self.children[0].id, *tuple([(k, tuple(v)) for k, v in self.domains.items()]))
         )
 
+    def _digest_data(self):
+        """See :meth:`pybamm.Symbol._digest_data()`"""
+        return (self.side,)
+
     def _unary_new_copy(self, child):
         """See :meth:`UnaryOperator._unary_new_copy()`."""
         return self.__class__(child, self.side)
@@ -106,6 +106,10 @@ class VariableBase(pybamm.Symbol):
             (self.__class__, self.name, self.scale, self.reference, *tuple([(k, tuple(v)) for k, v in self.domains.items() if v != []]))
         )
 
+    def _digest_data(self):
+        """See :meth:`pybamm.Symbol._digest_data()`"""
+        return (self.scale, self.reference)
+
     def create_copy(self):
         """See :meth:`pybamm.Symbol.new_copy()`."""
         return self.__class__(
@@ -0,0 +1,398 @@
+#
+# On-disk cache for built models
+#
+import functools
+import hashlib
+import numbers
+import os
+import pickle
+import tempfile
+import types
+
+import numpy as np
+from scipy.sparse import issparse
+
+import pybamm
+
+# Solver attributes that hold state from previous solves rather than settings
+_SOLVER_STATE_ATTRIBUTES = (
+    "_model_set_up",
+    "_pool",
+    "_setup",
+    "computed_",
+    "integrator",
+    "y_sols",
+)
+
+
+class ModelCache:
+    """
+    An on-disk cache of built (parameterised and discretised) models, shared between
+    processes.
+
+    Entries are keyed by a hash of the model options and equations (see
+    :meth:`pybamm.Symbol.digest`), parameter values, mesh, spatial methods and
+    PyBaMM settings, so that a :class:`pybamm.Simulation` with the same set-up can
+    load a model that is ready to solve instead of processing the parameters and
+    discretising the model again. Once a model has been set up by a solver, the
+    entry is updated with the generated CasADi functions, which can then be reused
+    by any solver with the same settings.
+
+    Parameters
+    ----------
+    directory : str
+        The directory in which to store the cache. Created if it does not exist.
+    """
+
+    def __init__(self, directory):
+        self.directory = os.path.abspath(directory)
+        os.makedirs(self.directory, exist_ok=True)
+
+    def key(
+        self,
+        model,
+        parameter_values,
+        geometry,
+        submesh_types,
+        var_pts,
+        spatial_methods,
+    ):
+        """
+        Return the cache key for building a model with the given set-up.
+
+        Parameters
+        ----------
+        model : :class:`pybamm.BaseModel`
+            The unprocessed model
+        parameter_values : :class:`pybamm.ParameterValues`
+            The parameter values used to process the model
+        geometry : :class:`pybamm.Geometry`
+            The geometry, with parameters already processed
+        submesh_types : dict
+            The types of submesh to use on each subdomain
+        var_pts : dict
+            The number of points used by each spatial variable
+        spatial_methods : dict
+            The spatial method to use on each domain
+
+        Returns
+        -------
+        str or None
+            A hexadecimal digest that is identical between processes for the same
+            set-up, or None if part of the set-up cannot be hashed deterministically
+            (in which case the model must not be cached)
+        """
+        try:
+            return self._key(
+                model,
+                parameter_values,
+                geometry,
+                submesh_types,
+                var_pts,
+                spatial_methods,
+            )
+        except _UnhashableError as e:
+            pybamm.logger.info(f"Not using the model cache: {e}")
+            return None
+
+    def _key(
+        self,
+        model,
+        parameter_values,
+        geometry,
+        submesh_types,
+        var_pts,
+        spatial_methods,
+    ):
+        h = hashlib.sha256()
+        _update_hash(h, pybamm.__version__)
+        _update_hash(h, _class_path(model.__class__))
+        _update_hash(h, model.name)
+        _update_hash(h, dict(model.options or {}))
+        _update_hash(h, model.convert_to_format)
+        _update_hash(h, model.jacobian_method)
+        h.update(_model_digest(model))
+        _update_hash(h, dict(parameter_values.items()))
+        _update_hash(h, dict(geometry))
+        _update_hash(h, submesh_types)
+        _update_hash(h, var_pts)
+        _update_hash(h, spatial_methods)
+        _update_hash(h, _settings_state())
+        return h.hexdigest()
+
+    @staticmethod
+    def solver_key(solver, inputs=None, calculate_sensitivities=None):
+        """
+        Return a key identifying the settings of a solver, and the inputs it is
+        set up for. A model that has been set up by one solver can be reused by
+        another solver with the same key.
+
+        Parameters
+        ----------
+        solver : :class:`pybamm.BaseSolver`
+            The solver
+        inputs : dict, optional
+            The input parameters passed to the solver
+        calculate_sensitivities : list of str, optional
+            The input parameters for which sensitivities are calculated
+
+        Returns
+        -------
+        str or None
+            A hexadecimal digest, or None if the settings of the solver cannot be
+            hashed deterministically
+        """
+        h = hashlib.sha256()
+        try:
+            _update_solver_hash(h, solver)
+        except _UnhashableError:
+            return None
+        inputs = inputs or {}
+        _update_hash(
+            h, {name: np.shape(value) for name, value in sorted(inputs.items())}
+        )
+        _update_hash(h, sorted(calculate_sensitivities or []))
+        return h.hexdigest()
+
+    @staticmethod
+    def parameter_values_key(parameter_values):
+        """
+        Return a key identifying the values of some parameters, e.g. to check
+        whether objects that depend on the parameter values can be reused.
+
+        Parameters
+        ----------
+        parameter_values : :class:`pybamm.ParameterValues`
+            The parameter values
+
+        Returns
+        -------
+        str or None
+            A hexadecimal digest, or None if some of the values cannot be hashed
+            deterministically
+        """
+        h = hashlib.sha256()
+        try:
+            _update_hash(h, dict(parameter_values.items()))
+        except _UnhashableError:
+            return None
+        return h.hexdigest()
+
+    def _path(self, key):
+        return os.path.join(self.directory, key + ".pkl")
+
+    def __contains__(self, key):
+        return os.path.isfile(self._path(key))
+
+    def load(self, key):
+        """
+        Load the entry stored under a key.
+
+        Parameters
+        ----------
+        key : str
+            The key, as returned by :meth:`key`
+
+        Returns
+        -------
+        dict or None
+            The entry, or None if the key is not in the cache or the entry cannot
+            be read
+        """
+        try:
+            with open(self._path(key), "rb") as f:
+                return pickle.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            pybamm.logger.warning(f"Could not load model cache entry {key}: {e}")
+            return None
+
+    def save(self, key, entry):
+        """
+        Store an entry under a key. The entry is written to a temporary file which
+        is then moved into place, so that concurrent readers in other processes
+        never see a partially written entry.
+
+        Parameters
+        ----------
+        key : str
+            The key, as returned by :meth:`key`
+        entry : dict
+            The objects to store. Must be picklable.
+        """
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump(entry, f, pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, self._path(key))
+        except BaseException:
+            os.remove(tmp_path)
+            raise
+
+    def clear(self):
+        """Remove all entries from the cache"""
+        for filename in os.listdir(self.directory):
+            if filename.endswith(".pkl"):
+                os.remove(os.path.join(self.directory, filename))
+
+
+class _UnhashableError(Exception):
+    """A value cannot be hashed deterministically"""
+
+
+def _class_path(cls):
+    return f"{cls.__module__}.{cls.__qualname__}"
+
+
+def _settings_state():
+    settings = pybamm.settings
+    return {
+        "simplify": settings.simplify,
+        "min_smoothing": settings.min_smoothing,
+        "max_smoothing": settings.max_smoothing,
+        "heaviside_smoothing": settings.heaviside_smoothing,
+        "abs_smoothing": settings.abs_smoothing,
+        "tolerances": settings.tolerances,
+    }
+
+
+def _update_code_hash(h, code):
+    h.update(code.co_code)
+    _update_hash(h, code.co_names)
+    _update_hash(h, code.co_varnames)
+    for const in code.co_consts:
+        if isinstance(const, types.CodeType):
+            _update_code_hash(h, const)
+        else:
+            _update_hash(h, const)
+
+
+def _global_names(code):
+    """Names that a code object (or the code objects nested in it) may look up"""
+    names = set(code.co_names)
+    for const in code.co_consts:
+        if isinstance(const, types.CodeType):
+            names |= _global_names(const)
+    return names
+
+
+def _update_function_hash(h, function, seen):
+    """
+    Hash a function by its code and by everything its result can depend on: the
+    values of its default arguments, closure cells and the globals it refers to
+    """
+    h.update(f"function:{function.__module__}.{function.__qualname__}".encode())
+    if id(function) in seen:
+        # recursive reference, e.g. a function that calls itself
+        h.update(b";")
+        return
+    seen = seen | {id(function)}
+    h.update(b"(")
+    _update_code_hash(h, function.__code__)
+    _update_hash(h, function.__defaults__, seen)
+    _update_hash(h, function.__kwdefaults__, seen)
+    for cell in function.__closure__ or ():
+        try:
+            contents = cell.cell_contents
+        except ValueError:
+            h.update(b"empty cell;")
+        else:
+            _update_hash(h, contents, seen)
+    function_globals = function.__globals__
+    for name in sorted(_global_names(function.__code__)):
+        if name in function_globals:
+            _update_hash(h, name)
+            _update_hash(h, function_globals[name], seen)
+    h.update(b")")
+
+
+def _model_digest(model):
+    """Digest of the equations, variables and events of a model"""
+    h = hashlib.blake2b(digest_size=20)
+    pybamm.update_digest(
+        h,
+        (
+            model.rhs,
+            model.algebraic,
+            model.initial_conditions,
+            model.boundary_conditions,
+            dict(model.variables),
+            [
+                (event.name, event.expression, event.event_type.name)
+                for event in model.events
+            ],
+        ),
+    )
+    return h.digest()
+
+
+def _update_solver_hash(h, solver, seen=frozenset()):
+    _update_hash(h, _class_path(solver.__class__))
+    for name, value in sorted(vars(solver).items()):
+        if name.startswith(_SOLVER_STATE_ATTRIBUTES):
+            continue
+        _update_hash(h, name)
+        _update_hash(h, value, seen)
+
+
+def _update_hash(h, value, seen=frozenset()):
+    """
+    Update a hash object with a representation of `value` that is stable between
+    processes (unlike the builtin `hash`, which is salted per process). Raises an
+    `_UnhashableError` if this is not possible. `seen` holds the ids of the
+    functions being hashed, to stop at recursive references.
+    """
+    if value is None or isinstance(value, (bool, str, numbers.Number)):
+        h.update(f"{type(value).__name__}:{value!r};".encode())
+    elif isinstance(value, np.ndarray):
+        h.update(f"ndarray:{value.dtype}:{value.shape};".encode())
+        h.update(np.ascontiguousarray(value).tobytes())
+    elif issparse(value):
+        value = value.tocsr()
+        _update_hash(h, (value.shape, value.data, value.indices, value.indptr))
+    elif isinstance(value, dict):
+        h.update(b"dict{")
+        # Symbol keys (e.g. spatial variables in var_pts) are identified by name
+        items = [
+            (k.name if isinstance(k, pybamm.Symbol) else k, v)
+            for k, v in value.items()
+        ]
+        for k, v in sorted(items, key=lambda item: repr(item[0])):
+            _update_hash(h, k, seen)
+            _update_hash(h, v, seen)
+        h.update(b"}")
+    elif isinstance(value, (list, tuple)):
+        h.update(f"{type(value).__name__}[".encode())
+        for v in value:
+            _update_hash(h, v, seen)
+        h.update(b"]")
+    elif isinstance(value, type):
+        h.update(f"class:{_class_path(value)};".encode())
+    elif isinstance(value, types.FunctionType):
+        _update_function_hash(h, value, seen)
+    elif isinstance(value, types.MethodType):
+        h.update(b"method(")
+        _update_hash(h, (value.__func__, value.__self__), seen)
+        h.update(b")")
+    elif isinstance(value, (types.BuiltinFunctionType, np.ufunc)):
+        module = getattr(value, "__module__", None)
+        h.update(f"builtin:{module}.{value.__name__};".encode())
+    elif isinstance(value, types.ModuleType):
+        h.update(f"module:{value.__name__};".encode())
+    elif isinstance(value, functools.partial):
+        h.update(b"partial(")
+        _update_hash(h, (value.func, value.args, value.keywords), seen)
+        h.update(b")")
+    elif isinstance(value, pybamm.Symbol):
+        h.update(value.digest)
+    elif isinstance(value, pybamm.MeshGenerator):
+        _update_hash(h, (value.submesh_type, value.submesh_params))
+    elif isinstance(value, pybamm.SpatialMethod):
+        _update_hash(h, (value.__class__, value.options))
+    elif isinstance(value, pybamm.BaseSolver):
+        _update_solver_hash(h, value, seen)
+    else:
+        raise _UnhashableError(
+            f"cannot hash object of class {_class_path(value.__class__)}"
+        )
@@ -77,6 +77,19 @@ class BaseModel:
         solver set up.
     use_jacobian : bool
         Whether to use the Jacobian when solving the model (default is True).
+    jacobian_method : str
+        How the Jacobian is calculated for models converted to python format (the
+        CasADi and JAX formats use their own automatic differentiation):
+
+        - "symbolic": differentiate the expression tree (see \
+        :class:`pybamm.Jacobian`) and convert the Jacobian to python code.
+        - "finite difference": calculate the sparsity pattern of the Jacobian \
+        (see :class:`pybamm.JacobianSparsity`), which is cached for each \
+        discretised model structure, and evaluate the Jacobian by coloured \
+        finite differences (see :class:`pybamm.FiniteDifferenceJacobian`). \
+        This avoids the set-up cost of symbolic differentiation for large models.
+
+        Default is "symbolic".
     convert_to_format : str
         Whether to convert the expression trees representing the rhs and
         algebraic equations, Jacobain (if using) and events into a different format:
@@ -119,6 +132,7 @@ class BaseModel:
 
         # Default behaviour is to use the jacobian
         self.use_jacobian = True
+        self.jacobian_method = "symbolic"
         self.convert_to_format = "casadi"
 
         # Model is not initially discretised
@@ -1196,7 +1210,7 @@ class BaseModel:
 
         return disc_symbol
 
-    def save_model(self, filename=None, mesh=None, variables=None):
+    def save_model(self, filename=None, mesh=None, variables=None, binary=False):
         """
         Write out a discretised model to a JSON file
 
@@ -1205,6 +1219,8 @@ class BaseModel:
         filename: str, optional
         The desired name of the JSON file. If no name is provided, one will be created
         based on the model name, and the current datetime.
+        binary: bool, optional
+        Whether to write a binary `.npz` file instead of a JSON file. Default is False.
         """
         if variables and not mesh:
             warnings.warn(
@@ -1215,17 +1231,19 @@ class BaseModel:
                 pybamm.ModelWarning,
             )
 
-        Serialise().save_model(self, filename=filename, mesh=mesh, variables=variables)
+        Serialise().save_model(
+            self, filename=filename, mesh=mesh, variables=variables, binary=binary
+        )
 
 
 def load_model(filename, battery_model: BaseModel = None):
     """
-    Load in a saved model from a JSON file
+    Load in a saved model from a JSON or binary (`.npz`) file
 
     Parameters
     ----------
     filename: str
-        Path to the JSON file containing the serialised model file
+        Path to the file containing the serialised model
     battery_model: :class: pybamm.BaseBatteryModel, optional
             PyBaMM model to be created (e.g. pybamm.lithium_ion.SPM), which will
             override any model names within the file. If None, the function will look
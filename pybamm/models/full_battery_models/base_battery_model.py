@@ -1466,7 +1466,7 @@ class BaseBatteryModel(pybamm.BaseModel):
         """
         pass
 
-    def save_model(self, filename=None, mesh=None, variables=None):
+    def save_model(self, filename=None, mesh=None, variables=None, binary=False):
         """
         Write out a discretised model to a JSON file
 
@@ -1475,10 +1475,14 @@ class BaseBatteryModel(pybamm.BaseModel):
         filename: str, optional
         The desired name of the JSON file. If no name is provided, one will be created
         based on the model name, and the current datetime.
+        binary: bool, optional
+        Whether to write a binary `.npz` file instead of a JSON file. Default is False.
         """
         if variables and not mesh:
             raise ValueError(
                 "Serialisation: Please provide the mesh if variables are required"
             )
 
-        Serialise().save_model(self, filename=filename, mesh=mesh, variables=variables)
+        Serialise().save_model(
+            self, filename=filename, mesh=mesh, variables=variables, binary=binary
+        )
@@ -2,8 +2,10 @@
 # A model to calculate electrode-specific SOH
 #
 import pybamm
+import casadi
 import numpy as np
 from functools import lru_cache
+from scipy.optimize import brentq
 import warnings
 
 
@@ -286,7 +288,13 @@ class ElectrodeSOHSolver:
         known_value="cyclable lithium capacity",
         options=None,
     ):
-        self.parameter_values = parameter_values
+        # The solver caches solutions and tables that depend on the parameter
+        # values, so it keeps its own copy of them
+        self.parameter_values = parameter_values.copy()
+        # Parameter values that cannot be hashed do not match any others
+        self._parameter_values_key = (
+            pybamm.ModelCache.parameter_values_key(parameter_values) or object()
+        )
         self.param = param or pybamm.LithiumIonParameters(options)
         self.known_value = known_value
         self.options = options or pybamm.BatteryModelOptions({})
@@ -299,6 +307,40 @@ class ElectrodeSOHSolver:
         self._get_electrode_soh_sims_split = lru_cache()(
             self.__get_electrode_soh_sims_split
         )
+        self._get_batch_functions = lru_cache()(self.__get_batch_functions)
+        self._get_ocp_functions = lru_cache()(self.__get_ocp_functions)
+        self._get_ocp_tables = lru_cache()(self.__get_ocp_tables)
+        self._get_soc_ocv_table = lru_cache()(self.__get_soc_ocv_table)
+        self._solve_initial_values = lru_cache()(self.__solve_initial_values)
+        self._get_voltage_limits = lru_cache()(self.__get_voltage_limits)
+        self._get_initial_temperature = lru_cache()(self.__get_initial_temperature)
+        # States of the last solution, from which the next solve is started
+        self._last_states = None
+
+    def _set_up_mismatch(
+        self,
+        parameter_values,
+        param=None,
+        known_value="cyclable lithium capacity",
+        options=None,
+    ):
+        """
+        Check whether the solver was set up with the given parameter values, symbolic
+        parameters (if given), known value and options. Returns the name of the first
+        argument that differs, or None if they all match.
+        """
+        parameter_values_key = pybamm.ModelCache.parameter_values_key(parameter_values)
+        if parameter_values_key != self._parameter_values_key:
+            return "parameter values"
+        if param is not None and param is not self.param:
+            return "param"
+        if known_value != self.known_value:
+            return "known_value"
+        if pybamm.BatteryModelOptions(options or {}) != pybamm.BatteryModelOptions(
+            self.options
+        ):
+            return "options"
+        return None
 
     def _get_lims_ocp(self):
         parameter_values = self.parameter_values
@@ -392,20 +434,84 @@ class ElectrodeSOHSolver:
                 "parameter is now used automatically.",
                 DeprecationWarning,
             )
-        ics = self._set_up_solve(inputs)
-        try:
-            sol = self._solve_full(inputs, ics)
-        except pybamm.SolverError:
-            # just in case solving one by one works better
+        # Start from the last solution (e.g. the previous cycle of an experiment) or
+        # from the OCP tables, and only set up a simulation if that does not converge
+        sol_dict = self._solve_warm_started(inputs)
+        if sol_dict is None:
+            ics = self._set_up_solve(inputs)
             try:
-                sol = self._solve_split(inputs, ics)
-            except pybamm.SolverError as split_error:
-                # check if the error is due to the simulation not being feasible
-                self._check_esoh_feasible(inputs)
-                # if that didn't raise an error, raise the original error instead
-                raise split_error
+                sol = self._solve_full(inputs, ics)
+            except pybamm.SolverError:
+                # just in case solving one by one works better
+                try:
+                    sol = self._solve_split(inputs, ics)
+                except pybamm.SolverError as split_error:
+                    # check if the error is due to the simulation not being feasible
+                    self._check_esoh_feasible(inputs)
+                    # if that didn't raise an error, raise the original error instead
+                    raise split_error
+
+            sol_dict = {
+                key: sol[key].data[0] for key in sol.all_models[0].variables.keys()
+            }
+        state_names = self._get_batch_functions()[0]
+        self._last_states = [sol_dict[name] for name in state_names]
+
+        # Calculate theoretical energy
+        # TODO: energy calc for MSMR
+        if self.options["open-circuit potential"] != "MSMR":
+            energy = self.theoretical_energy_integral(sol_dict)
+            sol_dict.update({"Maximum theoretical energy [W.h]": energy})
+        return sol_dict
+
+    def solve_batch(self, inputs, tol=1e-6):
+        """
+        Solve the electrode SOH model for a batch of inputs, e.g. the capacities at
+        the end of each cycle of an experiment. All the inputs are solved together,
+        by a single CasADi Newton rootfinder mapped over the batch and started from
+        the solution for the first inputs. Inputs for which the batched solve does not
+        converge are solved one by one with :meth:`solve`.
+
+        Parameters
+        ----------
+        inputs : dict
+            Arrays of inputs, with the same keys as the inputs of :meth:`solve`
+            (e.g. "Q_n", "Q_p" and "Q_Li"). All the arrays must have the same length.
+        tol : float, optional
+            The tolerance on the residuals of the batched solve. Default is 1e-6.
+
+        Returns
+        -------
+        dict
+            Arrays of the electrode SOH variables for each set of inputs
+        """
+        inputs = {
+            name: np.asarray(value, dtype=float).flatten()
+            for name, value in inputs.items()
+        }
+        n = len(next(iter(inputs.values())))
+        if any(len(value) != n for value in inputs.values()):
+            raise ValueError("All the inputs must have the same length")
 
-        sol_dict = {key: sol[key].data[0] for key in sol.all_models[0].variables.keys()}
+        # Solve the first inputs one by one, which also gives the initial guess
+        first_sol = self.solve({name: value[0] for name, value in inputs.items()})
+
+        state_names, input_names, names, roots, residuals, evaluate = (
+            self._get_batch_functions()
+        )
+        y0 = np.tile([[first_sol[name]] for name in state_names], n)
+        p = np.vstack([inputs[name] for name in input_names])
+        y = roots.map(n)(y0, p)
+        residual = np.array(residuals.map(n)(y, p))
+        values = np.array(evaluate.map(n)(y, p))
+
+        # Fall back to solving one by one if the batched solve did not converge
+        failed = np.where(~np.all(np.abs(residual) < tol, axis=0))[0]
+        sol_dict = {name: values[i] for i, name in enumerate(names)}
+        for j in failed:
+            sol = self.solve({name: value[j] for name, value in inputs.items()})
+            for name in names:
+                sol_dict[name][j] = sol[name]
 
         # Calculate theoretical energy
         # TODO: energy calc for MSMR
@@ -414,6 +520,185 @@ class ElectrodeSOHSolver:
             sol_dict.update({"Maximum theoretical energy [W.h]": energy})
         return sol_dict
 
+    def _solve_warm_started(self, inputs, tol=1e-6):
+        """
+        Solve the full electrode SOH model with a Newton rootfinder, starting from
+        the states of the last solution or, for the first solve, from an initial
+        guess found with the OCP tables. Returns None if there is no initial guess or
+        the rootfinder does not converge to stoichiometries within the limits of the
+        OCPs.
+        """
+        state_names, input_names, names, roots, residuals, evaluate = (
+            self._get_batch_functions()
+        )
+        if sorted(inputs.keys()) != input_names:
+            return None
+        y0 = self._last_states
+        if y0 is None:
+            y0 = self._get_initial_guess_from_tables(inputs, state_names)
+            if y0 is None:
+                return None
+
+        p = [inputs[name] for name in input_names]
+        y = roots(y0, p)
+        residual = np.array(residuals(y, p))
+        if not np.all(np.abs(residual) < tol):
+            return None
+        values = np.array(evaluate(y, p)).flatten()
+        sol_dict = {name: values[i] for i, name in enumerate(names)}
+        # Reject stoichiometries outside the limits of the OCPs
+        x0_min, x100_max, y100_min, y0_max = self.lims_ocp
+        if not (
+            x0_min <= sol_dict["x_0"] < sol_dict["x_100"] <= x100_max
+            and y100_min <= sol_dict["y_100"] < sol_dict["y_0"] <= y0_max
+        ):
+            return None
+        return sol_dict
+
+    def _get_initial_guess_from_tables(self, inputs, state_names):
+        """
+        Initial guess for the states of the full electrode SOH model, from the roots
+        of the equations for x_100 and x_0 with the tabulated OCPs. Only available if
+        the cyclable lithium capacity is known and the OCPs are not MSMR.
+        """
+        if (
+            self.options["open-circuit potential"] == "MSMR"
+            or self.known_value != "cyclable lithium capacity"
+        ):
+            return None
+        x, Un, y, Up = self._get_ocp_tables()
+        V_max, V_min = self._get_voltage_limits()
+        Q_n = inputs["Q_n"]
+        Q_p = inputs["Q_p"]
+        Q_Li = inputs["Q_Li"]
+
+        # Up(y_100) - Un(x_100) = V_max, with y_100 = (Q_Li - x_100 * Q_n) / Q_p
+        y_100 = (Q_Li - x * Q_n) / Q_p
+        x_100 = _table_root(x, np.interp(y_100, y, Up) - Un - V_max)
+        if x_100 is None:
+            return None
+        # Up(y_0) - Un(x_0) = V_min, with y_0 = y_100 + Q_n * (x_100 - x_0) / Q_p
+        y_0 = (Q_Li - x_100 * Q_n) / Q_p + Q_n * (x_100 - x) / Q_p
+        x_0 = _table_root(x, np.interp(y_0, y, Up) - Un - V_min)
+        if x_0 is None:
+            return None
+
+        guess = {"x_100": x_100, "x_0": x_0}
+        if any(name not in guess for name in state_names):
+            return None
+        return [guess[name] for name in state_names]
+
+    def __get_voltage_limits(self):
+        """The target maximum and minimum open-circuit voltages"""
+        V_max = self.parameter_values.evaluate(self.param.ocp_soc_100_dimensional)
+        V_min = self.parameter_values.evaluate(self.param.ocp_soc_0_dimensional)
+        return V_max, V_min
+
+    def __get_initial_temperature(self):
+        """The ambient temperature at the start, at which the energy is calculated"""
+        return self.parameter_values.evaluate(self.param.T_amb_av(0))
+
+    def __get_ocp_functions(self):
+        """
+        The negative and positive electrode OCPs, with parameters set, as
+        functions of the stoichiometry and temperature, which are the first and
+        second rows of `y` so that the OCPs can be evaluated at many points at once
+        """
+        sto = pybamm.StateVector(slice(0, 1))
+        T = pybamm.StateVector(slice(1, 2))
+        return [
+            pybamm.EvaluatorPython(
+                self.parameter_values.process_symbol(domain_param.prim.U(sto, T))
+            )
+            for domain_param in [self.param.n, self.param.p]
+        ]
+
+    def _evaluate_ocp(self, domain, sto, T):
+        """The OCP of an electrode ("negative" or "positive") at an array of sto"""
+        U = self._get_ocp_functions()[domain == "positive"]
+        sto = np.asarray(sto, dtype=float)
+        value = U(y=np.vstack([sto.flatten(), np.full(sto.size, T)]))
+        # the OCP can be a constant, in which case it is broadcast to sto
+        return np.broadcast_to(np.asarray(value).flatten(), sto.size).reshape(
+            sto.shape
+        )
+
+    def _evaluate_ocv(self, x, y, T):
+        """The open-circuit voltage at arrays of stoichiometries x and y"""
+        return self._evaluate_ocp("positive", y, T) - self._evaluate_ocp(
+            "negative", x, T
+        )
+
+    def __get_ocp_tables(self, points=1001):
+        """
+        The negative and positive electrode OCPs at the reference temperature,
+        tabulated between the stoichiometry limits of the OCPs
+        """
+        x0_min, x100_max, y100_min, y0_max = self.lims_ocp
+        T_ref = self.parameter_values["Reference temperature [K]"]
+        x = np.linspace(x0_min, x100_max, points)
+        y = np.linspace(y100_min, y0_max, points)
+        Un_table = self._evaluate_ocp("negative", x, T_ref)
+        Up_table = self._evaluate_ocp("positive", y, T_ref)
+        return x, Un_table, y, Up_table
+
+    def __get_soc_ocv_table(self, points=101):
+        """
+        The open-circuit voltage at the reference temperature, tabulated between 0
+        and 1 state of charge, to find the state of charge at a given voltage
+        """
+        x_0, x_100, y_100, y_0 = self.get_min_max_stoichiometries()
+        T_ref = self.parameter_values["Reference temperature [K]"]
+        soc = np.linspace(0, 1, points)
+        x = x_0 + soc * (x_100 - x_0)
+        y = y_0 - soc * (y_0 - y_100)
+        return soc, self._evaluate_ocv(x, y, T_ref)
+
+    def __get_batch_functions(self):
+        """
+        CasADi functions of the states and inputs of the full electrode SOH model,
+        to solve it for a batch of inputs in :meth:`solve_batch`
+        """
+        sim = self._get_electrode_soh_sims_full()
+        sim.build()
+        model = sim.built_model
+
+        t = casadi.MX(0)
+        y = casadi.MX.sym("y", model.len_alg)
+        input_names = sorted(param.name for param in model.input_parameters)
+        inputs = {name: casadi.MX.sym(name) for name in input_names}
+        p = casadi.vertcat(*inputs.values())
+
+        # Names of the states, in the order in which they are in y
+        state_names = [
+            var.name
+            for var, _ in sorted(
+                model.y_slices.items(), key=lambda item: item[1][0].start
+            )
+        ]
+        residuals = casadi.Function(
+            "esoh_residuals",
+            [y, p],
+            [model.concatenated_algebraic.to_casadi(t, y, inputs=inputs)],
+        )
+        roots = casadi.rootfinder(
+            "esoh_roots", "newton", residuals, {"error_on_fail": False}
+        )
+        names = list(model.variables.keys())
+        evaluate = casadi.Function(
+            "esoh_variables",
+            [y, p],
+            [
+                casadi.vertcat(
+                    *[
+                        model.variables[name].to_casadi(t, y, inputs=inputs)
+                        for name in names
+                    ]
+                )
+            ],
+        )
+        return state_names, input_names, names, roots, residuals, evaluate
+
     def _set_up_solve(self, inputs):
         # Try with full sim
         sim = self._get_electrode_soh_sims_full()
@@ -689,8 +974,7 @@ class ElectrodeSOHSolver:
 
         if isinstance(initial_value, str) and initial_value.endswith("V"):
             V_init = float(initial_value[:-1])
-            V_min = parameter_values.evaluate(param.ocp_soc_0_dimensional)
-            V_max = parameter_values.evaluate(param.ocp_soc_100_dimensional)
+            V_max, V_min = self._get_voltage_limits()
 
             if not V_min < V_init < V_max:
                 raise ValueError(
@@ -698,12 +982,24 @@ class ElectrodeSOHSolver:
                     f"({V_min}, {V_max})"
                 )
 
-            # Solve simple model for initial soc based on target voltage
-            soc_model = pybamm.BaseModel()
-            soc = pybamm.Variable("soc")
-            x = x_0 + soc * (x_100 - x_0)
-            y = y_0 - soc * (y_0 - y_100)
-            if self.options["open-circuit potential"] == "MSMR":
+            if self.options["open-circuit potential"] != "MSMR":
+                # Bracket the soc with the tabulated OCV, and find it with the OCPs
+                soc, V = self._get_soc_ocv_table()
+                i = min(max(np.searchsorted(V, V_init), 1), len(V) - 1)
+                T_ref = parameter_values["Reference temperature [K]"]
+
+                def ocv_error(soc):
+                    x = np.array(x_0 + soc * (x_100 - x_0))
+                    y = np.array(y_0 - soc * (y_0 - y_100))
+                    return float(self._evaluate_ocv(x, y, T_ref)) - V_init
+
+                initial_soc = brentq(ocv_error, soc[i - 1], soc[i])
+            else:
+                # Solve simple model for initial soc based on target voltage
+                soc_model = pybamm.BaseModel()
+                soc = pybamm.Variable("soc")
+                x = x_0 + soc * (x_100 - x_0)
+                y = y_0 - soc * (y_0 - y_100)
                 xn = param.n.prim.x
                 xp = param.p.prim.x
                 Up = pybamm.Variable("Up")
@@ -713,17 +1009,14 @@ class ElectrodeSOHSolver:
                 soc_model.initial_conditions[Un] = 0
                 soc_model.initial_conditions[Up] = V_max
                 soc_model.algebraic[soc] = Up - Un - V_init
-            else:
-                Up = param.p.prim.U
-                Un = param.n.prim.U
-                T_ref = parameter_values["Reference temperature [K]"]
-                soc_model.algebraic[soc] = Up(y, T_ref) - Un(x, T_ref) - V_init
-            # initial guess for soc linearly interpolates between 0 and 1
-            # based on V linearly interpolating between V_max and V_min
-            soc_model.initial_conditions[soc] = (V_init - V_min) / (V_max - V_min)
-            soc_model.variables["soc"] = soc
-            parameter_values.process_model(soc_model)
-            initial_soc = pybamm.AlgebraicSolver().solve(soc_model, [0])["soc"].data[0]
+                # initial guess for soc linearly interpolates between 0 and 1
+                # based on V linearly interpolating between V_max and V_min
+                soc_model.initial_conditions[soc] = (V_init - V_min) / (V_max - V_min)
+                soc_model.variables["soc"] = soc
+                parameter_values.process_model(soc_model)
+                initial_soc = (
+                    pybamm.AlgebraicSolver().solve(soc_model, [0])["soc"].data[0]
+                )
         elif isinstance(initial_value, (int, float)):
             initial_soc = initial_value
             if not 0 <= initial_soc <= 1:
@@ -750,20 +1043,7 @@ class ElectrodeSOHSolver:
         x_0, x_100, y_100, y_0
             The min/max stoichiometries
         """
-        parameter_values = self.parameter_values
-        param = self.param
-
-        Q_n = parameter_values.evaluate(param.n.Q_init)
-        Q_p = parameter_values.evaluate(param.p.Q_init)
-
-        if self.known_value == "cyclable lithium capacity":
-            Q_Li = parameter_values.evaluate(param.Q_Li_particles_init)
-            inputs = {"Q_n": Q_n, "Q_p": Q_p, "Q_Li": Q_Li}
-        elif self.known_value == "cell capacity":
-            Q = parameter_values.evaluate(param.Q / param.n_electrodes_parallel)
-            inputs = {"Q_n": Q_n, "Q_p": Q_p, "Q": Q}
-        # Solve the model and check outputs
-        sol = self.solve(inputs)
+        sol = self._solve_initial_values()
         return [sol["x_0"], sol["x_100"], sol["y_100"], sol["y_0"]]
 
     def get_initial_ocps(self, initial_value):
@@ -783,7 +1063,6 @@ class ElectrodeSOHSolver:
             The initial open-circuit potentials at the desired initial state of charge
         """
         parameter_values = self.parameter_values
-        param = self.param
         x, y = self.get_initial_stoichiometries(initial_value)
         if self.options["open-circuit potential"] == "MSMR":
             msmr_pot_model = _get_msmr_potential_model(
@@ -796,8 +1075,8 @@ class ElectrodeSOHSolver:
             Up = sol["Up"].data[0]
         else:
             T_ref = parameter_values["Reference temperature [K]"]
-            Un = parameter_values.evaluate(param.n.prim.U(x, T_ref))
-            Up = parameter_values.evaluate(param.p.prim.U(y, T_ref))
+            Un = float(self._evaluate_ocp("negative", x, T_ref))
+            Up = float(self._evaluate_ocp("positive", y, T_ref))
         return Un, Up
 
     def get_min_max_ocps(self):
@@ -810,6 +1089,14 @@ class ElectrodeSOHSolver:
         Un_0, Un_100, Up_100, Up_0
             The min/max ocps
         """
+        sol = self._solve_initial_values()
+        return [sol["Un(x_0)"], sol["Un(x_100)"], sol["Up(y_100)"], sol["Up(y_0)"]]
+
+    def __solve_initial_values(self):
+        """
+        Solve the electrode SOH model for the capacities given by the parameter
+        values, which is cached as it is needed for every initial state of charge
+        """
         parameter_values = self.parameter_values
         param = self.param
 
@@ -823,8 +1110,7 @@ class ElectrodeSOHSolver:
             Q = parameter_values.evaluate(param.Q / param.n_electrodes_parallel)
             inputs = {"Q_n": Q_n, "Q_p": Q_p, "Q": Q}
         # Solve the model and check outputs
-        sol = self.solve(inputs)
-        return [sol["Un(x_0)"], sol["Un(x_100)"], sol["Up(y_100)"], sol["Up(y_0)"]]
+        return self.solve(inputs)
 
     def theoretical_energy_integral(self, inputs, points=1000):
         x_0 = inputs["x_0"]
@@ -832,19 +1118,17 @@ class ElectrodeSOHSolver:
         x_100 = inputs["x_100"]
         y_100 = inputs["y_100"]
         Q_p = inputs["Q_p"]
+        # The stoichiometries can be arrays, e.g. from `solve_batch`, in which case
+        # there is one column of points for each set of stoichiometries
         x_vals = np.linspace(x_100, x_0, num=points)
         y_vals = np.linspace(y_100, y_0, num=points)
         # Calculate OCV at each stoichiometry
-        param = self.param
-        T = param.T_amb_av(0)
-        Vs = self.parameter_values.evaluate(
-            param.p.prim.U(y_vals, T) - param.n.prim.U(x_vals, T)
-        ).flatten()
+        Vs = self._evaluate_ocv(x_vals, y_vals, self._get_initial_temperature())
         # Calculate dQ
         Q = Q_p * (y_0 - y_100)
         dQ = Q / (points - 1)
         # Integrate and convert to W-h
-        E = np.trapz(Vs, dx=dQ)
+        E = np.trapz(Vs, dx=dQ, axis=0)
         return E
 
 
@@ -1048,6 +1332,19 @@ def calculate_theoretical_energy(
     return E
 
 
+def _table_root(x, f):
+    """
+    Root of a function tabulated at increasing values of x, by linear interpolation
+    between the first two points at which it changes sign. Returns None if it does
+    not change sign.
+    """
+    crossings = np.nonzero(np.diff(np.sign(f)))[0]
+    if len(crossings) == 0:
+        return None
+    i = crossings[0]
+    return x[i] - f[i] * (x[i + 1] - x[i]) / (f[i + 1] - f[i])
+
+
 def _get_msmr_potential_model(parameter_values, param):
     """
     Returns a solver to calculate the open-circuit potentials of the individual
@@ -3,4 +3,6 @@ from .process_parameter_data import (
     process_2D_data,
     process_2D_data_csv,
     process_3D_data_csv,
+    decimate_1D_data,
+    piecewise_constant_function,
 )
@@ -1,6 +1,7 @@
 #
 # Parameter values for a simulation
 #
+import functools
 import numpy as np
 import pybamm
 import numbers
@@ -311,15 +312,27 @@ class ParameterValues:
         known_value="cyclable lithium capacity",
         inplace=True,
         options=None,
+        esoh_solver=None,
     ):
         """
         Set the initial stoichiometry of each electrode, based on the initial
-        SOC or voltage
+        SOC or voltage. An :class:`pybamm.lithium_ion.ElectrodeSOHSolver` for these
+        parameter values can be passed as `esoh_solver` to reuse its cached
+        solutions when this is called several times.
         """
-        param = param or pybamm.LithiumIonParameters(options)
-        x, y = pybamm.lithium_ion.get_initial_stoichiometries(
-            initial_value, self, param=param, known_value=known_value, options=options
-        )
+        if esoh_solver is None:
+            param = param or pybamm.LithiumIonParameters(options)
+            x, y = pybamm.lithium_ion.get_initial_stoichiometries(
+                initial_value,
+                self,
+                param=param,
+                known_value=known_value,
+                options=options,
+            )
+        else:
+            self._check_esoh_solver(esoh_solver, param, known_value, options)
+            param = esoh_solver.param
+            x, y = esoh_solver.get_initial_stoichiometries(initial_value)
         if inplace:
             parameter_values = self
         else:
@@ -341,15 +354,27 @@ class ParameterValues:
         known_value="cyclable lithium capacity",
         inplace=True,
         options=None,
+        esoh_solver=None,
     ):
         """
         Set the initial OCP of each electrode, based on the initial
-        SOC or voltage
+        SOC or voltage. An :class:`pybamm.lithium_ion.ElectrodeSOHSolver` for these
+        parameter values can be passed as `esoh_solver` to reuse its cached
+        solutions when this is called several times.
         """
-        param = param or pybamm.LithiumIonParameters(options)
-        Un, Up = pybamm.lithium_ion.get_initial_ocps(
-            initial_value, self, param=param, known_value=known_value, options=options
-        )
+        if esoh_solver is None:
+            param = param or pybamm.LithiumIonParameters(options)
+            Un, Up = pybamm.lithium_ion.get_initial_ocps(
+                initial_value,
+                self,
+                param=param,
+                known_value=known_value,
+                options=options,
+            )
+        else:
+            self._check_esoh_solver(esoh_solver, param, known_value, options)
+            param = esoh_solver.param
+            Un, Up = esoh_solver.get_initial_ocps(initial_value)
         if inplace:
             parameter_values = self
         else:
@@ -362,6 +387,64 @@ class ParameterValues:
         )
         return parameter_values
 
+    def _check_esoh_solver(self, esoh_solver, param, known_value, options):
+        """Check that an eSOH solver was set up with these parameter values"""
+        mismatch = esoh_solver._set_up_mismatch(self, param, known_value, options)
+        if mismatch is not None:
+            raise ValueError(
+                f"The {mismatch} of the eSOH solver do not match those passed to set "
+                "the initial state"
+            )
+
+    def promote_to_inputs(self, names, inplace=True):
+        """
+        Replace the values of some parameters by input parameters, so that a model
+        processed with these parameter values can be solved for different values of
+        the parameters without being processed again (e.g. for a parameter sweep).
+
+        A parameter with a numerical value is replaced by an input parameter with
+        the same name. A parameter whose value is a function is multiplied by an
+        input parameter named `"<name> scaling factor"`.
+
+        Parameters
+        ----------
+        names : list of str
+            The names of the parameters to replace
+        inplace : bool, optional
+            Whether to modify the parameter values in place. Default is True.
+
+        Returns
+        -------
+        parameter_values : :class:`pybamm.ParameterValues`
+            The parameter values with input parameters
+        inputs : dict
+            The names of the new input parameters, with the values that give the
+            original parameter values (the numerical value of the parameter, or 1
+            for scaling factors)
+        """
+        if inplace:
+            parameter_values = self
+        else:
+            parameter_values = self.copy()
+        values = {}
+        inputs = {}
+        for name in names:
+            value = self[name]
+            if isinstance(value, numbers.Number):
+                values[name] = "[input]"
+                inputs[name] = value
+            elif callable(value) and not isinstance(value, pybamm.Symbol):
+                input_name = f"{name} scaling factor"
+                values[name] = functools.partial(_scaled_function, value, input_name)
+                inputs[input_name] = 1
+            else:
+                raise TypeError(
+                    f"Cannot replace parameter '{name}' with value '{value}' by an "
+                    "input parameter, the value should be a number or a function"
+                )
+        parameter_values.update(values)
+        return parameter_values, inputs
+
     def check_parameter_values(self, values):
         for param in values:
             if "propotional term" in param:
@@ -896,3 +979,8 @@ class ParameterValues:
                     file.write((s + " : {:10.4g}\n").format(name, value))
                 else:
                     file.write((s + " : {:10.3E}\n").format(name, value))
+
+
+def _scaled_function(function, input_name, *args):
+    """A function parameter multiplied by a scaling input parameter"""
+    return pybamm.InputParameter(input_name) * function(*args)
@@ -1,6 +1,16 @@
 import os
 import json
+import hashlib
+from collections import OrderedDict
 import numpy as np
+import pybamm
+
+# Digests of the files that have been read, keyed by (path, mtime, size), so that
+# unchanged files are not hashed again
+_file_digests = {}
+# Parsed tables, keyed by the digest and the modification time of their file
+_tables = OrderedDict()
+_max_cached_tables = 32
 
 
 def _process_name(name, path, ext):
@@ -29,13 +39,99 @@ def _process_name(name, path, ext):
     return (filename, name.split(".")[0])
 
 
-def process_1D_data(name, path=None):
+def _file_digest(filename, stat):
+    key = (os.path.abspath(filename), stat.st_mtime_ns, stat.st_size)
+    if key not in _file_digests:
+        h = hashlib.sha256()
+        with open(filename, "rb") as f:
+            for chunk in iter(lambda: f.read(1 << 20), b""):
+                h.update(chunk)
+        _file_digests[key] = h.hexdigest()
+    return _file_digests[key]
+
+
+def _parse_table(filename):
+    """Parse a table of floats from a csv, npy or parquet file"""
+    if filename.endswith(".npy"):
+        return np.load(filename, mmap_mode="r")
+    if filename.endswith(".parquet"):
+        pd = pybamm.have_optional_dependency("pandas")
+        return pd.read_parquet(filename).to_numpy(dtype=float)
+    try:
+        # loadtxt parses in C, but does not accept missing values
+        return np.loadtxt(filename, delimiter=",", skiprows=1, ndmin=2)
+    except ValueError:
+        return np.genfromtxt(filename, delimiter=",", skip_header=1)
+
+
+def _load_table(filename, cache_dir=None):
     """
-    Process 1D data from a csv file
+    Load a two-dimensional table of floats from a file, with one column per
+    variable. Parsed tables are cached in memory, keyed by the digest and the
+    modification time of the file. If `cache_dir` is given, csv and parquet tables
+    are also saved there as npy files (in column-major order, so that each column
+    is contiguous), which later calls, including from other processes, load with
+    memory mapping instead of parsing the file again. The returned array is
+    read-only.
     """
-    filename, name = _process_name(name, path, ".csv")
+    stat = os.stat(filename)
+    key = (_file_digest(filename, stat), stat.st_mtime_ns)
+    cache_file = None
+    if cache_dir is not None and not filename.endswith(".npy"):
+        cache_file = os.path.join(cache_dir, "{}-{}.npy".format(*key))
+        if not os.path.exists(cache_file):
+            os.makedirs(cache_dir, exist_ok=True)
+            data = _tables[key] if key in _tables else _parse_table(filename)
+            # write to a temporary file first so that other processes never load
+            # a partially written table
+            tmp_file = cache_file + ".{}.tmp".format(os.getpid())
+            with open(tmp_file, "wb") as f:
+                np.save(f, np.asfortranarray(data))
+            os.replace(tmp_file, cache_file)
+            _tables.pop(key, None)
+
+    if key not in _tables:
+        if cache_file is not None:
+            data = np.load(cache_file, mmap_mode="r")
+        else:
+            data = _parse_table(filename)
+        if data.flags.writeable:
+            data = data.view()
+            data.flags.writeable = False
+        _tables[key] = data
+        if len(_tables) > _max_cached_tables:
+            _tables.popitem(last=False)
+    _tables.move_to_end(key)
+    return _tables[key]
+
+
+def process_1D_data(name, path=None, cache_dir=None):
+    """
+    Process 1D data from a csv file (or from a npy or parquet file, if `name` has
+    that extension), with two columns
 
-    data = np.genfromtxt(filename, delimiter=',', skip_header=1)
+    Parameters
+    ----------
+    name : str
+        The name of the file, which is also the name given to the function
+    path : str, optional
+        The path to the directory of the file
+    cache_dir : str, optional
+        A directory in which to store the parsed data, so that it is loaded with
+        memory mapping rather than parsed again next time
+
+    Returns
+    -------
+    formatted_data: tuple
+        A tuple containing the name of the function and the data formatted
+        correctly for use within one-dimensional interpolants.
+    """
+    ext = os.path.splitext(name)[1]
+    filename, name = _process_name(
+        name, path, ext if ext in [".npy", ".parquet"] else ".csv"
+    )
+
+    data = _load_table(filename, cache_dir)
     x = data[:, 0]
     y = data[:, 1]
 
@@ -49,15 +145,23 @@ def process_2D_data(name, path=None):
     """
     filename, name = _process_name(name, path, ".json")
 
-    with open(filename, "r") as jsonfile:
-        json_data = json.load(jsonfile)
-    data = json_data["data"]
-    data[0] = [np.array(el) for el in data[0]]
-    data[1] = np.array(data[1])
-    return (name, tuple(data))
-
-
-def process_2D_data_csv(name, path=None):
+    stat = os.stat(filename)
+    key = (_file_digest(filename, stat), stat.st_mtime_ns)
+    if key not in _tables:
+        with open(filename, "r") as jsonfile:
+            json_data = json.load(jsonfile)
+        data = json_data["data"]
+        data[0] = [np.array(el) for el in data[0]]
+        data[1] = np.array(data[1])
+        _tables[key] = data
+        if len(_tables) > _max_cached_tables:
+            _tables.popitem(last=False)
+    data = _tables[key]
+    # copy the list of arrays so that the cached data cannot be changed
+    return (name, ([x.copy() for x in data[0]], data[1].copy()))
+
+
+def process_2D_data_csv(name, path=None, cache_dir=None):
     """
     Process 2D data from a csv file. Assumes
     data is in the form of a three columns
@@ -77,6 +181,10 @@ def process_2D_data_csv(name, path=None):
     path : str
         The path to the file where the three
         dimensional data is stored.
+    cache_dir : str, optional
+        A directory in which to store the parsed
+        data, so that it is loaded with memory
+        mapping rather than parsed again next time.
 
     Returns
     -------
@@ -88,7 +196,7 @@ def process_2D_data_csv(name, path=None):
 
     filename, name = _process_name(name, path, ".csv")
 
-    data = np.genfromtxt(filename, delimiter=',',skip_header=1)
+    data = _load_table(filename, cache_dir)
 
     x1 = np.unique(data[:, 0])
     x2 = np.unique(data[:, 1])
@@ -104,7 +212,7 @@ def process_2D_data_csv(name, path=None):
     return formatted_data
 
 
-def process_3D_data_csv(name, path=None):
+def process_3D_data_csv(name, path=None, cache_dir=None):
     """
     Process 3D data from a csv file. Assumes
     data is in the form of four columns and
@@ -124,6 +232,10 @@ def process_3D_data_csv(name, path=None):
     path : str
         The path to the file where the three
         dimensional data is stored.
+    cache_dir : str, optional
+        A directory in which to store the parsed
+        data, so that it is loaded with memory
+        mapping rather than parsed again next time.
 
     Returns
     -------
@@ -135,7 +247,7 @@ def process_3D_data_csv(name, path=None):
 
     filename, name = _process_name(name, path, ".csv")
 
-    data = np.genfromtxt(filename, delimiter=',',skip_header=1)
+    data = _load_table(filename, cache_dir)
 
     x1 = np.unique(data[:, 0])
     x2 = np.unique(data[:, 1])
@@ -150,3 +262,150 @@ def process_3D_data_csv(name, path=None):
     formatted_data = (name, (x, value_data))
 
     return formatted_data
+
+
+def _segment_end(start, good, n, fits):
+    """
+    Find the last index `end` (at most n - 1) such that the data from `start` to
+    `end` fits a single segment, given an index `good` for which it does, by an
+    exponential search followed by a binary search
+    """
+    step = 1
+    while good < n - 1:
+        candidate = min(good + step, n - 1)
+        if not fits(start, candidate):
+            bad = candidate
+            break
+        good = candidate
+        step *= 2
+    else:
+        return good
+    while bad - good > 1:
+        middle = (good + bad) // 2
+        if fits(start, middle):
+            good = middle
+        else:
+            bad = middle
+    return good
+
+
+def decimate_1D_data(x, y, tolerance, interpolator="linear"):
+    """
+    Compress 1D data, such as a drive cycle, into fewer segments, keeping it within
+    a tolerance of the original data. Using the compressed data reduces the number
+    of knots that the solvers must step through (and the number of times at which
+    drive cycle simulations are solved by default).
+
+    Parameters
+    ----------
+    x : :class:`numpy.ndarray`
+        The (increasing) data point coordinates, e.g. the times of a drive cycle
+    y : :class:`numpy.ndarray`
+        The values at the data points
+    tolerance : float
+        The maximum absolute error allowed at the data points
+    interpolator : str, optional
+        The interpolation of the compressed data. Can be "linear" (default), in
+        which case the result is a subset of the data points whose linear
+        interpolant is within `tolerance` of the linear interpolant of the data
+        everywhere, or "constant", in which case the result is the start of each
+        segment and its value, which is within `tolerance` of the data points in
+        that segment (see :func:`piecewise_constant_function`).
+
+    Returns
+    -------
+    x, y : :class:`numpy.ndarray`
+        The compressed data
+    """
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    n = len(x)
+    if n < 3:
+        return x.copy(), y.copy()
+
+    if interpolator == "linear":
+        # drop the points that are on the line between their neighbours first, as
+        # they do not change the interpolant
+        dx = np.diff(x)
+        dy = np.diff(y)
+        keep = np.concatenate([[True], dy[:-1] * dx[1:] != dy[1:] * dx[:-1], [True]])
+        x = x[keep]
+        y = y[keep]
+        n = len(x)
+
+        def fits(start, end):
+            xs = x[start : end + 1]
+            slope = (y[end] - y[start]) / (x[end] - x[start])
+            chord = y[start] + slope * (xs - x[start])
+            return np.max(np.abs(y[start : end + 1] - chord)) <= tolerance
+
+        knots = [0]
+        while knots[-1] < n - 1:
+            knots.append(_segment_end(knots[-1], knots[-1] + 1, n, fits))
+        return x[knots], y[knots]
+
+    elif interpolator == "constant":
+        # only keep the first point of each run of equal values
+        keep = np.concatenate([[True], y[1:] != y[:-1]])
+        x = x[keep]
+        y = y[keep]
+        n = len(x)
+
+        def fits(start, end):
+            ys = y[start : end + 1]
+            return np.max(ys) - np.min(ys) <= 2 * tolerance
+
+        starts = [0]
+        values = []
+        while True:
+            end = _segment_end(starts[-1], starts[-1], n, fits)
+            ys = y[starts[-1] : end + 1]
+            values.append((np.max(ys) + np.min(ys)) / 2)
+            if end == n - 1:
+                break
+            starts.append(end + 1)
+        return x[starts], np.array(values)
+
+    else:
+        raise ValueError(f"interpolator '{interpolator}' not recognised")
+
+
+def piecewise_constant_function(x, y, child=None):
+    """
+    Create a piecewise-constant function of `child` (the time by default), equal to
+    `y[i]` from `x[i]` to `x[i + 1]` (and to `y[0]` before `x[0]`), e.g. from data
+    compressed by :func:`decimate_1D_data`. The function is a sum of steps, so
+    that the solvers stop and restart at each step of a function of time rather
+    than resolving it with small time steps. As every step is evaluated at each
+    time, this suits data with few segments (e.g. pulse tests); otherwise, use an
+    :class:`pybamm.Interpolant` of data compressed with linear interpolation.
+
+    Parameters
+    ----------
+    x : :class:`numpy.ndarray`
+        The (increasing) start of each segment
+    y : :class:`numpy.ndarray`
+        The value in each segment
+    child : :class:`pybamm.Symbol`, optional
+        The argument of the function. Default is :class:`pybamm.t`.
+
+    Returns
+    -------
+    :class:`pybamm.Symbol`
+        The piecewise-constant function
+    """
+    if child is None:
+        child = pybamm.t
+    steps = [pybamm.Scalar(y[0])] + [
+        (y[i] - y[i - 1]) * (child >= x[i])
+        for i in range(1, len(x))
+        if y[i] != y[i - 1]
+    ]
+    # add the steps pairwise, so that the depth of the expression tree only grows
+    # with the logarithm of the number of steps
+    while len(steps) > 1:
+        steps = [
+            steps[i] + steps[i + 1] if i + 1 < len(steps) else steps[i]
+            for i in range(0, len(steps), 2)
+        ]
+    return steps[0]
@@ -1,10 +1,12 @@
 #
 # Simulation class
 #
+import os
 import pickle
 import pybamm
 import numpy as np
 import hashlib
+import numbers
 import warnings
 import sys
 from functools import lru_cache
@@ -62,6 +64,28 @@ class Simulation:
         A list of variables to plot automatically
     C_rate: float (optional)
         The C-rate at which you would like to run a constant current (dis)charge.
+    cache_dir: str (optional)
+        A directory in which to cache built models between simulations and
+        processes (see :class:`pybamm.ModelCache`). If given, simulations with the
+        same model options, parameter values, mesh and spatial methods load the
+        discretised model from the cache instead of building it again, along with
+        the solver set-up when the solver settings also match. Only used for
+        simulations without an experiment. Default is None (no caching).
+    updatable_parameters: list of str (optional)
+        Names of parameters whose values will be changed with
+        :meth:`Simulation.update_parameters` after the simulation has been built,
+        e.g. in a calibration loop. The values of these parameters must be numbers,
+        and the parameters cannot be used in the geometry. The new values are
+        substituted in the built model without processing and discretising the
+        model again. Default is None.
+    sweep_parameters: list of str (optional)
+        Names of parameters to replace by input parameters (see
+        :meth:`pybamm.ParameterValues.promote_to_inputs`), so that the simulation
+        can be solved for several values of these parameters, with
+        :meth:`Simulation.sweep`, while only being built once. Parameters whose
+        value is a function are multiplied by a scaling factor input. The inputs
+        take the values given in the parameter values (or 1 for scaling factors)
+        when they are not given to :meth:`Simulation.solve`. Default is None.
     """
 
     def __init__(
@@ -76,6 +100,9 @@ class Simulation:
         solver=None,
         output_variables=None,
         C_rate=None,
+        cache_dir=None,
+        updatable_parameters=None,
+        sweep_parameters=None,
     ):
         self._parameter_values = parameter_values or model.default_parameter_values
         self._unprocessed_parameter_values = self._parameter_values
@@ -137,6 +164,19 @@ class Simulation:
         self._solution = None
         self.quick_plot = None
 
+        # Optional on-disk cache of built models
+        self._model_cache = None if cache_dir is None else pybamm.ModelCache(cache_dir)
+        self._cache_key = None
+        self._cache_solver_key = None
+
+        # Parameters that are inputs of the built model(s), see update_parameters
+        # and sweep
+        self._updatable_parameters = list(updatable_parameters or [])
+        self._sweep_parameters = list(sweep_parameters or [])
+        self._check_input_parameters()
+        self._built_model_template = None
+        self.op_conds_to_built_model_templates = None
+
         # Initialise instances of Simulation class with the same random seed
         self._set_random_seed()
 
@@ -147,6 +187,7 @@ class Simulation:
             warnings.filterwarnings("ignore")
 
         self.get_esoh_solver = lru_cache()(self._get_esoh_solver)
+        self._initial_soc_esoh_solver = None
 
     def __getstate__(self):
         """
@@ -154,6 +195,7 @@ class Simulation:
         """
         result = self.__dict__.copy()
         result["get_esoh_solver"] = None  # Exclude LRU cache
+        result["_initial_soc_esoh_solver"] = None  # Exclude LRU caches
         return result
 
     def __setstate__(self, state):
@@ -175,6 +217,102 @@ class Simulation:
                 % (2**32)
             )
 
+    def _check_input_parameters(self):
+        """
+        Check that the updatable and sweep parameters can be inputs of the built
+        model(s)
+        """
+        names = self._updatable_parameters + self._sweep_parameters
+        if not names:
+            return
+        if self._model.is_discretised:
+            raise ValueError(
+                "Cannot update the parameters of a model that is already discretised"
+            )
+        unpacker = pybamm.SymbolUnpacker((pybamm.Parameter, pybamm.FunctionParameter))
+        geometry_parameters = {
+            param.name
+            for param in unpacker.unpack_list_of_symbols(
+                [
+                    value
+                    for value in _nested_dict_values(self._geometry)
+                    if isinstance(value, pybamm.Symbol)
+                ]
+            )
+        }
+        if self.operating_mode == "with experiment":
+            # These parameters are set for each step of the experiment
+            experiment_parameters = {
+                "Current function [A]",
+                "Voltage function [V]",
+                "Power function [W]",
+                "Ambient temperature [K]",
+                "Nominal cell capacity [A.h]",
+            }
+            if any(
+                op.temperature is not None
+                for op in self.experiment.operating_conditions_steps
+            ):
+                experiment_parameters.add("Initial temperature [K]")
+        else:
+            experiment_parameters = set()
+        for name in self._updatable_parameters:
+            if not isinstance(self._parameter_values[name], numbers.Number):
+                raise ValueError(
+                    f"Updatable parameter '{name}' must have a numerical value"
+                )
+            if name in self._sweep_parameters:
+                raise ValueError(
+                    f"Parameter '{name}' cannot be both an updatable and a sweep "
+                    "parameter"
+                )
+        # Check that the sweep parameters can be inputs
+        self._parameter_values.promote_to_inputs(self._sweep_parameters, inplace=False)
+        for name in names:
+            if name in geometry_parameters:
+                raise ValueError(
+                    f"Parameter '{name}' is used in the geometry and cannot be "
+                    "updated without building the simulation again"
+                )
+            if name in experiment_parameters:
+                raise ValueError(
+                    f"Parameter '{name}' is set by the experiment and cannot be "
+                    "updated"
+                )
+
+    def _get_parameter_values_for_processing(self):
+        """
+        Return the parameter values used to process the model, in which the
+        updatable and sweep parameters are inputs
+        """
+        names = self._updatable_parameters + self._sweep_parameters
+        if not names:
+            return self._parameter_values
+        parameter_values, _ = self._parameter_values.promote_to_inputs(
+            names, inplace=False
+        )
+        return parameter_values
+
+    def _get_sweep_inputs(self):
+        """
+        Return the inputs that replace the sweep parameters, with the values that
+        give the current parameter values
+        """
+        _, inputs = self._parameter_values.promote_to_inputs(
+            self._sweep_parameters, inplace=False
+        )
+        return inputs
+
+    def _add_sweep_inputs(self, inputs):
+        """
+        Add the default values of the sweep inputs that are not in `inputs`, which
+        can be a dict or a list of dicts
+        """
+        sweep_inputs = self._get_sweep_inputs()
+        if isinstance(inputs, list):
+            return [{**sweep_inputs, **inpts} for inpts in inputs]
+        return {**sweep_inputs, **(inputs or {})}
+
     def set_up_and_parameterise_experiment(self):
         """
         Set up a simulation to run with an experiment. This creates a dictionary of
@@ -220,15 +358,40 @@ class Simulation:
     def set_up_and_parameterise_model_for_experiment(self):
         """
         Set up self._model to be able to run the experiment (new version).
-        In this version, a new model is created for each step.
+        In this version, a new model is created for each type of step. The values of
+        the steps (e.g. the current, the termination thresholds and the ambient
+        temperature) are input parameters of the model, so that steps which only
+        differ in these values (e.g. "Discharge at 1C" and "Discharge at 2C") share
+        the same model, and the inputs for each step are stored in
+        `self.experiment_unique_steps_to_inputs`.
 
         This increases set-up time since several models to be processed, but
         reduces simulation time since the model formulation is efficient.
         """
         self.experiment_unique_steps_to_model = {}
-        for op_number, op in enumerate(self.experiment.unique_steps):
+        self.experiment_unique_steps_to_inputs = {}
+        structures_to_model = {}
+        # Go through the unique steps in the order in which they first appear, so
+        # that the first step of the experiment is step 0
+        first_indices = {}
+        for i, op in enumerate(self.experiment.operating_conditions_steps):
+            first_indices.setdefault(op.basic_repr(), i)
+        unique_steps = sorted(
+            self.experiment.unique_steps, key=lambda op: first_indices[op.basic_repr()]
+        )
+        for op_number, op in enumerate(unique_steps):
+            structure, inputs = self.get_experiment_step_structure_and_inputs(
+                op, op_number
+            )
+            self.experiment_unique_steps_to_inputs[op.basic_repr()] = inputs
+            if structure in structures_to_model:
+                self.experiment_unique_steps_to_model[
+                    op.basic_repr()
+                ] = structures_to_model[structure]
+                continue
+
             new_model = self._model.new_copy()
-            new_parameter_values = self._parameter_values.copy()
+            new_parameter_values = self._get_parameter_values_for_processing().copy()
 
             if op.type != "current":
                 # Voltage or power control
@@ -261,25 +424,34 @@ class Simulation:
                 new_parameter_values["Current function [A]"] = submodel.variables[
                     "Current [A]"
                 ]
-            self.update_new_model_events(new_model, op)
+            self.update_new_model_events(new_model, op, inputs)
             # Update parameter values
             self._original_temperature = new_parameter_values["Ambient temperature [K]"]
             experiment_parameter_values = self.get_experiment_parameter_values(
                 op, op_number
             )
+            # Values that are inputs of the model are only set when solving
+            experiment_parameter_values.update(
+                {
+                    name: "[input]"
+                    for name in inputs
+                    if name in experiment_parameter_values
+                }
+            )
             new_parameter_values.update(
                 experiment_parameter_values, check_already_exists=False
             )
             parameterised_model = new_parameter_values.process_model(
                 new_model, inplace=False
             )
+            structures_to_model[structure] = parameterised_model
             self.experiment_unique_steps_to_model[op.basic_repr()] = parameterised_model
 
         # Set up rest model if experiment has start times
         if self.experiment.initial_start_time:
             new_model = self._model.new_copy()
             # Update parameter values
-            new_parameter_values = self._parameter_values.copy()
+            new_parameter_values = self._get_parameter_values_for_processing().copy()
             self._original_temperature = new_parameter_values["Ambient temperature [K]"]
             new_parameter_values.update(
                 {"Current function [A]": 0, "Ambient temperature [K]": "[input]"},
@@ -292,31 +464,98 @@ class Simulation:
                 "Rest for padding"
             ] = parameterised_model
 
-    def update_new_model_events(self, new_model, op):
+    def get_experiment_step_structure_and_inputs(self, op, op_number):
+        """
+        Split an experiment step into the structure of the model needed to simulate
+        it and the values that can be passed to that model as inputs. Steps with the
+        same structure can share a model.
+
+        Parameters
+        ----------
+        op : :class:`pybamm.step._Step`
+            The experiment step
+        op_number : int
+            The index of the step in the unique steps of the experiment, which is 0
+            for the first step of the experiment
+
+        Returns
+        -------
+        structure : tuple
+            The structure of the model for this step
+        inputs : dict
+            The values of the step, keyed by the names of the corresponding input
+            parameters
+        """
+        inputs = {}
+        if isinstance(op.value, numbers.Number) and op.value != 0:
+            inputs[f"{op.type.capitalize()} function {op.unit}"] = op.value
+            value_structure = None
+        elif isinstance(op.value, numbers.Number):
+            # Rest steps are kept separate as the model simplifies a lot when the
+            # current is zero
+            value_structure = 0
+        else:
+            # Drive cycles are functions of time, so each needs its own model
+            value_structure = op.basic_repr()
+
+        termination_structure = []
+        term_types = [term["type"] for term in op.termination]
         for term in op.termination:
-            if term["type"] == "current":
+            term_type = term["type"]
+            if term_type not in ["current", "voltage"]:
+                continue
+            if term_types.count(term_type) == 1:
+                inputs[_termination_input_name(term_type)] = term["value"]
+                termination_structure.append(term_type)
+            else:
+                termination_structure.append((term_type, term["value"]))
+            if term_type == "voltage":
+                # The sign of the voltage event depends on the sign of the step
+                termination_structure.append(_experiment_step_sign(op))
+
+        if op.temperature is not None:
+            inputs["Ambient temperature [K]"] = op.temperature
+            # The first step also sets the initial temperature
+            temperature_structure = op.temperature if op_number == 0 else True
+        else:
+            temperature_structure = None
+
+        structure = (
+            op.type,
+            value_structure,
+            tuple(termination_structure),
+            temperature_structure,
+        )
+        return structure, inputs
+
+    def update_new_model_events(self, new_model, op, inputs=None):
+        inputs = inputs or {}
+        for term in op.termination:
+            term_type = term["type"]
+            if term_type not in ["current", "voltage"]:
+                continue
+            # Use the input parameter for the termination value, if there is one
+            if _termination_input_name(term_type) in inputs:
+                value = pybamm.InputParameter(_termination_input_name(term_type))
+            else:
+                value = term["value"]
+
+            if term_type == "current":
                 new_model.events.append(
                     pybamm.Event(
                         "Current cut-off [A] [experiment]",
-                        abs(new_model.variables["Current [A]"]) - term["value"],
+                        abs(new_model.variables["Current [A]"]) - value,
                     )
                 )
 
             # add voltage events to the model
-            if term["type"] == "voltage":
+            if term_type == "voltage":
                 # The voltage event should be positive at the start of charge/
                 # discharge. We use the sign of the current or power input to
                 # figure out whether the voltage event is greater than the starting
                 # voltage (charge) or less (discharge) and set the sign of the
                 # event accordingly
-                if isinstance(op.value, pybamm.Interpolant) or isinstance(
-                    op.value, pybamm.Multiplication
-                ):
-                    inpt = {"start time": 0}
-                    init_curr = op.value.evaluate(t=0, inputs=inpt).flatten()[0]
-                    sign = np.sign(init_curr)
-                else:
-                    sign = np.sign(op.value)
+                sign = _experiment_step_sign(op)
                 if sign > 0:
                     name = "Discharge"
                 else:
@@ -328,10 +567,7 @@ class Simulation:
                         pybamm.Event(
                             f"{name} voltage cut-off [V] [experiment]",
                             sign
-                            * (
-                                new_model.variables["Battery voltage [V]"]
-                                - term["value"]
-                            ),
+                            * (new_model.variables["Battery voltage [V]"] - value),
                         )
                     )
 
@@ -376,8 +612,10 @@ class Simulation:
         if self.model_with_set_params:
             return
 
-        self._model_with_set_params = self._parameter_values.process_model(
-            self._unprocessed_model, inplace=False
+        self._model_with_set_params = (
+            self._get_parameter_values_for_processing().process_model(
+                self._unprocessed_model, inplace=False
+            )
         )
         self._parameter_values.process_geometry(self._geometry)
         self._model = self._model_with_set_params
@@ -387,7 +625,9 @@ class Simulation:
             # reset
             self._model_with_set_params = None
             self._built_model = None
+            self._built_model_template = None
             self.op_conds_to_built_models = None
+            self.op_conds_to_built_model_templates = None
             self.op_conds_to_built_solvers = None
 
         options = self.model.options
@@ -395,7 +635,11 @@ class Simulation:
         if options["open-circuit potential"] == "MSMR":
             self._parameter_values = (
                 self._unprocessed_parameter_values.set_initial_ocps(
-                    initial_soc, param=param, inplace=False, options=options
+                    initial_soc,
+                    param=param,
+                    inplace=False,
+                    options=options,
+                    esoh_solver=self._get_initial_soc_esoh_solver(),
                 )
             )
         elif options["working electrode"] == "positive":
@@ -407,13 +651,40 @@ class Simulation:
         else:
             self._parameter_values = (
                 self._unprocessed_parameter_values.set_initial_stoichiometries(
-                    initial_soc, param=param, inplace=False, options=options
+                    initial_soc,
+                    param=param,
+                    inplace=False,
+                    options=options,
+                    esoh_solver=self._get_initial_soc_esoh_solver(),
                 )
             )
 
         # Save solved initial SOC in case we need to re-build the model
         self._built_initial_soc = initial_soc
 
+    def _get_initial_soc_esoh_solver(self):
+        """
+        The eSOH solver used to set the initial SOC, which is kept (with its cached
+        solutions) as long as the values of the unprocessed parameters do not change
+        """
+        esoh_solver = self._initial_soc_esoh_solver
+        if (
+            esoh_solver is None
+            or esoh_solver._set_up_mismatch(
+                self._unprocessed_parameter_values,
+                self._model.param,
+                options=self.model.options,
+            )
+            is not None
+        ):
+            esoh_solver = pybamm.lithium_ion.ElectrodeSOHSolver(
+                self._unprocessed_parameter_values,
+                self._model.param,
+                options=self.model.options,
+            )
+            self._initial_soc_esoh_solver = esoh_solver
+        return esoh_solver
+
     def build(self, check_model=True, initial_soc=None):
         """
         A method to build the model into a system of matrices and vectors suitable for
@@ -440,6 +711,9 @@ class Simulation:
         elif self._model.is_discretised:
             self._model_with_set_params = self._model
             self._built_model = self._model
+        elif self._model_cache is not None and self._load_from_cache():
+            # rebuilt model so clear solver setup
+            self._solver._model_set_up = {}
         else:
             self.set_parameters()
             self._mesh = pybamm.Mesh(self._geometry, self._submesh_types, self._var_pts)
@@ -449,6 +723,86 @@ class Simulation:
             )
             # rebuilt model so clear solver setup
             self._solver._model_set_up = {}
+            if self._model_cache is not None and self._cache_key is not None:
+                self._save_to_cache()
+
+        if self._updatable_parameters:
+            # The built model, in which the updatable parameters are inputs, is kept
+            # to substitute their values again when they are updated
+            self._built_model_template = self._built_model
+            self._built_model = self._substitute_updatable_parameters(
+                {None: self._built_model_template}
+            )[None]
+
+    def _load_from_cache(self):
+        """
+        Load the built model from the model cache, if it is there. Returns True if
+        the model was loaded.
+        """
+        # The geometry only needs numerical values for the key, and processing it
+        # is cheap compared to processing the model
+        self._parameter_values.process_geometry(self._geometry)
+        self._cache_key = self._model_cache.key(
+            self._unprocessed_model,
+            self._get_parameter_values_for_processing(),
+            self._geometry,
+            self._submesh_types,
+            self._var_pts,
+            self._spatial_methods,
+        )
+        if self._cache_key is None:
+            return False
+        entry = self._model_cache.load(self._cache_key)
+        if entry is None:
+            return False
+
+        pybamm.logger.info("Loading built model from cache")
+        self._model_with_set_params = entry["model_with_set_params"]
+        self._model = self._model_with_set_params
+        self._mesh = entry["mesh"]
+        self._disc = pybamm.Discretisation(self._mesh, self._spatial_methods)
+        self._built_model = entry["built_model"]
+        self._cache_solver_key = entry["solver_key"]
+        return True
+
+    def _save_to_cache(self, solver_key=None):
+        """
+        Save the built model to the model cache. If `solver_key` is given, the
+        built model has been set up by a solver with that key.
+        """
+        self._model_cache.save(
+            self._cache_key,
+            {
+                "model_with_set_params": self._model_with_set_params,
+                "mesh": self._mesh,
+                "built_model": self._built_model,
+                "solver_key": solver_key,
+            },
+        )
+        self._cache_solver_key = solver_key
+
+    def _get_cache_solver_key(self, solver, kwargs):
+        """
+        Return the key identifying the solver set-up for the built model, or None
+        if the set-up cannot be cached (e.g. because the solver keeps part of the
+        set-up itself)
+        """
+        if (
+            type(solver).set_up is not pybamm.BaseSolver.set_up
+            or solver.output_variables
+            or self._updatable_parameters
+            or self._built_model.convert_to_format != "casadi"
+        ):
+            return None
+        inputs = kwargs.get("inputs") or {}
+        if isinstance(inputs, list):
+            inputs = inputs[0]
+        calculate_sensitivities = kwargs.get("calculate_sensitivities", False)
+        if calculate_sensitivities is True:
+            calculate_sensitivities = list(inputs.keys())
+        elif calculate_sensitivities is False:
+            calculate_sensitivities = []
+        return pybamm.ModelCache.solver_key(solver, inputs, calculate_sensitivities)
 
     def build_for_experiment(self, check_model=True, initial_soc=None):
         """
@@ -472,19 +826,178 @@ class Simulation:
             # Process all the different models
             self.op_conds_to_built_models = {}
             self.op_conds_to_built_solvers = {}
+            # Steps that only differ in their inputs share a model, which is only
+            # built once, and a solver
+            built_models_and_solvers = {}
             for (
                 op_cond,
                 model_with_set_params,
             ) in self.experiment_unique_steps_to_model.items():
-                # It's ok to modify the model with set parameters in place as it's
-                # not returned anywhere
-                built_model = self._disc.process_model(
-                    model_with_set_params, inplace=True, check_model=check_model
-                )
-                solver = self._solver.copy()
+                if id(model_with_set_params) not in built_models_and_solvers:
+                    # It's ok to modify the model with set parameters in place as
+                    # it's not returned anywhere
+                    built_model = self._disc.process_model(
+                        model_with_set_params, inplace=True, check_model=check_model
+                    )
+                    solver = self._solver.copy()
+                    built_models_and_solvers[id(model_with_set_params)] = (
+                        built_model,
+                        solver,
+                    )
+                built_model, solver = built_models_and_solvers[
+                    id(model_with_set_params)
+                ]
                 self.op_conds_to_built_solvers[op_cond] = solver
                 self.op_conds_to_built_models[op_cond] = built_model
 
+            if self._updatable_parameters:
+                self.op_conds_to_built_model_templates = self.op_conds_to_built_models
+                self.op_conds_to_built_models = self._substitute_updatable_parameters(
+                    self.op_conds_to_built_model_templates
+                )
+
+    def update_parameters(self, values):
+        """
+        Update the values of some parameters of the simulation.
+
+        If all the parameters are in the `updatable_parameters` of the simulation,
+        the new values are substituted in the built model(s), without processing
+        and discretising the model again. Only the variables that depend on the
+        updated parameters are processed again by the solution, and if only the
+        initial conditions of the model change, the solver only sets up the initial
+        conditions again. Otherwise, the simulation is built again the next time it
+        is solved.
+
+        Parameters
+        ----------
+        values : dict
+            The new values of the parameters, with the names of the parameters as
+            keys
+        """
+        parameter_values = self._unprocessed_parameter_values.copy()
+        parameter_values.update(values)
+        substitute = all(name in self._updatable_parameters for name in values)
+        if substitute:
+            for name in values:
+                if not isinstance(parameter_values[name], numbers.Number):
+                    raise ValueError(
+                        f"Updatable parameter '{name}' must have a numerical value"
+                    )
+
+        self._unprocessed_parameter_values = parameter_values
+        initial_soc = self._built_initial_soc
+        if substitute and initial_soc is None:
+            self._parameter_values = parameter_values
+            if self._built_model_template is not None:
+                self._built_model = self._substitute_updatable_parameters(
+                    {None: self._built_model_template},
+                    {None: self._built_model},
+                    {None: self._solver},
+                )[None]
+            if self.op_conds_to_built_model_templates is not None:
+                self.op_conds_to_built_models = self._substitute_updatable_parameters(
+                    self.op_conds_to_built_model_templates,
+                    self.op_conds_to_built_models,
+                    self.op_conds_to_built_solvers,
+                )
+        else:
+            # Build again, with the same initial SOC if it was given
+            self._parameter_values = parameter_values
+            self._built_initial_soc = None
+            self._model_with_set_params = None
+            self._built_model = None
+            self._built_model_template = None
+            self.op_conds_to_built_models = None
+            self.op_conds_to_built_model_templates = None
+            self.op_conds_to_built_solvers = None
+            if initial_soc is not None:
+                self.set_initial_soc(initial_soc)
+
+    def _substitute_updatable_parameters(
+        self, templates, built_models=None, solvers=None
+    ):
+        """
+        Substitute the values of the updatable parameters in the templates of the
+        built models, i.e. the built models in which these parameters are inputs.
+
+        Parameters
+        ----------
+        templates : dict
+            The templates of the built models. Several keys can share a template.
+        built_models : dict, optional
+            The built models with the previous values of the parameters, with the
+            same keys as `templates`. If given, the casadi functions of the
+            variables and the set-up of the solvers are reused where possible.
+        solvers : dict, optional
+            The solvers of the built models, with the same keys as `templates`
+
+        Returns
+        -------
+        dict
+            The built models with the current values of the parameters
+        """
+        substitution = pybamm.InputSubstitution(
+            {name: self._parameter_values[name] for name in self._updatable_parameters}
+        )
+        new_models = {}
+        template_models = {}
+        for key, template in templates.items():
+            if id(template) not in template_models:
+                new_model = substitution.process_model(template)
+                if built_models is not None:
+                    new_model = self._reuse_set_up(
+                        built_models[key], new_model, solvers[key]
+                    )
+                template_models[id(template)] = new_model
+            new_models[key] = template_models[id(template)]
+        return new_models
+
+    def _reuse_set_up(self, old_model, new_model, solver):
+        """
+        Reuse the parts of the set-up of `old_model` (a built model with the
+        previous values of the updatable parameters) that do not depend on the new
+        values in `new_model`, and release `old_model` from the solver.
+        """
+        old_variables = old_model.variables_and_events
+        new_variables = new_model.variables_and_events
+        variables_casadi = {
+            name: var_casadi
+            for name, var_casadi in old_model._variables_casadi.items()
+            if name in new_variables and new_variables[name] == old_variables[name]
+        }
+
+        set_up = solver._model_set_up.pop(old_model, None)
+        if isinstance(solver, pybamm.CasadiSolver):
+            integrators = solver.integrators.pop(old_model, None)
+            integrator_specs = solver.integrator_specs.pop(old_model, None)
+        if (
+            set_up is not None
+            and new_model.concatenated_rhs == old_model.concatenated_rhs
+            and new_model.concatenated_algebraic == old_model.concatenated_algebraic
+            and [event.expression for event in new_model.events]
+            == [event.expression for event in old_model.events]
+        ):
+            # Only the initial conditions or the variables have changed, so the
+            # functions generated by the solver can be kept and the solver only
+            # sets up the initial conditions again (see BaseSolver.solve)
+            set_up_model = old_model.new_copy()
+            set_up_model.initial_conditions = new_model.initial_conditions
+            set_up_model.concatenated_initial_conditions = (
+                new_model.concatenated_initial_conditions
+            )
+            set_up_model.variables = new_model.variables
+            set_up_model.__dict__.pop("_variables_and_events", None)
+            new_model = set_up_model
+            solver._model_set_up[new_model] = set_up
+            if isinstance(solver, pybamm.CasadiSolver):
+                if integrators is not None:
+                    solver.integrators[new_model] = integrators
+                if integrator_specs is not None:
+                    solver.integrator_specs[new_model] = integrator_specs
+
+        new_model._variables_casadi = variables_casadi
+        return new_model
+
     def solve(
         self,
         t_eval=None,
@@ -496,6 +1009,12 @@ class Simulation:
         initial_soc=None,
         callbacks=None,
         showprogress=False,
+        storage=None,
+        output_tolerances=None,
+        sink=None,
+        checkpoint_file=None,
+        checkpoint_every=1,
+        resume_from=None,
         **kwargs,
     ):
         """
@@ -529,10 +1048,15 @@ class Simulation:
             Which cycles to save the full sub-solutions for. If None, all cycles are
             saved. If int, every multiple of save_at_cycles is saved. If list, every
             cycle in the list is saved. The first cycle (cycle 1) is always saved.
-        calc_esoh : bool, optional
+        calc_esoh : bool or str, optional
             Whether to include eSOH variables in the summary variables. If `False`
             then only summary variables that do not require the eSOH calculation
-            are calculated. Default is True.
+            are calculated. If "batch", the eSOH variables of all the cycles are
+            calculated together at the end of the experiment (see
+            :meth:`pybamm.Solution.calculate_esoh_summary_variables`), so they are
+            not available to the callbacks and sinks; this is not possible if the
+            experiment has a capacity termination, in which case they are calculated
+            at the end of each cycle. Default is True.
         starting_solution : :class:`pybamm.Solution`
             The solution to start stepping from. If None (default), then self._solution
             is used. Must be None if not using an experiment.
@@ -547,6 +1071,46 @@ class Simulation:
             Whether to show a progress bar for cycling. If true, shows a progress bar
             for cycles. Has no effect when not used with an experiment.
             Default is False.
+        storage : :class:`pybamm.MemmapStorage`, optional
+            Storage in which to write the states of the solution as it is computed
+            (after each step, when using an experiment), instead of keeping them in
+            memory. Default is None.
+        output_tolerances : dict, optional
+            Absolute tolerances on some variables, with the names of the variables
+            as keys. If given, the solution (or the solution of each step, when using
+            an experiment) is thinned with :meth:`pybamm.Solution.thin`, so that
+            only the times needed to reproduce these variables by linear
+            interpolation are kept. The period of the experiment then sets the
+            finest resolution of the solution, rather than the number of points in
+            each step. Default is None, in which case all the times are kept.
+        sink : :class:`pybamm.SolutionSink`, optional
+            Sink to which the solution of each step and cycle of an experiment is
+            handed as soon as it has been solved, e.g. to write it to a file (see
+            :class:`pybamm.DataFileSink`). The solutions of the cycles are then
+            released instead of being kept in the solution (`save_at_cycles` is
+            ignored), and the returned solution only contains the last state, the
+            summary variables and the first state of each cycle, so that long
+            experiments run in constant memory. The experiment can be continued by
+            passing the returned solution as `starting_solution`. Can only be used
+            with an experiment. Default is None.
+        checkpoint_file : str, optional
+            File to which a checkpoint of the experiment is written every
+            `checkpoint_every` cycles and at the end of the experiment, so that the
+            experiment can be resumed with `resume_from` (e.g. after a crash). A
+            checkpoint only holds the last state, the position in the experiment,
+            the summary variables and the first state of each cycle. Can only be used
+            with an experiment. Default is None.
+        checkpoint_every : int, optional
+            The number of cycles between checkpoints. Default is 1.
+        resume_from : str, optional
+            Checkpoint file, written by a simulation with the same experiment and
+            model, from which to resume the experiment. The experiment continues
+            with the first step of the cycle after the last cycle in the checkpoint.
+            The `cycles` of the returned solution only contain the cycles solved
+            after resuming (so `cycles[0]` is the first cycle after the checkpoint,
+            and callbacks are given the cycle numbers of the whole experiment),
+            while its summary variables and first states are those of all the
+            cycles. Cannot be used with `starting_solution`. Default is None.
         **kwargs
             Additional key-word arguments passed to `solver.solve`.
             See :meth:`pybamm.BaseSolver.solve`.
@@ -559,7 +1123,13 @@ class Simulation:
         logs = {}
 
         if self.operating_mode in ["without experiment", "drive cycle"]:
+            if sink is not None:
+                raise ValueError("`sink` can only be used with an experiment")
+            if checkpoint_file is not None or resume_from is not None:
+                raise ValueError("Checkpoints can only be used with an experiment")
             self.build(check_model=check_model, initial_soc=initial_soc)
+            if self._sweep_parameters:
+                kwargs["inputs"] = self._add_sweep_inputs(kwargs.get("inputs"))
             if save_at_cycles is not None:
                 raise ValueError(
                     "'save_at_cycles' option can only be used if simulating an "
@@ -630,15 +1200,65 @@ class Simulation:
                             pybamm.SolverWarning,
                         )
 
+            solver_key = None
+            if self._model_cache is not None and self._cache_key is not None:
+                solver_key = self._get_cache_solver_key(solver, kwargs)
+                if (
+                    solver_key is not None
+                    and solver_key == self._cache_solver_key
+                    and not solver._model_set_up
+                ):
+                    # The cached model carries the functions generated when it
+                    # was set up, so the solver can skip its own set-up
+                    solver._model_set_up = {
+                        self.built_model: {
+                            "initial conditions": (
+                                self.built_model.concatenated_initial_conditions
+                            )
+                        }
+                    }
+
             self._solution = solver.solve(self.built_model, t_eval, **kwargs)
 
+            if (
+                solver_key is not None
+                and solver_key != self._cache_solver_key
+                and self.built_model in solver._model_set_up
+            ):
+                self._save_to_cache(solver_key)
+
+            if output_tolerances is not None:
+                if isinstance(self._solution, list):
+                    self._solution = [
+                        sol.thin(output_tolerances) for sol in self._solution
+                    ]
+                else:
+                    self._solution = self._solution.thin(output_tolerances)
+
+            if storage is not None:
+                storage.store_solution(self._solution)
+
         elif self.operating_mode == "with experiment":
             callbacks.on_experiment_start(logs)
             self.build_for_experiment(check_model=check_model, initial_soc=initial_soc)
+            if self._sweep_parameters:
+                kwargs["inputs"] = self._add_sweep_inputs(kwargs.get("inputs"))
             if t_eval is not None:
                 pybamm.logger.warning(
                     "Ignoring t_eval as solution times are specified by the experiment"
                 )
+            # Resume from a checkpoint, by starting from its last state and skipping
+            # the cycles that have already been solved
+            cycles_done = 0
+            step_index = 0
+            if resume_from is not None:
+                if starting_solution is not None:
+                    raise ValueError(
+                        "Cannot resume from a checkpoint with a `starting_solution`"
+                    )
+                starting_solution, cycles_done, step_index = self._load_checkpoint(
+                    resume_from
+                )
             # Re-initialize solution, e.g. for solving multiple times with different
             # inputs without having to build the simulation again
             self._solution = starting_solution
@@ -648,6 +1268,13 @@ class Simulation:
 
             # Set up eSOH solver (for summary variables)
             esoh_solver = self.get_esoh_solver(calc_esoh)
+            # The eSOH variables of each cycle are needed for a capacity termination
+            batch_esoh = (
+                esoh_solver is not None
+                and calc_esoh == "batch"
+                and "capacity" not in self.experiment.termination
+            )
+            cycle_esoh_solver = None if batch_esoh else esoh_solver
 
             if starting_solution is None:
                 starting_solution_cycles = []
@@ -660,7 +1287,7 @@ class Simulation:
                     cycle_first_state,
                 ) = pybamm.make_cycle_solution(
                     [starting_solution],
-                    esoh_solver=esoh_solver,
+                    esoh_solver=cycle_esoh_solver,
                     save_this_cycle=True,
                 )
                 starting_solution_cycles = [cycle_solution]
@@ -690,7 +1317,11 @@ class Simulation:
                     "must have a `start_time` too."
                 )
 
-            cycle_offset = len(starting_solution_cycles)
+            if resume_from is None:
+                cycle_offset = len(starting_solution_cycles)
+            else:
+                # The cycles in the checkpoint are only kept as summary variables
+                cycle_offset = cycles_done
             all_cycle_solutions = starting_solution_cycles
             all_summary_variables = starting_solution_summary_variables
             all_first_states = starting_solution_first_states
@@ -699,291 +1330,383 @@ class Simulation:
             voltage_stop = self.experiment.termination.get("voltage")
             logs["stopping conditions"] = {"voltage": voltage_stop}
 
-            idx = 0
-            num_cycles = len(self.experiment.cycle_lengths)
+            idx = step_index
+            num_cycles = len(self.experiment.cycle_lengths) - cycles_done
             feasible = True  # simulation will stop if experiment is infeasible
 
-            # Add initial padding rest if current time is earlier than first start time
-            # This could be the case when using a starting solution
-            if starting_solution is not None:
-                op_conds = self.experiment.operating_conditions_steps[0]
-                if op_conds.start_time is not None:
-                    rest_time = (
-                        op_conds.start_time
-                        - (
-                            initial_start_time
-                            + timedelta(seconds=float(current_solution.t[-1]))
-                        )
-                    ).total_seconds()
-                    if rest_time > pybamm.settings.step_start_offset:
-                        # logs["step operating conditions"] = "Initial rest for padding"
-                        # callbacks.on_step_start(logs)
-
-                        kwargs["inputs"] = {
-                            **user_inputs,
-                            "Ambient temperature [K]": (
-                                op_conds.temperature or self._original_temperature
-                            ),
-                            "start time": current_solution.t[-1],
-                        }
-                        steps = current_solution.cycles[-1].steps
-                        step_solution = current_solution.cycles[-1].steps[-1]
-
-                        step_solution_with_rest = self.run_padding_rest(
-                            kwargs, rest_time, step_solution
-                        )
-                        steps[-1] = step_solution + step_solution_with_rest
-
-                        cycle_solution, _, _ = pybamm.make_cycle_solution(
-                            steps, esoh_solver=esoh_solver, save_this_cycle=True
-                        )
-                        old_cycles = current_solution.cycles.copy()
-                        old_cycles[-1] = cycle_solution
-                        current_solution += step_solution_with_rest
-                        current_solution.cycles = old_cycles
-
-                        # Update _solution
-                        self._solution = current_solution
-
-            # check if a user has tqdm installed
-            if showprogress:
-                tqdm = have_optional_dependency("tqdm")
-                cycle_lengths = tqdm.tqdm(
-                    self.experiment.cycle_lengths,
-                    desc="Cycling",
-                )
-            else:
-                cycle_lengths = self.experiment.cycle_lengths
-
-            for cycle_num, cycle_length in enumerate(
-                cycle_lengths,
-                start=1,
-            ):
-                logs["cycle number"] = (
-                    cycle_num + cycle_offset,
-                    num_cycles + cycle_offset,
-                )
-                logs["elapsed time"] = timer.time()
-                callbacks.on_cycle_start(logs)
-
-                steps = []
-                cycle_solution = None
-
-                # Decide whether we should save this cycle
-                save_this_cycle = (
-                    # always save cycle 1
-                    cycle_num == 1
-                    # always save last cycle
-                    or cycle_num == num_cycles
-                    # None: save all cycles
-                    or save_at_cycles is None
-                    # list: save all cycles in the list
-                    or (
-                        isinstance(save_at_cycles, list)
-                        and cycle_num + cycle_offset in save_at_cycles
-                    )
-                    # int: save all multiples
-                    or (
-                        isinstance(save_at_cycles, int)
-                        and (cycle_num + cycle_offset) % save_at_cycles == 0
-                    )
-                )
-                for step_num in range(1, cycle_length + 1):
-                    # Use 1-indexing for printing cycle number as it is more
-                    # human-intuitive
-                    op_conds = self.experiment.operating_conditions_steps[idx]
-
-                    # Hacky patch to allow correct processing of end_time and next_starting time
-                    # For efficiency purposes, op_conds treats identical steps as the same object
-                    # regardless of the initial time. Should be refactored as part of #3176
-                    op_conds_unproc = (
-                        self.experiment.operating_conditions_steps_unprocessed[idx]
-                    )
-
-                    start_time = current_solution.t[-1]
-
-                    # If step has an end time, dt must take that into account
-                    if getattr(op_conds_unproc, "end_time", None):
-                        dt = min(
-                            op_conds.duration,
-                            (
-                                op_conds_unproc.end_time
-                                - (
-                                    initial_start_time
-                                    + timedelta(seconds=float(start_time))
-                                )
-                            ).total_seconds(),
-                        )
-                    else:
-                        dt = op_conds.duration
-                    op_conds_str = str(op_conds)
-                    model = self.op_conds_to_built_models[op_conds.basic_repr()]
-                    solver = self.op_conds_to_built_solvers[op_conds.basic_repr()]
-
-                    logs["step number"] = (step_num, cycle_length)
-                    logs["step operating conditions"] = op_conds_str
-                    callbacks.on_step_start(logs)
-
-                    kwargs["inputs"] = {
-                        **user_inputs,
-                        "start time": start_time,
-                    }
-                    # Make sure we take at least 2 timesteps
-                    npts = max(int(round(dt / op_conds.period)) + 1, 2)
-                    try:
-                        step_solution = solver.step(
-                            current_solution,
-                            model,
-                            dt,
-                            npts=npts,
-                            save=False,
-                            **kwargs,
-                        )
-                    except pybamm.SolverError as error:
-                        if (
-                            "non-positive at initial conditions" in error.message
-                            and "[experiment]" in error.message
-                        ):
-                            step_solution = pybamm.EmptySolution(
-                                "Event exceeded in initial conditions", t=start_time
-                            )
-                        else:
-                            logs["error"] = error
-                            callbacks.on_experiment_error(logs)
-                            feasible = False
-                            # If none of the cycles worked, raise an error
-                            if cycle_num == 1 and step_num == 1:
-                                raise error
-                            # Otherwise, just stop this cycle
-                            break
-
-                    step_termination = step_solution.termination
-
-                    # Add a padding rest step if necessary
-                    if getattr(op_conds_unproc, "next_start_time", None) is not None:
+            # Make sure that the sink is closed (and its files flushed) even if the
+            # experiment fails or is interrupted
+            try:
+                # Add initial padding rest if current time is earlier than first start
+                # time
+                # This could be the case when using a starting solution
+                if starting_solution is not None and resume_from is None:
+                    op_conds = self.experiment.operating_conditions_steps[0]
+                    if op_conds.start_time is not None:
                         rest_time = (
-                            op_conds_unproc.next_start_time
+                            op_conds.start_time
                             - (
                                 initial_start_time
-                                + timedelta(seconds=float(step_solution.t[-1]))
+                                + timedelta(seconds=float(current_solution.t[-1]))
                             )
                         ).total_seconds()
                         if rest_time > pybamm.settings.step_start_offset:
-                            logs["step number"] = (step_num, cycle_length)
-                            logs["step operating conditions"] = "Rest for padding"
-                            callbacks.on_step_start(logs)
+                            # logs["step operating conditions"] = (
+                            #     "Initial rest for padding"
+                            # )
+                            # callbacks.on_step_start(logs)
 
                             kwargs["inputs"] = {
                                 **user_inputs,
                                 "Ambient temperature [K]": (
                                     op_conds.temperature or self._original_temperature
                                 ),
-                                "start time": step_solution.t[-1],
+                                "start time": current_solution.t[-1],
                             }
+                            steps = current_solution.cycles[-1].steps
+                            step_solution = current_solution.cycles[-1].steps[-1]
 
                             step_solution_with_rest = self.run_padding_rest(
                                 kwargs, rest_time, step_solution
                             )
-                            step_solution += step_solution_with_rest
+                            steps[-1] = step_solution + step_solution_with_rest
 
-                    steps.append(step_solution)
+                            cycle_solution, _, _ = pybamm.make_cycle_solution(
+                                steps,
+                                esoh_solver=cycle_esoh_solver,
+                                save_this_cycle=True,
+                            )
+                            old_cycles = current_solution.cycles.copy()
+                            old_cycles[-1] = cycle_solution
+                            current_solution += step_solution_with_rest
+                            current_solution.cycles = old_cycles
+
+                            # Update _solution
+                            self._solution = current_solution
+
+                # check if a user has tqdm installed
+                if showprogress:
+                    tqdm = have_optional_dependency("tqdm")
+                    cycle_lengths = tqdm.tqdm(
+                        self.experiment.cycle_lengths[cycles_done:],
+                        desc="Cycling",
+                    )
+                else:
+                    cycle_lengths = self.experiment.cycle_lengths[cycles_done:]
 
-                    cycle_solution = cycle_solution + step_solution
-                    current_solution = cycle_solution
+                for cycle_num, cycle_length in enumerate(
+                    cycle_lengths,
+                    start=1,
+                ):
+                    logs["cycle number"] = (
+                        cycle_num + cycle_offset,
+                        num_cycles + cycle_offset,
+                    )
+                    logs["elapsed time"] = timer.time()
+                    callbacks.on_cycle_start(logs)
+
+                    steps = []
+                    cycle_solution = None
+
+                    # Decide whether we should save this cycle
+                    save_this_cycle = sink is None and (
+                        # always save cycle 1
+                        cycle_num == 1
+                        # always save last cycle
+                        or cycle_num == num_cycles
+                        # None: save all cycles
+                        or save_at_cycles is None
+                        # list: save all cycles in the list
+                        or (
+                            isinstance(save_at_cycles, list)
+                            and cycle_num + cycle_offset in save_at_cycles
+                        )
+                        # int: save all multiples
+                        or (
+                            isinstance(save_at_cycles, int)
+                            and (cycle_num + cycle_offset) % save_at_cycles == 0
+                        )
+                    )
+                    for step_num in range(1, cycle_length + 1):
+                        # Use 1-indexing for printing cycle number as it is more
+                        # human-intuitive
+                        op_conds = self.experiment.operating_conditions_steps[idx]
+
+                        # Hacky patch to allow correct processing of end_time and
+                        # next_starting time
+                        # For efficiency purposes, op_conds treats identical steps as
+                        # the same object regardless of the initial time. Should be
+                        # refactored as part of #3176
+                        op_conds_unproc = (
+                            self.experiment.operating_conditions_steps_unprocessed[idx]
+                        )
 
-                    callbacks.on_step_end(logs)
+                        start_time = current_solution.t[-1]
+
+                        # If step has an end time, dt must take that into account
+                        if getattr(op_conds_unproc, "end_time", None):
+                            dt = min(
+                                op_conds.duration,
+                                (
+                                    op_conds_unproc.end_time
+                                    - (
+                                        initial_start_time
+                                        + timedelta(seconds=float(start_time))
+                                    )
+                                ).total_seconds(),
+                            )
+                        else:
+                            dt = op_conds.duration
+                        op_conds_str = str(op_conds)
+                        model = self.op_conds_to_built_models[op_conds.basic_repr()]
+                        solver = self.op_conds_to_built_solvers[op_conds.basic_repr()]
 
-                    logs["termination"] = step_solution.termination
-                    # Only allow events specified by experiment
-                    if not (
-                        isinstance(step_solution, pybamm.EmptySolution)
-                        or step_termination == "final time"
-                        or "[experiment]" in step_termination
-                    ):
-                        callbacks.on_experiment_infeasible(logs)
-                        feasible = False
-                        break
+                        logs["step number"] = (step_num, cycle_length)
+                        logs["step operating conditions"] = op_conds_str
+                        callbacks.on_step_start(logs)
 
-                    # Increment index for next iteration
-                    idx += 1
-
-                if save_this_cycle or feasible is False:
-                    self._solution = self._solution + cycle_solution
-
-                # At the final step of the inner loop we save the cycle
-                if len(steps) > 0:
-                    # Check for EmptySolution
-                    if all(isinstance(step, pybamm.EmptySolution) for step in steps):
-                        if len(steps) == 1:
-                            raise pybamm.SolverError(
-                                f"Step '{op_conds_str}' is infeasible "
-                                "due to exceeded bounds at initial conditions. "
-                                "If this step is part of a longer cycle, "
-                                "round brackets should be used to indicate this, "
-                                "e.g.:\n pybamm.Experiment([(\n"
-                                "\tDischarge at C/5 for 10 hours or until 3.3 V,\n"
-                                "\tCharge at 1 A until 4.1 V,\n"
-                                "\tHold at 4.1 V until 10 mA\n"
-                                "])"
+                        kwargs["inputs"] = {
+                            **user_inputs,
+                            **self.experiment_unique_steps_to_inputs[
+                                op_conds.basic_repr()
+                            ],
+                            "start time": start_time,
+                        }
+                        # Make sure we take at least 2 timesteps
+                        npts = max(int(round(dt / op_conds.period)) + 1, 2)
+                        try:
+                            step_solution = solver.step(
+                                current_solution,
+                                model,
+                                dt,
+                                npts=npts,
+                                save=False,
+                                **kwargs,
                             )
+                        except pybamm.SolverError as error:
+                            if (
+                                "non-positive at initial conditions" in error.message
+                                and "[experiment]" in error.message
+                            ):
+                                step_solution = pybamm.EmptySolution(
+                                    "Event exceeded in initial conditions", t=start_time
+                                )
+                            else:
+                                logs["error"] = error
+                                callbacks.on_experiment_error(logs)
+                                feasible = False
+                                # If none of the cycles worked, raise an error
+                                if cycle_num == 1 and step_num == 1:
+                                    raise error
+                                # Otherwise, just stop this cycle
+                                break
+
+                        step_termination = step_solution.termination
+
+                        # Add a padding rest step if necessary
+                        if (
+                            getattr(op_conds_unproc, "next_start_time", None)
+                            is not None
+                        ):
+                            rest_time = (
+                                op_conds_unproc.next_start_time
+                                - (
+                                    initial_start_time
+                                    + timedelta(seconds=float(step_solution.t[-1]))
+                                )
+                            ).total_seconds()
+                            if rest_time > pybamm.settings.step_start_offset:
+                                logs["step number"] = (step_num, cycle_length)
+                                logs["step operating conditions"] = "Rest for padding"
+                                callbacks.on_step_start(logs)
+
+                                kwargs["inputs"] = {
+                                    **user_inputs,
+                                    "Ambient temperature [K]": (
+                                        op_conds.temperature
+                                        or self._original_temperature
+                                    ),
+                                    "start time": step_solution.t[-1],
+                                }
+
+                                step_solution_with_rest = self.run_padding_rest(
+                                    kwargs, rest_time, step_solution
+                                )
+                                step_solution += step_solution_with_rest
+
+                        if output_tolerances is not None and isinstance(
+                            step_solution, pybamm.Solution
+                        ):
+                            step_solution = step_solution.thin(output_tolerances)
+
+                        if storage is not None and isinstance(
+                            step_solution, pybamm.Solution
+                        ):
+                            storage.store_solution(step_solution)
+
+                        steps.append(step_solution)
+
+                        if isinstance(cycle_solution, pybamm.Solution):
+                            # Append in place, so that the cost of each step does not
+                            # grow with the number of steps in the cycle
+                            cycle_solution.append(step_solution)
                         else:
-                            this_cycle = self.experiment.operating_conditions_cycles[
-                                cycle_num - 1
-                            ]
-                            raise pybamm.SolverError(
-                                f"All steps in the cycle {this_cycle} are infeasible "
-                                "due to exceeded bounds at initial conditions."
-                            )
-                    cycle_sol = pybamm.make_cycle_solution(
-                        steps, esoh_solver=esoh_solver, save_this_cycle=save_this_cycle
-                    )
-                    cycle_solution, cycle_sum_vars, cycle_first_state = cycle_sol
-                    all_cycle_solutions.append(cycle_solution)
-                    all_summary_variables.append(cycle_sum_vars)
-                    all_first_states.append(cycle_first_state)
-
-                    logs["summary variables"] = cycle_sum_vars
-
-                # Calculate capacity_start using the first cycle
-                if cycle_num == 1:
-                    # Note capacity_start could be defined as
-                    # self._parameter_values["Nominal cell capacity [A.h]"] instead
-                    if "capacity" in self.experiment.termination:
-                        capacity_start = all_summary_variables[0]["Capacity [A.h]"]
-                        logs["start capacity"] = capacity_start
-                        value, typ = self.experiment.termination["capacity"]
-                        if typ == "Ah":
-                            capacity_stop = value
-                        elif typ == "%":
-                            capacity_stop = value / 100 * capacity_start
-                    else:
-                        capacity_stop = None
-                    logs["stopping conditions"]["capacity"] = capacity_stop
-
-                logs["elapsed time"] = timer.time()
-                callbacks.on_cycle_end(logs)
-
-                # Break if stopping conditions are met
-                # Logging is done in the callbacks
-                if capacity_stop is not None:
-                    capacity_now = cycle_sum_vars["Capacity [A.h]"]
-                    if not np.isnan(capacity_now) and capacity_now <= capacity_stop:
-                        break
+                            cycle_solution = cycle_solution + step_solution
+                        current_solution = cycle_solution
+
+                        if sink is not None:
+                            sink.write_step(step_solution, logs)
+                        callbacks.on_step_end(logs)
+
+                        logs["termination"] = step_solution.termination
+                        # Only allow events specified by experiment
+                        if not (
+                            isinstance(step_solution, pybamm.EmptySolution)
+                            or step_termination == "final time"
+                            or "[experiment]" in step_termination
+                        ):
+                            callbacks.on_experiment_infeasible(logs)
+                            feasible = False
+                            break
+
+                        # Increment index for next iteration
+                        idx += 1
+
+                    if sink is None and (save_this_cycle or feasible is False):
+                        if (
+                            isinstance(self._solution, pybamm.Solution)
+                            and self._solution is not starting_solution
+                        ):
+                            self._solution.append(cycle_solution)
+                        else:
+                            self._solution = self._solution + cycle_solution
+
+                    # At the final step of the inner loop we save the cycle
+                    if len(steps) > 0:
+                        # Check for EmptySolution
+                        if all(
+                            isinstance(step, pybamm.EmptySolution) for step in steps
+                        ):
+                            if len(steps) == 1:
+                                raise pybamm.SolverError(
+                                    f"Step '{op_conds_str}' is infeasible "
+                                    "due to exceeded bounds at initial conditions. "
+                                    "If this step is part of a longer cycle, "
+                                    "round brackets should be used to indicate this, "
+                                    "e.g.:\n pybamm.Experiment([(\n"
+                                    "\tDischarge at C/5 for 10 hours or until 3.3 V,\n"
+                                    "\tCharge at 1 A until 4.1 V,\n"
+                                    "\tHold at 4.1 V until 10 mA\n"
+                                    "])"
+                                )
+                            else:
+                                this_cycle = (
+                                    self.experiment.operating_conditions_cycles[
+                                        cycle_num - 1
+                                    ]
+                                )
+                                raise pybamm.SolverError(
+                                    f"All steps in the cycle {this_cycle} are "
+                                    "infeasible due to exceeded bounds at initial "
+                                    "conditions."
+                                )
+                        cycle_sol = pybamm.make_cycle_solution(
+                            steps,
+                            esoh_solver=cycle_esoh_solver,
+                            save_this_cycle=save_this_cycle or sink is not None,
+                        )
+                        cycle_solution, cycle_sum_vars, cycle_first_state = cycle_sol
+                        if sink is not None:
+                            sink.write_cycle(cycle_solution, logs)
+                            # Release the solution of the cycle
+                            cycle_solution = None
+                        all_cycle_solutions.append(cycle_solution)
+                        all_summary_variables.append(cycle_sum_vars)
+                        all_first_states.append(cycle_first_state)
+
+                        logs["summary variables"] = cycle_sum_vars
+
+                    # Calculate capacity_start using the first cycle
+                    if cycle_num == 1:
+                        # Note capacity_start could be defined as
+                        # self._parameter_values["Nominal cell capacity [A.h]"] instead
+                        if "capacity" in self.experiment.termination:
+                            capacity_start = all_summary_variables[0]["Capacity [A.h]"]
+                            logs["start capacity"] = capacity_start
+                            value, typ = self.experiment.termination["capacity"]
+                            if typ == "Ah":
+                                capacity_stop = value
+                            elif typ == "%":
+                                capacity_stop = value / 100 * capacity_start
+                        else:
+                            capacity_stop = None
+                        logs["stopping conditions"]["capacity"] = capacity_stop
+
+                    logs["elapsed time"] = timer.time()
+                    callbacks.on_cycle_end(logs)
 
-                if voltage_stop is not None:
-                    min_voltage = cycle_sum_vars["Minimum voltage [V]"]
-                    if min_voltage <= voltage_stop[0]:
+                    if (
+                        checkpoint_file is not None
+                        and feasible
+                        and isinstance(current_solution, pybamm.Solution)
+                        and (cycles_done + cycle_num) % checkpoint_every == 0
+                    ):
+                        self._write_checkpoint(
+                            checkpoint_file,
+                            current_solution,
+                            cycles_done + cycle_num,
+                            idx,
+                            all_summary_variables,
+                            all_first_states,
+                            initial_start_time,
+                        )
+
+                    # Break if stopping conditions are met
+                    # Logging is done in the callbacks
+                    if capacity_stop is not None:
+                        capacity_now = cycle_sum_vars["Capacity [A.h]"]
+                        if not np.isnan(capacity_now) and capacity_now <= capacity_stop:
+                            break
+
+                    if voltage_stop is not None:
+                        min_voltage = cycle_sum_vars["Minimum voltage [V]"]
+                        if min_voltage <= voltage_stop[0]:
+                            break
+
+                    # Break if the experiment is infeasible (or errored)
+                    if feasible is False:
                         break
 
-                # Break if the experiment is infeasible (or errored)
-                if feasible is False:
-                    break
+                if checkpoint_file is not None and isinstance(
+                    current_solution, pybamm.Solution
+                ):
+                    # Final checkpoint, from which there is nothing left to resume
+                    self._write_checkpoint(
+                        checkpoint_file,
+                        current_solution,
+                        None,
+                        idx,
+                        all_summary_variables,
+                        all_first_states,
+                        initial_start_time,
+                    )
+            finally:
+                if sink is not None:
+                    sink.close()
+
+            if sink is not None:
+                # Only keep the state from which the experiment can be continued
+                if isinstance(current_solution, pybamm.Solution):
+                    self._solution = current_solution.last_state
 
             if self.solution is not None and len(all_cycle_solutions) > 0:
                 self.solution.cycles = all_cycle_solutions
                 self.solution.set_summary_variables(all_summary_variables)
                 self.solution.all_first_states = all_first_states
+                if batch_esoh:
+                    self.solution.calculate_esoh_summary_variables(esoh_solver)
 
+            logs["elapsed time"] = timer.time()
             callbacks.on_experiment_end(logs)
 
             # record initial_start_time of the solution
@@ -991,6 +1714,112 @@ class Simulation:
 
         return self.solution
 
+    def _write_checkpoint(
+        self,
+        filename,
+        solution,
+        cycles_completed,
+        step_index,
+        all_summary_variables,
+        all_first_states,
+        initial_start_time,
+    ):
+        """
+        Write a checkpoint of an experiment, see :meth:`Simulation.solve`.
+        `cycles_completed` is None once the experiment has finished.
+        """
+        checkpoint = {
+            "steps": [str(step) for step in self.experiment.operating_conditions_steps],
+            "cycles completed": cycles_completed,
+            "step index": step_index,
+            "last state": self._checkpoint_state(solution.last_state),
+            "first states": [
+                self._checkpoint_state(state) for state in all_first_states
+            ],
+            "summary variables": all_summary_variables,
+            "initial start time": initial_start_time,
+        }
+        # Write to a temporary file first, so that the previous checkpoint is kept
+        # if the simulation crashes while writing
+        temporary_filename = filename + ".tmp"
+        with open(temporary_filename, "wb") as f:
+            pickle.dump(checkpoint, f, pickle.HIGHEST_PROTOCOL)
+        os.replace(temporary_filename, filename)
+
+    def _checkpoint_state(self, solution):
+        """The last state of a solution, with the key of its built model"""
+        model = solution.all_models[-1]
+        model_key = None
+        for key, built_model in self.op_conds_to_built_models.items():
+            if built_model is model:
+                model_key = key
+                break
+        return {
+            "t": np.array(solution.all_ts[-1][-1:]),
+            "y": np.array(solution.all_ys[-1][:, -1:]),
+            "model": model_key,
+            "inputs": solution.all_inputs[-1],
+        }
+
+    def _solution_from_checkpoint_state(self, state):
+        """Solution with a single state written by :meth:`_checkpoint_state`"""
+        if state["model"] in self.op_conds_to_built_models:
+            model = self.op_conds_to_built_models[state["model"]]
+        else:
+            # The state was not solved by this simulation (e.g. it is the first
+            # state of a starting solution), use the model of the first step
+            first_step = self.experiment.operating_conditions_steps[0]
+            model = self.op_conds_to_built_models[first_step.basic_repr()]
+        solution = pybamm.Solution(
+            state["t"], state["y"], model, state["inputs"], check_solution=False
+        )
+        solution.solve_time = 0
+        solution.integration_time = 0
+        solution.set_up_time = 0
+        return solution
+
+    def _load_checkpoint(self, filename):
+        """
+        Load a checkpoint written by :meth:`_write_checkpoint`
+
+        Returns
+        -------
+        starting_solution : :class:`pybamm.Solution`
+            Solution with the last state, the summary variables and the first states
+            of the cycles in the checkpoint, and no `cycles`
+        cycles_done : int
+            The number of cycles of the experiment that have already been solved
+        step_index : int
+            The index of the step of the experiment from which to resume
+        """
+        with open(filename, "rb") as f:
+            checkpoint = pickle.load(f)
+        steps = [str(step) for step in self.experiment.operating_conditions_steps]
+        if checkpoint["steps"] != steps:
+            raise ValueError(
+                "The checkpoint in '{}' was written for a different experiment".format(
+                    filename
+                )
+            )
+        solution = self._solution_from_checkpoint_state(checkpoint["last state"])
+        all_summary_variables = checkpoint["summary variables"]
+        solution.cycles = []
+        if len(all_summary_variables) > 0:
+            solution.set_summary_variables(all_summary_variables)
+        else:
+            solution.all_summary_variables = []
+        solution.all_first_states = [
+            self._solution_from_checkpoint_state(state)
+            for state in checkpoint["first states"]
+        ]
+        solution.initial_start_time = checkpoint["initial start time"]
+
+        cycles_done = checkpoint["cycles completed"]
+        if cycles_done is None:
+            # The experiment has finished
+            cycles_done = len(self.experiment.cycle_lengths)
+        return solution, cycles_done, checkpoint["step index"]
+
     def run_padding_rest(self, kwargs, rest_time, step_solution):
         model = self.op_conds_to_built_models["Rest for padding"]
         solver = self.op_conds_to_built_solvers["Rest for padding"]
@@ -1044,12 +1873,71 @@ class Simulation:
         if starting_solution is None:
             starting_solution = self._solution
 
+        if self._sweep_parameters:
+            kwargs["inputs"] = self._add_sweep_inputs(kwargs.get("inputs"))
+
         self._solution = solver.step(
             starting_solution, self.built_model, dt, npts=npts, save=save, **kwargs
         )
 
         return self.solution
 
+    def sweep(self, values, t_eval=None, **kwargs):
+        """
+        Solve the simulation for several values of its sweep parameters (see the
+        `sweep_parameters` of :class:`Simulation`). The simulation is only built
+        once, and without an experiment all the values are solved in a single call
+        to the solver, which can solve them in parallel (see the `nproc` argument
+        of :meth:`pybamm.BaseSolver.solve`).
+
+        Parameters
+        ----------
+        values : dict
+            The values of the inputs that replace the sweep parameters, as a list of
+            values for each input. All the lists must have the same length. The
+            inputs are named after the parameters, or `"<name> scaling factor"` for
+            parameters whose value is a function. Inputs that are not given keep
+            the values from the parameter values.
+        t_eval : numeric type, optional
+            The times at which to compute the solution. See
+            :meth:`Simulation.solve`.
+        **kwargs
+            Additional key-word arguments passed to :meth:`Simulation.solve`
+
+        Returns
+        -------
+        list of :class:`pybamm.Solution`
+            The solution for each set of values
+        """
+        sweep_inputs = self._get_sweep_inputs()
+        for name in values:
+            if name not in sweep_inputs:
+                raise ValueError(
+                    f"'{name}' is not the input of a sweep parameter. The inputs of "
+                    f"the sweep parameters are {list(sweep_inputs)}"
+                )
+        n_values = {len(input_values) for input_values in values.values()}
+        if len(n_values) > 1:
+            raise ValueError("All the inputs must have the same number of values")
+        n_values = n_values.pop() if n_values else 1
+
+        user_inputs = kwargs.pop("inputs", None) or {}
+        inputs_list = [
+            {
+                **user_inputs,
+                **{name: input_values[i] for name, input_values in values.items()},
+            }
+            for i in range(n_values)
+        ]
+        if self.operating_mode == "with experiment":
+            return [
+                self.solve(t_eval, inputs=inputs, **kwargs) for inputs in inputs_list
+            ]
+        solutions = self.solve(t_eval, inputs=inputs_list, **kwargs)
+        if not isinstance(solutions, list):
+            solutions = [solutions]
+        return solutions
+
     def _get_esoh_solver(self, calc_esoh):
         if (
             calc_esoh is False
@@ -1165,17 +2053,10 @@ class Simulation:
     def solution(self):
         return self._solution
 
-    def save(self, filename):
-        """Save simulation using pickle"""
-        if self._model.convert_to_format == "python":
-            # We currently cannot save models in the 'python' format
-            raise NotImplementedError(
-                """
-                Cannot save simulation if model format is python.
-                Set model.convert_to_format = 'casadi' instead.
-                """
-            )
-        # Clear solver problem (not pickle-able, will automatically be recomputed)
+    def _clear_solver_problems(self):
+        """
+        Clear solver problems (not pickle-able, will automatically be recomputed)
+        """
         if (
             isinstance(self._solver, pybamm.CasadiSolver)
             and self._solver.integrator_specs != {}
@@ -1190,6 +2071,18 @@ class Simulation:
                 ):
                     solver.integrator_specs = {}
 
+    def save(self, filename):
+        """Save simulation using pickle"""
+        if self._model.convert_to_format == "python":
+            # We currently cannot save models in the 'python' format
+            raise NotImplementedError(
+                """
+                Cannot save simulation if model format is python.
+                Set model.convert_to_format = 'casadi' instead.
+                """
+            )
+        self._clear_solver_problems()
+
         with open(filename, "wb") as f:
             pickle.dump(self, f, pickle.HIGHEST_PROTOCOL)
 
@@ -1198,6 +2091,7 @@ class Simulation:
         filename: Optional[str] = None,
         mesh: bool = False,
         variables: bool = False,
+        binary: bool = False,
     ):
         """
         Write out a discretised model to a JSON file
@@ -1214,6 +2108,10 @@ class Simulation:
         filename: str, optional
             The desired name of the JSON file. If no name is provided, one will be
             created based on the model name, and the current datetime.
+        binary: bool, optional
+            Whether to write a binary `.npz` file instead of a JSON file, see
+            :meth:`pybamm.expression_tree.operations.serialise.Serialise.save_model`.
+            Default is False.
         """
         mesh = self.mesh if (mesh or variables) else None
         variables = self.built_model.variables if variables else None
@@ -1227,7 +2125,11 @@ class Simulation:
 
         if self.built_model:
             Serialise().save_model(
-                self.built_model, filename=filename, mesh=mesh, variables=variables
+                self.built_model,
+                filename=filename,
+                mesh=mesh,
+                variables=variables,
+                binary=binary,
             )
         else:
             raise NotImplementedError(
@@ -1238,6 +2140,33 @@ class Simulation:
             )
 
 
+def _nested_dict_values(d):
+    """Get all the values from a nested dict"""
+    for value in d.values():
+        if isinstance(value, dict):
+            yield from _nested_dict_values(value)
+        else:
+            yield value
+
+
+def _termination_input_name(term_type):
+    """Name of the input parameter for the value of a termination condition"""
+    unit = "[A]" if term_type == "current" else "[V]"
+    return f"{term_type.capitalize()} cut-off {unit} [experiment]"
+
+
+def _experiment_step_sign(op):
+    """Sign of the current or power of an experiment step at its start"""
+    if isinstance(op.value, pybamm.Interpolant) or isinstance(
+        op.value, pybamm.Multiplication
+    ):
+        inpt = {"start time": 0}
+        init_curr = op.value.evaluate(t=0, inputs=inpt).flatten()[0]
+        return np.sign(init_curr)
+    else:
+        return np.sign(op.value)
+
+
 def load_sim(filename):
     """Load a saved simulation"""
     return pybamm.load(filename)
@@ -6,8 +6,10 @@ import itertools
 from scipy.sparse import block_diag
 import multiprocessing as mp
 import numbers
+import os
 import sys
 import warnings
+import weakref
 
 import casadi
 import numpy as np
@@ -69,6 +71,25 @@ class BaseSolver(object):
         self._on_extrapolation = "warn"
         self.computed_var_fcns = {}
 
+        # Persistent pool of worker processes used to solve for multiple inputs
+        self._pool = None
+        self._pool_model = None
+        self._pool_nproc = None
+        self._pool_settings = None
+        self._pool_finalizer = None
+
+    # Attributes that are filled in while solving rather than set by the user, and
+    # are ignored when checking whether the settings of the solver have changed
+    _cache_attributes = (
+        "_model_set_up",
+        "computed_var_fcns",
+        "_pool",
+        "_pool_model",
+        "_pool_nproc",
+        "_pool_settings",
+        "_pool_finalizer",
+    )
+
     @property
     def root_method(self):
         return self._root_method
@@ -94,8 +115,95 @@ class BaseSolver(object):
         new_solver = copy.copy(self)
         # clear _model_set_up
         new_solver._model_set_up = {}
+        # the worker pool belongs to the original solver
+        new_solver._clear_pool_attributes()
         return new_solver
 
+    def __getstate__(self):
+        """
+        Return dictionary of picklable items
+        """
+        result = self.__dict__.copy()
+        # Exclude the worker pool, which cannot be pickled
+        for key in [
+            "_pool",
+            "_pool_model",
+            "_pool_nproc",
+            "_pool_settings",
+            "_pool_finalizer",
+        ]:
+            result[key] = None
+        return result
+
+    def _clear_pool_attributes(self):
+        self._pool = None
+        self._pool_model = None
+        self._pool_nproc = None
+        self._pool_settings = None
+        self._pool_finalizer = None
+
+    def _settings(self):
+        """
+        Representation of the current settings of the solver (tolerances, mode,
+        extra options, ...), used to check whether they have changed since the
+        worker pool was started
+        """
+        return repr(
+            sorted(
+                (key, value)
+                for key, value in self.__dict__.items()
+                if key not in self._cache_attributes
+            )
+        )
+
+    def _get_pool(self, model, nproc):
+        """
+        Return the persistent worker pool for `model`, creating it if needed. The
+        solver and model are sent to each worker once, when the pool is created, so
+        that subsequent tasks only need to send the inputs and `t_eval`. A new pool
+        is started if the settings of the solver have changed since then.
+        """
+        settings = self._settings()
+        if (
+            self._pool is not None
+            and self._pool_model is model
+            and self._pool_nproc == nproc
+            and self._pool_settings == settings
+        ):
+            return self._pool
+
+        self.close_pool()
+        pybamm.logger.verbose(
+            "Starting pool of {} worker processes for {}".format(
+                nproc or os.cpu_count(), model.name
+            )
+        )
+        pool = mp.Pool(
+            processes=nproc,
+            initializer=_initialise_pool_worker,
+            initargs=(self, model),
+        )
+        self._pool = pool
+        self._pool_model = model
+        self._pool_nproc = nproc
+        self._pool_settings = settings
+        # Make sure the workers are shut down if the solver is garbage collected
+        self._pool_finalizer = weakref.finalize(self, pool.terminate)
+        return pool
+
+    def close_pool(self):
+        """
+        Shut down the pool of worker processes used to solve for a list of inputs,
+        if one has been started. The pool is otherwise kept alive between calls to
+        :meth:`solve` and shut down when the solver is garbage collected.
+        """
+        if self._pool is None:
+            return
+        self._pool_finalizer.detach()
+        self._pool.close()
+        self._pool.join()
+        self._clear_pool_attributes()
+
     def set_up(self, model, inputs=None, t_eval=None, ics_only=False):
         """Unpack model, perform checks, and calculate jacobian.
 
@@ -116,6 +224,9 @@ class BaseSolver(object):
         else:
             pybamm.logger.info("Start solver set-up")
 
+        # Any workers hold a copy of the model as it was previously set up
+        self.close_pool()
+
         self._check_and_prepare_model_inplace(model, inputs, ics_only)
 
         # set default calculate sensitivities on model
@@ -283,6 +394,10 @@ class BaseSolver(object):
                     return_jacp_stacked=True,
                 )
 
+            # Also store the functions with the model, for the CasADi solver, as the
+            # solver can be used with several models (e.g. in an experiment)
+            model.casadi_output_variables = self.computed_var_fcns
+
         pybamm.logger.info("Finish solver set-up")
 
     @classmethod
@@ -372,7 +487,21 @@ class BaseSolver(object):
             y = pybamm.StateVector(slice(0, model.len_rhs_and_alg))
             # set up Jacobian object, for re-use of dict
             jacobian = pybamm.Jacobian()
-            vars_for_processing.update({"y": y, "jacobian": jacobian})
+            # the action of the Jacobian is evaluated with y and the vector it acts
+            # on stacked together
+            v = pybamm.StateVector(
+                slice(model.len_rhs_and_alg, 2 * model.len_rhs_and_alg)
+            )
+            jacobian_action = pybamm.JacobianAction(v)
+            jacobian_sparsity = pybamm.JacobianSparsity()
+            vars_for_processing.update(
+                {
+                    "y": y,
+                    "jacobian": jacobian,
+                    "jacobian_action": jacobian_action,
+                    "jacobian_sparsity": jacobian_sparsity,
+                }
+            )
             return vars_for_processing
 
         else:
@@ -727,7 +856,9 @@ class BaseSolver(object):
             of size `len(model.rhs) + len(model.algebraic)`.
         nproc : int, optional
             Number of processes to use when solving for more than one set of input
-            parameters. Defaults to value returned by "os.cpu_count()".
+            parameters. Defaults to value returned by "os.cpu_count()". The pool of
+            processes is kept alive between calls to `solve` with the same model
+            and `nproc`, and can be shut down with :meth:`close_pool`.
         calculate_sensitivites : list of str or bool
             If true, solver calculates sensitivities of all input parameters.
             If only a subset of sensitivities are required, can also pass a
@@ -917,25 +1048,35 @@ class BaseSolver(object):
                 )
                 new_solutions = [new_solution]
             else:
-                if model.convert_to_format == "jax":
-                    # Jax can parallelize over the inputs efficiently
+                if model.convert_to_format == "jax" or (
+                    isinstance(self, pybamm.IDAKLUSolver)
+                    and model.convert_to_format == "casadi"
+                ):
+                    # Jax and the IDAKLU solver can parallelize over the inputs
+                    # efficiently
                     new_solutions = self._integrate(
                         model,
                         t_eval[start_index:end_index],
                         model_inputs_list,
                     )
                 else:
-                    with mp.Pool(processes=nproc) as p:
-                        new_solutions = p.starmap(
-                            self._integrate,
+                    # The workers already hold the model, so only send the inputs,
+                    # times and current initial state with each task
+                    pool = self._get_pool(model, nproc)
+                    chunksize, extra = divmod(ninputs, 4 * (nproc or os.cpu_count()))
+                    if extra:
+                        chunksize += 1
+                    new_solutions = list(
+                        pool.imap(
+                            _integrate_in_pool_worker,
                             zip(
-                                [model] * ninputs,
                                 [t_eval[start_index:end_index]] * ninputs,
                                 model_inputs_list,
+                                [model.y0] * ninputs,
                             ),
+                            chunksize=chunksize,
                         )
-                        p.close()
-                        p.join()
+                    )
             # Setting the solve time for each segment.
             # pybamm.Solution.__add__ assumes attribute solve_time.
             solve_time = timer.time()
@@ -1426,6 +1567,24 @@ class BaseSolver(object):
         return ordered_inputs
 
 
+# Solver and model held by each worker process of a persistent pool (see
+# `BaseSolver._get_pool`)
+_pool_worker_solver = None
+_pool_worker_model = None
+
+
+def _initialise_pool_worker(solver, model):
+    global _pool_worker_solver, _pool_worker_model
+    _pool_worker_solver = solver
+    _pool_worker_model = model
+
+
+def _integrate_in_pool_worker(args):
+    t_eval, inputs, y0 = args
+    _pool_worker_model.y0 = y0
+    return _pool_worker_solver._integrate(_pool_worker_model, t_eval, inputs)
+
+
 def process(
     symbol, name, vars_for_processing, use_jacobian=None, return_jacp_stacked=None
 ):
@@ -1461,7 +1620,7 @@ def process(
         $\frac{\partial f}{\partial p}$
         of the function given by `symbol`
 
-    jac_action: :class:`pybamm.EvaluatorPython` or
+    jac_action: :class:`pybamm.EvaluatorPythonJacobianAction` or
             :class:`pybamm.EvaluatorJax` or
             :class:`casadi.Function`
         evaluator for product of the Jacobian with a vector $v$,
@@ -1516,31 +1675,47 @@ def process(
             }
 
             report(f"Converting sensitivities for {name} to python")
-            jacp_dict = {
-                p: pybamm.EvaluatorPython(jacp) for p, jacp in jacp_dict.items()
-            }
+            # Evaluate the sensitivities with respect to all the parameters in a
+            # single function, so that their shared subexpressions are only
+            # evaluated once
+            jacp_names = list(jacp_dict.keys())
+            jacp_eval = pybamm.EvaluatorPython(list(jacp_dict.values()))
 
             # jacp should be a function that returns a dict of sensitivities
             def jacp(*args, **kwargs):
-                return {k: v(*args, **kwargs) for k, v in jacp_dict.items()}
+                return dict(zip(jacp_names, jacp_eval(*args, **kwargs)))
 
         else:
             jacp = None
 
-        if use_jacobian:
+        report(f"Converting {name} to python")
+        func = pybamm.EvaluatorPython(symbol)
+
+        if use_jacobian and model.jacobian_method == "finite difference":
+            report(f"Calculating jacobian sparsity for {name}")
+            sparsity = vars_for_processing["jacobian_sparsity"].sparsity(symbol, y)
+            jac = pybamm.FiniteDifferenceJacobian(func, sparsity)
+            jac_action = jac.jvp
+        elif use_jacobian and model.jacobian_method == "symbolic":
             report(f"Calculating jacobian for {name}")
             jac = jacobian.jac(symbol, y)
             report(f"Converting jacobian for {name} to python")
             jac = pybamm.EvaluatorPython(jac)
-            # cannot do jacobian action efficiently for now
-            jac_action = None
+
+            report(f"Calculating jacobian action for {name}")
+            jacobian_action = vars_for_processing["jacobian_action"]
+            jac_action_symbol = jacobian_action.jac(symbol, y)
+            report(f"Converting jacobian action for {name} to python")
+            jac_action = pybamm.EvaluatorPythonJacobianAction(jac_action_symbol)
+        elif use_jacobian:
+            raise pybamm.SolverError(
+                f"Unknown jacobian method '{model.jacobian_method}'. "
+                "Should be 'symbolic' or 'finite difference'"
+            )
         else:
             jac = None
             jac_action = None
 
-        report(f"Converting {name} to python")
-        func = pybamm.EvaluatorPython(symbol)
-
     else:
         t_casadi = vars_for_processing["t_casadi"]
         y_casadi = vars_for_processing["y_casadi"]
@@ -56,6 +56,15 @@ PYBIND11_MODULE(idaklu, m)
     py::arg("inputs"),
     py::return_value_policy::take_ownership);
 
+  py::class_<CasadiSolverGroup>(m, "CasadiSolverGroup")
+  .def("solve", &CasadiSolverGroup::solve,
+    "perform a batched solve, with one row of inputs per parameter set",
+    py::arg("t"),
+    py::arg("y0"),
+    py::arg("yp0"),
+    py::arg("inputs"),
+    py::return_value_policy::take_ownership);
+
   //py::bind_vector<std::vector<Function>>(m, "VectorFunction");
   //py::implicitly_convertible<py::iterable, std::vector<Function>>();
 
@@ -85,6 +94,33 @@ PYBIND11_MODULE(idaklu, m)
     py::arg("options"),
     py::return_value_policy::take_ownership);
 
+  m.def("create_casadi_solver_group", &create_casadi_solver_group,
+    "Create a group of casadi idaklu solver objects for batched solves",
+    py::arg("number_of_solvers"),
+    py::arg("number_of_states"),
+    py::arg("number_of_parameters"),
+    py::arg("rhs_alg"),
+    py::arg("jac_times_cjmass"),
+    py::arg("jac_times_cjmass_colptrs"),
+    py::arg("jac_times_cjmass_rowvals"),
+    py::arg("jac_times_cjmass_nnz"),
+    py::arg("jac_bandwidth_lower"),
+    py::arg("jac_bandwidth_upper"),
+    py::arg("jac_action"),
+    py::arg("mass_action"),
+    py::arg("sens"),
+    py::arg("events"),
+    py::arg("number_of_events"),
+    py::arg("rhs_alg_id"),
+    py::arg("atol"),
+    py::arg("rtol"),
+    py::arg("inputs"),
+    py::arg("var_casadi_fcns"),
+    py::arg("dvar_dy_fcns"),
+    py::arg("dvar_dp_fcns"),
+    py::arg("options"),
+    py::return_value_policy::take_ownership);
+
   m.def("generate_function", &generate_function,
     "Generate a casadi function",
     py::arg("string"),
@@ -97,4 +133,11 @@ PYBIND11_MODULE(idaklu, m)
   .def_readwrite("y", &Solution::y)
   .def_readwrite("yS", &Solution::yS)
   .def_readwrite("flag", &Solution::flag);
+
+  py::class_<SolutionBatch>(m, "solution_batch")
+  .def_readwrite("t", &SolutionBatch::t)
+  .def_readwrite("y", &SolutionBatch::y)
+  .def_readwrite("yS", &SolutionBatch::yS)
+  .def_readwrite("flag", &SolutionBatch::flag)
+  .def_readwrite("number_of_timesteps", &SolutionBatch::number_of_timesteps);
 }
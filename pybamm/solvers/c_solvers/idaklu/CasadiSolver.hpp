@@ -27,7 +27,7 @@ public:
   /**
    * @brief Default destructor
    */
-  ~CasadiSolver() = default;
+  virtual ~CasadiSolver() = default;
 
   /**
    * @brief Abstract solver method that returns a Solution class
@@ -38,6 +38,22 @@ public:
     np_array yp0_np,
     np_array_dense inputs) = 0;
 
+  /**
+   * Solve for a single set of inputs without creating any Python objects, so
+   * that it can be called without holding the GIL
+   * @brief Abstract solver method that returns a SolutionData class
+   */
+  virtual SolutionData SolveNoGIL(
+    const std::vector<realtype> &t,
+    const realtype *y0,
+    const realtype *yp0,
+    const realtype *inputs) = 0;
+
+  /**
+   * @brief Abstract method to print the solver statistics of the last solve
+   */
+  virtual void PrintStats() = 0;
+
   /**
    * Abstract method to initialize the solver, once vectors and solver classes
    * are set
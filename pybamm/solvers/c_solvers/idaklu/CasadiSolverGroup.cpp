@@ -0,0 +1,180 @@
+#include "CasadiSolverGroup.hpp"
+#include <algorithm>
+#include <atomic>
+#include <exception>
+#include <limits>
+
+#ifdef _OPENMP
+#include <omp.h>
+#endif
+
+CasadiSolverGroup::CasadiSolverGroup(
+  std::vector<std::unique_ptr<CasadiSolver>> solvers,
+  int number_of_states,
+  int number_of_parameters,
+  int inputs_length
+) :
+  m_solvers(std::move(solvers)),
+  number_of_states(number_of_states),
+  number_of_parameters(number_of_parameters),
+  inputs_length(inputs_length)
+{
+  DEBUG("CasadiSolverGroup::CasadiSolverGroup");
+  if (m_solvers.empty())
+    throw std::invalid_argument("A solver group requires at least one solver");
+}
+
+SolutionBatch CasadiSolverGroup::solve(
+    np_array t_np,
+    np_array y0_np,
+    np_array yp0_np,
+    np_array_dense inputs
+)
+{
+  DEBUG("CasadiSolverGroup::solve");
+
+  int number_of_timesteps = t_np.request().size;
+  auto t = t_np.unchecked<1>();
+  auto y0 = y0_np.unchecked<1>();
+  auto yp0 = yp0_np.unchecked<1>();
+  auto p_inputs = inputs.unchecked<2>();
+  auto n_coeffs = number_of_states + number_of_parameters * number_of_states;
+  int number_of_sets = p_inputs.shape(0);
+
+  if (y0.size() != n_coeffs)
+    throw std::domain_error(
+      "y0 has wrong size. Expected " + std::to_string(n_coeffs) +
+      " but got " + std::to_string(y0.size()));
+
+  if (yp0.size() != n_coeffs)
+    throw std::domain_error(
+      "yp0 has wrong size. Expected " + std::to_string(n_coeffs) +
+      " but got " + std::to_string(yp0.size()));
+
+  if (p_inputs.shape(1) != inputs_length)
+    throw std::domain_error(
+      "inputs has wrong number of columns. Expected " +
+      std::to_string(inputs_length) + " but got " +
+      std::to_string(p_inputs.shape(1)));
+
+  // copy across numpy array values, so that they can be read without the GIL
+  std::vector<realtype> t_vec(number_of_timesteps);
+  for (int i = 0; i < number_of_timesteps; i++)
+    t_vec[i] = t(i);
+  std::vector<realtype> y0_vec(n_coeffs);
+  std::vector<realtype> yp0_vec(n_coeffs);
+  for (int i = 0; i < n_coeffs; i++)
+  {
+    y0_vec[i] = y0[i];
+    yp0_vec[i] = yp0[i];
+  }
+  const realtype *inputs_data = p_inputs.data(0, 0);
+
+  std::vector<SolutionData> results(number_of_sets);
+  // exceptions cannot propagate out of an OpenMP region, so the first one thrown
+  // by a solve is stored and rethrown once the GIL has been re-acquired
+  std::exception_ptr error = nullptr;
+  std::atomic<bool> failed(false);
+  {
+    py::gil_scoped_release release;
+
+    int number_of_threads = std::min(
+      static_cast<int>(m_solvers.size()), std::max(number_of_sets, 1));
+#ifdef _OPENMP
+    #pragma omp parallel for num_threads(number_of_threads) schedule(dynamic)
+#endif
+    for (int i = 0; i < number_of_sets; i++)
+    {
+      if (failed)
+        continue;
+#ifdef _OPENMP
+      int thread = omp_get_thread_num();
+#else
+      int thread = 0;
+#endif
+      try
+      {
+        results[i] = m_solvers[thread]->SolveNoGIL(
+          t_vec,
+          y0_vec.data(),
+          yp0_vec.data(),
+          inputs_data + static_cast<size_t>(i) * inputs_length
+        );
+      }
+      catch (...)
+      {
+#ifdef _OPENMP
+        #pragma omp critical(casadi_solver_group_error)
+#endif
+        {
+          if (!error)
+            error = std::current_exception();
+        }
+        failed = true;
+      }
+    }
+  }
+  if (error)
+    std::rethrow_exception(error);
+
+  // stack the results, padding solves that terminated early with NaN
+  int length_of_return_vector =
+    number_of_sets > 0 ? results[0].length_of_return_vector : 0;
+  const size_t y_row_size =
+    static_cast<size_t>(number_of_timesteps) * length_of_return_vector;
+  const size_t yS_row_size = y_row_size * number_of_parameters;
+  const realtype nan = std::numeric_limits<realtype>::quiet_NaN();
+
+  np_array_int flag_ret(number_of_sets);
+  np_array_int number_of_timesteps_ret(number_of_sets);
+  np_array t_ret(std::vector<ptrdiff_t> {number_of_sets, number_of_timesteps});
+  np_array y_ret(
+    std::vector<ptrdiff_t> {number_of_sets, static_cast<ptrdiff_t>(y_row_size)});
+  np_array yS_ret;
+  if (number_of_sets > 0 && results[0].output_variables) {
+    yS_ret = np_array(
+      std::vector<ptrdiff_t> {
+        number_of_sets,
+        number_of_timesteps,
+        length_of_return_vector,
+        number_of_parameters
+      }
+    );
+  } else {
+    yS_ret = np_array(
+      std::vector<ptrdiff_t> {
+        number_of_sets,
+        number_of_parameters,
+        number_of_timesteps,
+        length_of_return_vector
+      }
+    );
+  }
+
+  auto flag_val = flag_ret.mutable_unchecked<1>();
+  auto number_of_timesteps_val = number_of_timesteps_ret.mutable_unchecked<1>();
+  realtype *t_val = t_ret.mutable_data();
+  realtype *y_val = y_ret.mutable_data();
+  realtype *yS_val = yS_ret.mutable_data();
+  for (int i = 0; i < number_of_sets; i++)
+  {
+    const SolutionData &data = results[i];
+    const size_t n_t = data.number_of_returned_timesteps;
+    flag_val(i) = data.flag;
+    number_of_timesteps_val(i) = n_t;
+
+    realtype *t_row = t_val + static_cast<size_t>(i) * number_of_timesteps;
+    std::copy(data.t.begin(), data.t.begin() + n_t, t_row);
+    std::fill(t_row + n_t, t_row + number_of_timesteps, nan);
+
+    realtype *y_row = y_val + i * y_row_size;
+    const size_t n_y = n_t * length_of_return_vector;
+    std::copy(data.y.begin(), data.y.begin() + n_y, y_row);
+    std::fill(y_row + n_y, y_row + y_row_size, nan);
+
+    std::copy(data.yS.begin(), data.yS.end(), yS_val + i * yS_row_size);
+  }
+
+  return SolutionBatch(
+    flag_ret, number_of_timesteps_ret, t_ret, y_ret, yS_ret);
+}
@@ -0,0 +1,52 @@
+#ifndef PYBAMM_IDAKLU_CASADI_SOLVER_GROUP_HPP
+#define PYBAMM_IDAKLU_CASADI_SOLVER_GROUP_HPP
+
+#include "CasadiSolver.hpp"
+#include "common.hpp"
+#include "solution.hpp"
+#include <memory>
+#include <vector>
+
+/**
+ * Holds one independent solver (IDA instance, linear solver and casadi
+ * function work buffers) per thread, so that a batch of input parameter sets
+ * can be solved in parallel with the GIL released.
+ * @brief A group of solvers for batched multi-input solves
+ */
+class CasadiSolverGroup
+{
+public:
+  /**
+   * @brief Constructor
+   */
+  CasadiSolverGroup(
+    std::vector<std::unique_ptr<CasadiSolver>> solvers,
+    int number_of_states,
+    int number_of_parameters,
+    int inputs_length);
+
+  /**
+   * @brief The solvers are not copyable
+   */
+  CasadiSolverGroup(const CasadiSolverGroup &) = delete;
+
+  /**
+   * Solve for each row of `inputs` (shape: number of parameter sets x length
+   * of the stacked inputs), distributing the rows over the solvers using an
+   * OpenMP thread pool. All parameter sets share the same initial conditions.
+   * @brief Perform a batched solve, returning stacked solutions
+   */
+  SolutionBatch solve(
+    np_array t_np,
+    np_array y0_np,
+    np_array yp0_np,
+    np_array_dense inputs);
+
+private:
+  std::vector<std::unique_ptr<CasadiSolver>> m_solvers;
+  int number_of_states;
+  int number_of_parameters;
+  int inputs_length;
+};
+
+#endif // PYBAMM_IDAKLU_CASADI_SOLVER_GROUP_HPP
@@ -188,6 +188,10 @@ CasadiSolverOpenMP::~CasadiSolverOpenMP()
 
   IDAFree(&ida_mem);
   SUNContext_Free(&sunctx);
+
+  delete[] res;
+  delete[] res_dvar_dy;
+  delete[] res_dvar_dp;
 }
 
 void CasadiSolverOpenMP::CalcVars(
@@ -258,7 +262,6 @@ Solution CasadiSolverOpenMP::solve(
 
   int number_of_timesteps = t_np.request().size;
   auto t = t_np.unchecked<1>();
-  realtype t0 = RCONST(t(0));
   auto y0 = y0_np.unchecked<1>();
   auto yp0 = yp0_np.unchecked<1>();
   auto n_coeffs = number_of_states + number_of_parameters * number_of_states;
@@ -273,10 +276,46 @@ Solution CasadiSolverOpenMP::solve(
       "yp0 has wrong size. Expected " + std::to_string(n_coeffs) +
       " but got " + std::to_string(yp0.size()));
 
-  // set inputs
+  // copy across numpy array values
+  std::vector<realtype> t_vec(number_of_timesteps);
+  for (int i = 0; i < number_of_timesteps; i++)
+    t_vec[i] = t(i);
+  std::vector<realtype> y0_vec(n_coeffs);
+  std::vector<realtype> yp0_vec(n_coeffs);
+  for (int i = 0; i < n_coeffs; i++)
+  {
+    y0_vec[i] = y0[i];
+    yp0_vec[i] = yp0[i];
+  }
   auto p_inputs = inputs.unchecked<2>();
+  std::vector<realtype> inputs_vec(functions->inputs.size());
+  for (int i = 0; i < inputs_vec.size(); i++)
+    inputs_vec[i] = p_inputs(i, 0);
+
+  SolutionData data = SolveNoGIL(
+    t_vec, y0_vec.data(), yp0_vec.data(), inputs_vec.data());
+
+  if (options.print_stats)
+    PrintStats();
+
+  return data.ToSolution();
+}
+
+SolutionData CasadiSolverOpenMP::SolveNoGIL(
+    const std::vector<realtype> &t,
+    const realtype *y0,
+    const realtype *yp0,
+    const realtype *inputs
+)
+{
+  DEBUG("CasadiSolver::SolveNoGIL");
+
+  int number_of_timesteps = t.size();
+  realtype t0 = RCONST(t[0]);
+
+  // set inputs
   for (int i = 0; i < functions->inputs.size(); i++)
-    functions->inputs[i] = p_inputs(i, 0);
+    functions->inputs[i] = inputs[i];
 
   // set initial conditions
   realtype *yval = N_VGetArrayPointer(yy);
@@ -304,12 +343,12 @@ Solution CasadiSolverOpenMP::solve(
 
   // correct initial values
   DEBUG("IDACalcIC");
-  IDACalcIC(ida_mem, IDA_YA_YDP_INIT, t(1));
+  IDACalcIC(ida_mem, IDA_YA_YDP_INIT, t[1]);
   if (number_of_parameters > 0)
     IDAGetSens(ida_mem, &t0, yyS);
 
   realtype tret;
-  realtype t_final = t(number_of_timesteps - 1);
+  realtype t_final = t[number_of_timesteps - 1];
 
   // set return vectors
   int length_of_return_vector = 0;
@@ -329,43 +368,32 @@ Solution CasadiSolverOpenMP::solve(
     // Return full y state-vector
     length_of_return_vector = number_of_states;
   }
-  realtype *t_return = new realtype[number_of_timesteps];
-  realtype *y_return = new realtype[number_of_timesteps *
-                                    length_of_return_vector];
-  realtype *yS_return = new realtype[number_of_parameters *
-                                     number_of_timesteps *
-                                     length_of_return_vector];
 
+  SolutionData data;
+  data.number_of_timesteps = number_of_timesteps;
+  data.length_of_return_vector = length_of_return_vector;
+  data.number_of_parameters = number_of_parameters;
+  data.output_variables = functions->var_casadi_fcns.size() > 0;
+  data.t.resize(number_of_timesteps);
+  data.y.resize(number_of_timesteps * length_of_return_vector);
+  data.yS.resize(
+    number_of_parameters * number_of_timesteps * length_of_return_vector);
+  realtype *t_return = data.t.data();
+  realtype *y_return = data.y.data();
+  realtype *yS_return = data.yS.data();
+
+  // (re-)allocate common result buffers
+  delete[] res;
+  delete[] res_dvar_dy;
+  delete[] res_dvar_dp;
   res = new realtype[max_res_size];
   res_dvar_dy = new realtype[max_res_dvar_dy];
   res_dvar_dp = new realtype[max_res_dvar_dp];
 
-  py::capsule free_t_when_done(
-    t_return,
-    [](void *f) {
-      realtype *vect = reinterpret_cast<realtype *>(f);
-      delete[] vect;
-    }
-  );
-  py::capsule free_y_when_done(
-    y_return,
-    [](void *f) {
-      realtype *vect = reinterpret_cast<realtype *>(f);
-      delete[] vect;
-    }
-  );
-  py::capsule free_yS_when_done(
-    yS_return,
-    [](void *f) {
-      realtype *vect = reinterpret_cast<realtype *>(f);
-      delete[] vect;
-    }
-  );
-
   // Initial state (t_i=0)
   int t_i = 0;
   size_t ySk = 0;
-  t_return[t_i] = t(t_i);
+  t_return[t_i] = t[t_i];
   if (functions->var_casadi_fcns.size() > 0) {
     // Evaluate casadi functions for each requested variable and store
     CalcVars(y_return, length_of_return_vector, t_i,
@@ -387,7 +415,7 @@ Solution CasadiSolverOpenMP::solve(
   t_i = 1;
   while (true)
   {
-    realtype t_next = t(t_i);
+    realtype t_next = t[t_i];
     IDASetStopTime(ida_mem, t_next);
     DEBUG("IDASolve");
     retval = IDASolve(ida_mem, t_final, &tret, yy, yp, IDA_NORMAL);
@@ -433,86 +461,51 @@ Solution CasadiSolverOpenMP::solve(
     }
   }
 
-  np_array t_ret = np_array(
-    t_i,
-    &t_return[0],
-    free_t_when_done
-  );
-  np_array y_ret = np_array(
-    t_i * length_of_return_vector,
-    &y_return[0],
-    free_y_when_done
-  );
-  // Note: Ordering of vector is differnet if computing variables vs returning
-  // the complete state vector
-  np_array yS_ret;
-  if (functions->var_casadi_fcns.size() > 0) {
-    yS_ret = np_array(
-      std::vector<ptrdiff_t> {
-        number_of_timesteps,
-        length_of_return_vector,
-        number_of_parameters
-      },
-      &yS_return[0],
-      free_yS_when_done
-    );
-  } else {
-    yS_ret = np_array(
-      std::vector<ptrdiff_t> {
-        number_of_parameters,
-        number_of_timesteps,
-        length_of_return_vector
-      },
-      &yS_return[0],
-      free_yS_when_done
-    );
-  }
-
-  Solution sol(retval, t_ret, y_ret, yS_ret);
-
-  if (options.print_stats)
-  {
-    long nsteps, nrevals, nlinsetups, netfails;
-    int klast, kcur;
-    realtype hinused, hlast, hcur, tcur;
-
-    IDAGetIntegratorStats(
-      ida_mem,
-      &nsteps,
-      &nrevals,
-      &nlinsetups,
-      &netfails,
-      &klast,
-      &kcur,
-      &hinused,
-      &hlast,
-      &hcur,
-      &tcur
-    );
+  data.flag = retval;
+  data.number_of_returned_timesteps = t_i;
+  return data;
+}
 
-    long nniters, nncfails;
-    IDAGetNonlinSolvStats(ida_mem, &nniters, &nncfails);
-
-    long int ngevalsBBDP = 0;
-    if (options.using_iterative_solver)
-      IDABBDPrecGetNumGfnEvals(ida_mem, &ngevalsBBDP);
-
-    py::print("Solver Stats:");
-    py::print("\tNumber of steps =", nsteps);
-    py::print("\tNumber of calls to residual function =", nrevals);
-    py::print("\tNumber of calls to residual function in preconditioner =",
-              ngevalsBBDP);
-    py::print("\tNumber of linear solver setup calls =", nlinsetups);
-    py::print("\tNumber of error test failures =", netfails);
-    py::print("\tMethod order used on last step =", klast);
-    py::print("\tMethod order used on next step =", kcur);
-    py::print("\tInitial step size =", hinused);
-    py::print("\tStep size on last step =", hlast);
-    py::print("\tStep size on next step =", hcur);
-    py::print("\tCurrent internal time reached =", tcur);
-    py::print("\tNumber of nonlinear iterations performed =", nniters);
-    py::print("\tNumber of nonlinear convergence failures =", nncfails);
-  }
+void CasadiSolverOpenMP::PrintStats()
+{
+  long nsteps, nrevals, nlinsetups, netfails;
+  int klast, kcur;
+  realtype hinused, hlast, hcur, tcur;
+
+  IDAGetIntegratorStats(
+    ida_mem,
+    &nsteps,
+    &nrevals,
+    &nlinsetups,
+    &netfails,
+    &klast,
+    &kcur,
+    &hinused,
+    &hlast,
+    &hcur,
+    &tcur
+  );
 
-  return sol;
+  long nniters, nncfails;
+  IDAGetNonlinSolvStats(ida_mem, &nniters, &nncfails);
+
+  long int ngevalsBBDP = 0;
+  if (options.using_iterative_solver)
+    IDABBDPrecGetNumGfnEvals(ida_mem, &ngevalsBBDP);
+
+  py::print("Solver Stats:");
+  py::print("\tNumber of steps =", nsteps);
+  py::print("\tNumber of calls to residual function =", nrevals);
+  py::print("\tNumber of calls to residual function in preconditioner =",
+            ngevalsBBDP);
+  py::print("\tNumber of linear solver setup calls =", nlinsetups);
+  py::print("\tNumber of error test failures =", netfails);
+  py::print("\tMethod order used on last step =", klast);
+  py::print("\tMethod order used on next step =", kcur);
+  py::print("\tInitial step size =", hinused);
+  py::print("\tStep size on last step =", hlast);
+  py::print("\tStep size on next step =", hcur);
+  py::print("\tCurrent internal time reached =", tcur);
+  py::print("\tNumber of nonlinear iterations performed =", nniters);
+  py::print("\tNumber of nonlinear convergence failures =", nncfails);
 }
@@ -128,6 +128,20 @@ public:
     np_array yp0_np,
     np_array_dense inputs) override;
 
+  /**
+   * @brief Solve for a single set of inputs without holding the GIL
+   */
+  SolutionData SolveNoGIL(
+    const std::vector<realtype> &t,
+    const realtype *y0,
+    const realtype *yp0,
+    const realtype *inputs) override;
+
+  /**
+   * @brief Print the solver statistics of the last solve
+   */
+  void PrintStats() override;
+
   /**
    * @brief Concrete implementation of initialization method
    */
@@ -175,3 +175,70 @@ CasadiSolver *create_casadi_solver(
 
   return casadiSolver;
 }
+
+CasadiSolverGroup *create_casadi_solver_group(
+  int number_of_solvers,
+  int number_of_states,
+  int number_of_parameters,
+  const Function &rhs_alg,
+  const Function &jac_times_cjmass,
+  const np_array_int &jac_times_cjmass_colptrs,
+  const np_array_int &jac_times_cjmass_rowvals,
+  const int jac_times_cjmass_nnz,
+  const int jac_bandwidth_lower,
+  const int jac_bandwidth_upper,
+  const Function &jac_action,
+  const Function &mass_action,
+  const Function &sens,
+  const Function &events,
+  const int number_of_events,
+  np_array rhs_alg_id,
+  np_array atol_np,
+  double rel_tol,
+  int inputs_length,
+  const std::vector<Function*>& var_casadi_fcns,
+  const std::vector<Function*>& dvar_dy_fcns,
+  const std::vector<Function*>& dvar_dp_fcns,
+  py::dict options
+) {
+  // Parallelism is over the solvers, so each solver uses a single thread
+  py::dict solver_options;
+  for (auto item : options)
+    solver_options[item.first] = item.second;
+  solver_options["num_threads"] = 1;
+
+  std::vector<std::unique_ptr<CasadiSolver>> solvers;
+  for (int i = 0; i < number_of_solvers; i++) {
+    solvers.emplace_back(create_casadi_solver(
+      number_of_states,
+      number_of_parameters,
+      rhs_alg,
+      jac_times_cjmass,
+      jac_times_cjmass_colptrs,
+      jac_times_cjmass_rowvals,
+      jac_times_cjmass_nnz,
+      jac_bandwidth_lower,
+      jac_bandwidth_upper,
+      jac_action,
+      mass_action,
+      sens,
+      events,
+      number_of_events,
+      rhs_alg_id,
+      atol_np,
+      rel_tol,
+      inputs_length,
+      var_casadi_fcns,
+      dvar_dy_fcns,
+      dvar_dp_fcns,
+      solver_options
+    ));
+  }
+
+  return new CasadiSolverGroup(
+    std::move(solvers),
+    number_of_states,
+    number_of_parameters,
+    inputs_length
+  );
+}
@@ -2,6 +2,7 @@
 #define PYBAMM_IDAKLU_CREATE_CASADI_SOLVER_HPP
 
 #include "CasadiSolver.hpp"
+#include "CasadiSolverGroup.hpp"
 
 /**
  * Creates a concrete casadi solver given a linear solver, as specified in
@@ -33,4 +34,36 @@ CasadiSolver *create_casadi_solver(
   py::dict options
 );
 
+/**
+ * Creates `number_of_solvers` independent casadi solvers (as specified in
+ * options_cpp.linear_solver), each using a single thread for its vectors, so
+ * that a batch of input parameter sets can be solved in parallel.
+ * @brief Create a group of concrete casadi solvers for batched solves
+ */
+CasadiSolverGroup *create_casadi_solver_group(
+  int number_of_solvers,
+  int number_of_states,
+  int number_of_parameters,
+  const Function &rhs_alg,
+  const Function &jac_times_cjmass,
+  const np_array_int &jac_times_cjmass_colptrs,
+  const np_array_int &jac_times_cjmass_rowvals,
+  const int jac_times_cjmass_nnz,
+  const int jac_bandwidth_lower,
+  const int jac_bandwidth_upper,
+  const Function &jac_action,
+  const Function &mass_action,
+  const Function &sens,
+  const Function &event,
+  const int number_of_events,
+  np_array rhs_alg_id,
+  np_array atol_np,
+  double rel_tol,
+  int inputs_length,
+  const std::vector<Function*>& var_casadi_fcns,
+  const std::vector<Function*>& dvar_dy_fcns,
+  const std::vector<Function*>& dvar_dp_fcns,
+  py::dict options
+);
+
 #endif // PYBAMM_IDAKLU_CREATE_CASADI_SOLVER_HPP
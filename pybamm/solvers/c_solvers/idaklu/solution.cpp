@@ -0,0 +1,59 @@
+#include "solution.hpp"
+
+/**
+ * Move a std::vector onto the heap and wrap it in a numpy array that frees
+ * the vector when the array is garbage collected
+ */
+np_array vector_to_np_array(
+  std::vector<realtype> &&vect,
+  const std::vector<ptrdiff_t> &shape
+)
+{
+  auto *heap_vect = new std::vector<realtype>(std::move(vect));
+  py::capsule free_when_done(
+    heap_vect,
+    [](void *f) {
+      auto *v = reinterpret_cast<std::vector<realtype> *>(f);
+      delete v;
+    }
+  );
+  return np_array(shape, heap_vect->data(), free_when_done);
+}
+
+Solution SolutionData::ToSolution()
+{
+  np_array t_ret = vector_to_np_array(
+    std::move(t),
+    std::vector<ptrdiff_t> {number_of_returned_timesteps}
+  );
+  np_array y_ret = vector_to_np_array(
+    std::move(y),
+    std::vector<ptrdiff_t> {
+      number_of_returned_timesteps * length_of_return_vector
+    }
+  );
+  // Note: Ordering of vector is differnet if computing variables vs returning
+  // the complete state vector
+  np_array yS_ret;
+  if (output_variables) {
+    yS_ret = vector_to_np_array(
+      std::move(yS),
+      std::vector<ptrdiff_t> {
+        number_of_timesteps,
+        length_of_return_vector,
+        number_of_parameters
+      }
+    );
+  } else {
+    yS_ret = vector_to_np_array(
+      std::move(yS),
+      std::vector<ptrdiff_t> {
+        number_of_parameters,
+        number_of_timesteps,
+        length_of_return_vector
+      }
+    );
+  }
+
+  return Solution(flag, t_ret, y_ret, yS_ret);
+}
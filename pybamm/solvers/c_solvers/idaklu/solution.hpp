@@ -23,4 +23,58 @@ public:
   np_array yS;
 };
 
+/**
+ * Raw solution data, which is held in C++ containers so that it can be
+ * created without holding the GIL
+ * @brief Raw solution data class
+ */
+class SolutionData
+{
+public:
+  /**
+   * @brief Convert to a Solution, moving the data into numpy arrays
+   */
+  Solution ToSolution();
+
+  int flag;
+  int number_of_timesteps;  // requested time points
+  int number_of_returned_timesteps;  // time points actually solved for
+  int length_of_return_vector;
+  int number_of_parameters;
+  bool output_variables;  // determines the ordering of yS
+  std::vector<realtype> t;
+  std::vector<realtype> y;
+  std::vector<realtype> yS;
+};
+
+/**
+ * Solutions for a batch of input parameter sets, stacked along the first axis
+ * with one row per parameter set. Rows of solves that terminated early are
+ * padded with NaN beyond `number_of_timesteps[i]`.
+ * @brief Stacked solution class for a batch of solves
+ */
+class SolutionBatch
+{
+public:
+  /**
+   * @brief Constructor
+   */
+  SolutionBatch(
+    np_array_int flag_np,
+    np_array_int number_of_timesteps_np,
+    np_array t_np,
+    np_array y_np,
+    np_array yS_np)
+      : flag(flag_np), number_of_timesteps(number_of_timesteps_np),
+        t(t_np), y(y_np), yS(yS_np)
+  {
+  }
+
+  np_array_int flag;
+  np_array_int number_of_timesteps;
+  np_array t;
+  np_array y;
+  np_array yS;
+};
+
 #endif // PYBAMM_IDAKLU_COMMON_HPP
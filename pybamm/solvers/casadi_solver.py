@@ -6,6 +6,7 @@ import pybamm
 import numpy as np
 import warnings
 from scipy.interpolate import interp1d
+from scipy.optimize import brentq
 from .lrudict import LRUDict
 
 
@@ -72,8 +73,21 @@ class CasadiSolver(pybamm.BaseSolver):
         The maximum number of integrators that the solver will retain before
         ejecting past integrators using an LRU methodology. A value of 0 or
         None leaves the number of integrators unbound. Default is 100.
+    output_variables : list[str], optional
+        List of variables to calculate and return. If none are specified then
+        the complete state vector is returned (can be very large) (default is []).
+        Otherwise, the variables are evaluated after each call to the integrator,
+        with their CasADi functions mapped over all the time points, and the
+        returned solution does not contain the states. Sensitivities are not
+        supported with this option.
     """
 
+    _cache_attributes = pybamm.BaseSolver._cache_attributes + (
+        "integrators",
+        "integrator_specs",
+        "y_sols",
+    )
+
     def __init__(
         self,
         mode="safe",
@@ -89,6 +103,7 @@ class CasadiSolver(pybamm.BaseSolver):
         return_solution_if_failed_early=False,
         perturb_algebraic_initial_conditions=None,
         integrators_maxcount=100,
+        output_variables=[],
     ):
         super().__init__(
             "problem dependent",
@@ -97,6 +112,7 @@ class CasadiSolver(pybamm.BaseSolver):
             root_method,
             root_tol,
             extrap_tol,
+            output_variables,
         )
         if mode in ["safe", "fast", "fast with events", "safe without grid"]:
             self.mode = mode
@@ -156,6 +172,12 @@ class CasadiSolver(pybamm.BaseSolver):
         # convert inputs to casadi format
         inputs = casadi.vertcat(*[x for x in inputs_dict.values()])
 
+        if self.output_variables and model.calculate_sensitivities:
+            raise pybamm.SolverError(
+                "Sensitivities cannot be calculated with output_variables "
+                "for the CasADi solver"
+            )
+
         if self.mode in ["fast", "fast with events"] or not model.events:
             if not model.events:
                 pybamm.logger.info("No events found, running fast mode")
@@ -176,6 +198,9 @@ class CasadiSolver(pybamm.BaseSolver):
             # termination point and exit
             solution = self._solve_for_event(solution)
             solution.check_ys_are_not_too_large()
+            if self.output_variables:
+                solution, outputs = self._reduce_solution(solution)
+                self._set_output_variables(solution, [outputs])
             return solution
         elif self.mode in ["safe", "safe without grid"]:
             y0 = model.y0
@@ -207,6 +232,12 @@ class CasadiSolver(pybamm.BaseSolver):
                 solution = None
                 use_grid = True
 
+            # Output variables of each window, if the states are not returned
+            all_outputs = []
+            if self.output_variables and solution is not None:
+                solution, outputs = self._reduce_solution(solution)
+                all_outputs.append(outputs)
+
             # Try to integrate in global steps of size dt_max. Note: dt_max must
             # be at least as big as the the biggest step in t_eval (multiplied
             # by some tolerance, here 1.01) to avoid an empty integration window below
@@ -295,6 +326,17 @@ class CasadiSolver(pybamm.BaseSolver):
                 current_step_sol = self._solve_for_event(current_step_sol)
                 # assign temporary solve time
                 current_step_sol.solve_time = np.nan
+                # update y0 as initial_values
+                # from which to start the new casadi integrator
+                y0 = current_step_sol.all_ys[-1][:, -1]
+                if self.output_variables:
+                    # Only keep the output variables, so that the states of each
+                    # window can be released
+                    current_step_sol.check_ys_are_not_too_large()
+                    current_step_sol, outputs = self._reduce_solution(
+                        current_step_sol
+                    )
+                    all_outputs.append(outputs)
                 # append solution from the current step to solution
                 solution = solution + current_step_sol
                 if current_step_sol.termination == "event":
@@ -303,24 +345,103 @@ class CasadiSolver(pybamm.BaseSolver):
                     # update time as time
                     # from which to start the new casadi integrator
                     t = t_window[-1]
-                    # update y0 as initial_values
-                    # from which to start the new casadi integrator
-                    y0 = solution.all_ys[-1][:, -1]
 
             # now we extract sensitivities from the solution
             if bool(model.calculate_sensitivities):
                 solution.sensitivities = True
 
             solution.check_ys_are_not_too_large()
+            if self.output_variables:
+                self._set_output_variables(solution, all_outputs)
             return solution
 
+    def _reduce_solution(self, solution):
+        """
+        Evaluate the output variables at the times of a solution and at its event, if
+        there is one, and return a solution without the states.
+
+        Returns
+        -------
+        reduced_solution : :class:`pybamm.Solution`
+            A solution with the same times, including the event time, but with no
+            states
+        outputs : tuple
+            The times, and a dictionary of the values of each output variable at
+            these times (one row per time, one column per non-zero entry)
+        """
+        model = solution.all_models[-1]
+        inputs_dict = solution.all_inputs[-1]
+        t = solution.t
+        y = solution.y
+        t_event = solution.t_event
+        if solution.termination == "event":
+            # Add the event to the times, as there is no event state from which
+            # to evaluate the output variables after the solve
+            if t_event[0] != t[-1]:
+                t = np.append(t, t_event)
+                y = casadi.horzcat(y, solution.y_event)
+            y_event = np.zeros((0, 1))
+        else:
+            y_event = None
+
+        inputs = casadi.vertcat(*[x for x in inputs_dict.values()])
+        t_casadi = casadi.DM(t).T
+        data = {}
+        for key, var_fcn in model.casadi_output_variables.items():
+            values = var_fcn.map(len(t))(t_casadi, y, inputs).full()
+            # Only keep the structural non-zeros, as returned by the IDAKLU solver
+            rows = var_fcn.sparsity_out(0).row()
+            data[key] = values[rows, :].T
+
+        reduced_solution = pybamm.Solution(
+            t,
+            np.zeros((0, len(t))),
+            model,
+            inputs_dict,
+            t_event,
+            y_event,
+            solution.termination,
+            sensitivities=False,
+            check_solution=False,
+        )
+        reduced_solution.closest_event_idx = solution.closest_event_idx
+        reduced_solution.solve_time = solution.solve_time
+        reduced_solution.integration_time = solution.integration_time
+        return reduced_solution, (t, data)
+
+    def _set_output_variables(self, solution, all_outputs):
+        """
+        Add the output variables, evaluated over each integration window by
+        :meth:`_reduce_solution`, to a solution
+        """
+        model = solution.all_models[-1]
+        all_data = {key: [] for key in model.casadi_output_variables}
+        t_last = None
+        for t, data in all_outputs:
+            # Skip the first time if it is repeated, as when adding solutions
+            start = 1 if t_last is not None and t[0] == t_last else 0
+            for key, values in data.items():
+                all_data[key].append(values[start:])
+            t_last = t[-1]
+        for key, var_fcn in model.casadi_output_variables.items():
+            solution._variables[key] = pybamm.ProcessedVariableComputed(
+                [model.variables_and_events[key]],
+                [var_fcn],
+                [np.concatenate(all_data[key])],
+                solution,
+            )
+
     def _solve_for_event(self, coarse_solution):
         """
         Check if the sign of an event changes, if so find an accurate
         termination point and exit
 
-        Locate the event time using a root finding algorithm and
-        event state using interpolation. The solution is then truncated
+        Locate the event time using a root finding algorithm on a dense output of
+        the solution in the interval where the event was triggered (see
+        :class:`_HermiteDenseOutput`). The dense output is only used if the state it
+        gives at the event agrees with the integrator to within the tolerances of
+        the solver. Otherwise, the interval is integrated again over a dense grid
+        and the event time found by interpolation. The solution is then truncated
         so that only the times up to the event are returned
         """
         pybamm.logger.debug("Solving for events")
@@ -408,7 +529,7 @@ class CasadiSolver(pybamm.BaseSolver):
 
             if typ == "window":
                 event_idx_lower = np.nanmin(event_idcs_lower)
-                return event_idx_lower, None, None
+                return event_idx_lower, event_idx, None
             elif typ == "exact":
                 # t_event is the earliest event triggered
                 t_event = np.nanmin(t_events)
@@ -422,7 +543,7 @@ class CasadiSolver(pybamm.BaseSolver):
                 return t_event, y_event, closest_event_idx
 
         # Find the interval in which the event was triggered
-        event_idx_lower, _, _ = find_t_event(coarse_solution, "window")
+        event_idx_lower, event_idx, _ = find_t_event(coarse_solution, "window")
 
         # Return the existing solution if no events have been triggered
         if event_idx_lower is None:
@@ -430,44 +551,87 @@ class CasadiSolver(pybamm.BaseSolver):
             coarse_solution.termination = "final time"
             return coarse_solution
 
-        # If events have been triggered, we solve for a dense window in the interval
-        # where the event was triggered, then find the precise location of the event
-        # Solve again with a more dense idx_window, starting from the start of the
-        # window where the event was triggered
-        t_window_event_dense = np.linspace(
-            coarse_solution.t[event_idx_lower],
-            coarse_solution.t[event_idx_lower + 1],
-            100,
-        )
-
-        if self.mode == "safe without grid":
-            use_grid = False
-        else:
-            self.create_integrator(model, inputs, t_window_event_dense)
-            use_grid = True
-
+        t_lower = coarse_solution.t[event_idx_lower]
+        t_upper = coarse_solution.t[event_idx_lower + 1]
         y0 = coarse_solution.y[:, event_idx_lower]
-        dense_step_sol = self._run_integrator(
-            model,
-            y0,
-            inputs_dict,
-            inputs,
-            t_window_event_dense,
-            use_grid=use_grid,
-            extract_sensitivities_in_solution=False,
-        )
+        integration_time = coarse_solution.integration_time
+
+        # If events have been triggered, find the precise location of the event in
+        # the interval where it was triggered, using a cubic Hermite interpolant of
+        # the solution in this interval as dense output. The derivatives at the ends
+        # of the interval are given by the model. In "fast with events" mode, the
+        # event switch stops the solution at the event, so the end of the interval
+        # is not on the solution of the model and the dense output cannot be used
+        y_event = None
+        if self.mode != "fast with events":
+            dense_output = _HermiteDenseOutput(
+                model,
+                inputs,
+                self._get_algebraic_rootfinder(model, inputs),
+                t_lower,
+                t_upper,
+                y0,
+                coarse_solution.y[:, event_idx_lower + 1],
+            )
+            t_events = []
+            for i in event_idx:
+                event = model.terminate_events_eval[i]
+                t_events.append(
+                    _find_event_time(
+                        lambda t: float(event(t, dense_output(t), inputs)) - 1e-5,
+                        t_lower,
+                        t_upper,
+                    )
+                )
+            if np.isnan(t_events).all():  # pragma: no cover
+                # This is extremely rare: the events were only crossed at the start
+                # of the next interval in the coarse solution, so use this point
+                t_event = t_upper
+                closest_event_idx = event_idx[0]
+                y_event = dense_output(t_event)
+            else:
+                # t_event is the earliest event triggered
+                t_event = np.nanmin(t_events)
+                closest_event_idx = event_idx[np.nanargmin(t_events)]
+                # The dense output is inaccurate if the interval is long compared to
+                # the dynamics of the model, so check it against the integrator at
+                # the event
+                step_sol = self._integrate_window(
+                    model, y0, inputs_dict, inputs, np.array([t_lower, t_event])
+                )
+                integration_time += step_sol.integration_time
+                y_step = step_sol.y[:, -1].full().flatten()
+                error = np.abs(dense_output(t_event) - y_step) / (
+                    self.atol + self.rtol * np.abs(y_step)
+                )
+                if np.max(error) <= 1:
+                    y_event = y_step
+                else:
+                    pybamm.logger.debug(
+                        "Dense output not accurate enough to locate the event"
+                    )
+
+        if y_event is None:
+            # Solve again with a more dense idx_window, starting from the start of the
+            # window where the event was triggered
+            dense_step_sol = self._integrate_window(
+                model, y0, inputs_dict, inputs, np.linspace(t_lower, t_upper, 100)
+            )
+            integration_time += dense_step_sol.integration_time
 
-        # Find the exact time at which the event was triggered
-        t_event, y_event, closest_event_idx = find_t_event(dense_step_sol, "exact")
-        # If this returns None, no event was crossed in dense_step_sol. This can happen
-        # if the event crossing was right at the end of the interval in the coarse
-        # solution. In this case, return the t and y from the end of the interval
-        # (i.e. next point in the coarse solution)
-        if y_event is None:  # pragma: no cover
-            # This is extremely rare, it's difficult to find a test that triggers this
-            # hence no coverage check
-            t_event = coarse_solution.t[event_idx_lower + 1]
-            y_event = coarse_solution.y[:, event_idx_lower + 1].full().flatten()
+            # Find the exact time at which the event was triggered
+            t_event, y_event, closest_event_idx = find_t_event(
+                dense_step_sol, "exact"
+            )
+            # If this returns None, no event was crossed in dense_step_sol. This can
+            # happen if the event crossing was right at the end of the interval in
+            # the coarse solution. In this case, return the t and y from the end of
+            # the interval (i.e. next point in the coarse solution)
+            if y_event is None:  # pragma: no cover
+                # This is extremely rare, it's difficult to find a test that
+                # triggers this hence no coverage check
+                t_event = t_upper
+                y_event = coarse_solution.y[:, event_idx_lower + 1].full().flatten()
 
         # Return solution truncated at the first coarse event time
         # Also assign t_event
@@ -483,14 +647,60 @@ class CasadiSolver(pybamm.BaseSolver):
             "event",
             sensitivities=bool(model.calculate_sensitivities),
         )
-        solution.integration_time = (
-            coarse_solution.integration_time + dense_step_sol.integration_time
-        )
+        solution.integration_time = integration_time
 
         solution.closest_event_idx = closest_event_idx
 
         return solution
 
+    def _integrate_window(self, model, y0, inputs_dict, inputs, t_window):
+        """
+        Integrate the model from `y0` over the times `t_window`, used to check or
+        refine the location of an event
+        """
+        if self.mode == "safe without grid":
+            use_grid = False
+        else:
+            self.create_integrator(model, inputs, t_window)
+            use_grid = True
+        return self._run_integrator(
+            model,
+            y0,
+            inputs_dict,
+            inputs,
+            t_window,
+            use_grid=use_grid,
+            extract_sensitivities_in_solution=False,
+        )
+
+    def _get_algebraic_rootfinder(self, model, inputs):
+        """
+        Return a rootfinder for the algebraic states of the model given the time and
+        the differential states, used to make the dense output of the solution
+        consistent. The rootfinder is stored with the integrators of the model, and
+        is None if the model has no algebraic states.
+        """
+        if model.len_alg == 0 or model not in self.integrators:
+            return None
+        integrators = self.integrators[model]
+        if "algebraic rootfinder" not in integrators:
+            t = casadi.MX.sym("t")
+            y_diff = casadi.MX.sym("y_diff", model.len_rhs)
+            y_alg = casadi.MX.sym("y_alg", model.len_alg)
+            p = casadi.MX.sym("p", inputs.shape[0])
+            algebraic = casadi.Function(
+                "algebraic",
+                [y_alg, casadi.vertcat(t, y_diff, p)],
+                [model.casadi_algebraic(t, casadi.vertcat(y_diff, y_alg), p)],
+            )
+            integrators["algebraic rootfinder"] = casadi.rootfinder(
+                "algebraic_rootfinder",
+                "newton",
+                algebraic,
+                {"error_on_fail": False, "abstol": 1e-10},
+            )
+        return integrators["algebraic rootfinder"]
+
     def create_integrator(self, model, inputs, t_eval=None, use_event_switch=False):
         """
         Method to create a casadi integrator object.
@@ -744,3 +954,115 @@ class CasadiSolver(pybamm.BaseSolver):
             )
             sol.integration_time = integration_time
             return sol
+
+
+class _HermiteDenseOutput:
+    """
+    Dense output of a solution between two consecutive time points, used to locate
+    events without running the integrator again.
+
+    The differential states are interpolated by cubic Hermite polynomials, using the
+    derivatives given by the right-hand side of the model at both ends of the
+    interval. The algebraic states are then found from the differential states with
+    `algebraic_rootfinder`, starting from a linear interpolation. Any other states
+    (e.g. sensitivities) are interpolated linearly.
+
+    Parameters
+    ----------
+    model : :class:`pybamm.BaseModel`
+        The model that was solved, set up by the solver
+    inputs : :class:`casadi.DM`
+        The stacked inputs
+    algebraic_rootfinder : :class:`casadi.Function`
+        Rootfinder for the algebraic states, see
+        :meth:`CasadiSolver._get_algebraic_rootfinder`. Can be None.
+    t_lower, t_upper : float
+        The ends of the interval
+    y_lower, y_upper : array-like
+        The states at the ends of the interval
+    """
+
+    def __init__(
+        self, model, inputs, algebraic_rootfinder, t_lower, t_upper, y_lower, y_upper
+    ):
+        self.inputs = inputs
+        self.t_lower = t_lower
+        self.dt = t_upper - t_lower
+        self.y_lower = np.asarray(y_lower, dtype=float).reshape(-1)
+        self.y_upper = np.asarray(y_upper, dtype=float).reshape(-1)
+
+        rhs = getattr(model, "casadi_rhs", None) if len(model.rhs) > 0 else None
+        if rhs is None or rhs.size1_in(1) != self.y_lower.shape[0]:
+            self.n_diff = 0
+            return
+        dydt_lower = np.array(rhs(t_lower, self.y_lower, inputs)).reshape(-1)
+        dydt_upper = np.array(rhs(t_upper, self.y_upper, inputs)).reshape(-1)
+        if not (np.isfinite(dydt_lower).all() and np.isfinite(dydt_upper).all()):
+            # Fall back to linear interpolation
+            self.n_diff = 0
+            return
+        self.n_diff = dydt_lower.shape[0]
+        self.dydt_lower = dydt_lower
+        self.dydt_upper = dydt_upper
+        if self.y_lower.shape[0] == model.len_rhs + model.len_alg:
+            self.algebraic_rootfinder = algebraic_rootfinder
+        else:
+            self.algebraic_rootfinder = None
+
+    def __call__(self, t):
+        s = (t - self.t_lower) / self.dt
+        y = (1 - s) * self.y_lower + s * self.y_upper
+        n = self.n_diff
+        if n > 0:
+            h00 = (1 + 2 * s) * (1 - s) ** 2
+            h10 = s * (1 - s) ** 2
+            h01 = s**2 * (3 - 2 * s)
+            h11 = s**2 * (s - 1)
+            y[:n] = (
+                h00 * self.y_lower[:n]
+                + h10 * self.dt * self.dydt_lower
+                + h01 * self.y_upper[:n]
+                + h11 * self.dt * self.dydt_upper
+            )
+            if self.algebraic_rootfinder is not None:
+                y_alg = self.algebraic_rootfinder(
+                    y[n:], casadi.vertcat(t, y[:n], self.inputs)
+                )
+                y_alg = np.array(y_alg).reshape(-1)
+                if np.isfinite(y_alg).all():
+                    y[n:] = y_alg
+        return y
+
+
+def _find_event_time(event, t_lower, t_upper):
+    """
+    Find the time at which `event` changes sign in [t_lower, t_upper]. Returns nan
+    if the event is positive at `t_upper`. A nan value of the event counts as the
+    event having been crossed.
+    """
+    event_upper = event(t_upper)
+    if event_upper > 0:
+        return np.nan
+    event_lower = event(t_lower)
+    if event_lower <= 0:
+        # The event was already crossed at the start of the solution, interpolate
+        # linearly between the distances to the event at each end
+        event_lower = abs(event_lower)
+        event_upper = abs(event_upper)
+        return (event_lower * t_upper + event_upper * t_lower) / (
+            event_lower + event_upper
+        )
+    if np.isnan(event_upper):
+        # Bisect to an interval where the event is not nan at either end
+        for _ in range(60):
+            t_mid = (t_lower + t_upper) / 2
+            event_mid = event(t_mid)
+            if event_mid > 0:
+                t_lower = t_mid
+            else:
+                t_upper = t_mid
+                if not np.isnan(event_mid):
+                    break
+        else:
+            return t_upper
+    return brentq(event, t_lower, t_upper)
@@ -0,0 +1,113 @@
+#
+# Jacobian calculated by coloured finite differences
+#
+import numpy as np
+from scipy.sparse import csr_matrix
+
+
+class FiniteDifferenceJacobian:
+    """
+    Evaluates the Jacobian of a function by finite differences, using its sparsity
+    pattern (see :class:`pybamm.JacobianSparsity`).
+
+    The columns of the Jacobian are coloured so that columns of the same colour
+    have no non-zero entries in the same row. The columns of each colour are then
+    perturbed together, so the Jacobian is calculated from one evaluation of the
+    function per colour (plus one at the unperturbed state) rather than one per
+    column. For the banded or block-sparse Jacobians of discretised models, the
+    number of colours does not grow with the number of states.
+
+    Parameters
+    ----------
+    function : callable
+        The function to differentiate, with signature `function(t, y, inputs)`,
+        e.g. a :class:`pybamm.EvaluatorPython`
+    sparsity : :class:`scipy.sparse.csr_matrix`
+        The sparsity pattern of the Jacobian of the function
+    """
+
+    def __init__(self, function, sparsity):
+        self._function = function
+        sparsity = csr_matrix(sparsity)
+        sparsity.sort_indices()
+        self.shape = sparsity.shape
+        self._indices = sparsity.indices
+        self._indptr = sparsity.indptr
+        self._rows = np.repeat(np.arange(sparsity.shape[0]), np.diff(sparsity.indptr))
+        self.colours = colour_columns(sparsity)
+        self.n_colours = int(self.colours.max()) + 1 if self.colours.size else 0
+        # colour of the column of each non-zero entry
+        self._entry_colours = self.colours[self._indices]
+
+    def _evaluate(self, t, y, inputs):
+        return np.reshape(self._function(t, y, inputs), -1)
+
+    def __call__(self, t=None, y=None, inputs=None):
+        """
+        evaluate the jacobian
+        """
+        y = np.array(y, dtype=float).reshape(-1)
+        f = self._evaluate(t, y, inputs)
+
+        # the steps are chosen so that y + step is exactly representable
+        step = np.sqrt(np.finfo(float).eps) * np.maximum(np.abs(y), 1)
+        step = (y + step) - y
+
+        differences = np.empty((self.shape[0], self.n_colours))
+        for colour in range(self.n_colours):
+            y_perturbed = y.copy()
+            columns = self.colours == colour
+            y_perturbed[columns] += step[columns]
+            differences[:, colour] = self._evaluate(t, y_perturbed, inputs) - f
+
+        data = differences[self._rows, self._entry_colours] / step[self._indices]
+        return csr_matrix(
+            (data, self._indices.copy(), self._indptr.copy()), shape=self.shape
+        )
+
+    def jvp(self, t=None, y=None, v=None, inputs=None):
+        """
+        evaluate jacobian vector product of function, with a single finite
+        difference in the direction of `v`
+        """
+        y = np.array(y, dtype=float).reshape(-1)
+        v = np.array(v, dtype=float).reshape(-1)
+        v_norm = np.linalg.norm(v)
+        if v_norm == 0:
+            return np.zeros((self.shape[0], 1))
+        step = np.sqrt(np.finfo(float).eps) * max(np.linalg.norm(y), 1) / v_norm
+        f = self._evaluate(t, y, inputs)
+        f_perturbed = self._evaluate(t, y + step * v, inputs)
+        return ((f_perturbed - f) / step).reshape(-1, 1)
+
+
+def colour_columns(sparsity):
+    """
+    Colour the columns of a sparsity pattern so that no two columns of the same
+    colour have a non-zero entry in the same row, using a greedy algorithm.
+
+    Parameters
+    ----------
+    sparsity : :class:`scipy.sparse.spmatrix`
+        The sparsity pattern
+
+    Returns
+    -------
+    :class:`numpy.ndarray`
+        The colour of each column, numbered from 0
+    """
+    pattern = csr_matrix(sparsity, dtype=bool)
+    # columns that share a row
+    conflicts = (pattern.T @ pattern).tocsr()
+    n_cols = pattern.shape[1]
+    colours = np.full(n_cols, -1, dtype=int)
+    used = np.zeros(n_cols + 1, dtype=bool)
+    indices, indptr = conflicts.indices, conflicts.indptr
+    for col in range(n_cols):
+        neighbours = indices[indptr[col] : indptr[col + 1]]
+        neighbour_colours = colours[neighbours]
+        neighbour_colours = neighbour_colours[neighbour_colours >= 0]
+        used[neighbour_colours] = True
+        colours[col] = np.argmin(used)
+        used[neighbour_colours] = False
+    return colours
@@ -71,7 +71,9 @@ class IDAKLUSolver(pybamm.BaseSolver):
                 # for iterative linear solver preconditioner, bandwidth of
                 # approximate jacobian that is kept
                 "precon_half_bandwidth_keep": 5,
-                # Number of threads available for OpenMP
+                # Number of threads available for OpenMP. When solving for a list
+                # of inputs, this is the number of parameter sets that are solved
+                # in parallel
                 "num_threads": 1,
             }
 
@@ -464,7 +466,7 @@ class IDAKLUSolver(pybamm.BaseSolver):
                 "dvar_dp_idaklu_fcns": self.dvar_dp_idaklu_fcns,
             }
 
-            solver = idaklu.create_casadi_solver(
+            self._setup["solver_args"] = dict(
                 number_of_states=len(y0),
                 number_of_parameters=self._setup["number_of_sensitivity_parameters"],
                 rhs_alg=self._setup["rhs_algebraic"],
@@ -489,7 +491,9 @@ class IDAKLUSolver(pybamm.BaseSolver):
                 options=self._options,
             )
 
-            self._setup["solver"] = solver
+            self._setup["solver"] = idaklu.create_casadi_solver(
+                **self._setup["solver_args"]
+            )
         else:
             self._setup = {
                 "resfn": resfn,
@@ -505,27 +509,19 @@ class IDAKLUSolver(pybamm.BaseSolver):
 
         return base_set_up_return
 
-    def _integrate(self, model, t_eval, inputs_dict=None):
-        """
-        Solve a DAE model defined by residuals with initial conditions y0.
-
-        Parameters
-        ----------
-        model : :class:`pybamm.BaseModel`
-            The model whose solution to calculate.
-        t_eval : numeric type
-            The times at which to compute the solution
-        inputs_dict : dict, optional
-            Any input parameters to pass to the model when solving
-        """
-        inputs_dict = inputs_dict or {}
-        # stack inputs
+    def _stack_inputs(self, inputs_dict):
+        """Stack the input parameters into a column vector"""
         if inputs_dict:
             arrays_to_stack = [np.array(x).reshape(-1, 1) for x in inputs_dict.values()]
-            inputs = np.vstack(arrays_to_stack)
+            return np.vstack(arrays_to_stack)
         else:
-            inputs = np.array([[]])
+            return np.array([[]])
 
+    def _get_initial_state(self, model):
+        """
+        Return the initial state and its time derivative, both on their own and
+        stacked with the initial sensitivities (if any)
+        """
         # do this here cause y0 is set after set_up (calc consistent conditions)
         y0 = model.y0
         if isinstance(y0, casadi.DM):
@@ -553,6 +549,33 @@ class IDAKLUSolver(pybamm.BaseSolver):
             y0full = y0
             ydot0full = ydot0
 
+        return y0, ydot0, y0full, ydot0full
+
+    def _integrate(self, model, t_eval, inputs_dict=None):
+        """
+        Solve a DAE model defined by residuals with initial conditions y0.
+
+        Parameters
+        ----------
+        model : :class:`pybamm.BaseModel`
+            The model whose solution to calculate.
+        t_eval : numeric type
+            The times at which to compute the solution
+        inputs_dict : dict or list, optional
+            Any input parameters to pass to the model when solving. If a list of
+            dictionaries is given, all the parameter sets are solved in a single call
+            to the solver (see :meth:`_integrate_batch`) and a list of solutions is
+            returned
+        """
+        if isinstance(inputs_dict, list):
+            return self._integrate_batch(model, t_eval, inputs_dict)
+
+        inputs_dict = inputs_dict or {}
+        # stack inputs
+        inputs = self._stack_inputs(inputs_dict)
+
+        y0, ydot0, y0full, ydot0full = self._get_initial_state(model)
+
         try:
             atol = model.atol
         except AttributeError:
@@ -592,18 +615,94 @@ class IDAKLUSolver(pybamm.BaseSolver):
             )
         integration_time = timer.time()
 
+        return self._post_process_solution(
+            model, sol.t, sol.y, sol.yS, sol.flag, inputs_dict, integration_time
+        )
+
+    def _integrate_batch(self, model, t_eval, inputs_list):
+        """
+        Solve a DAE model for several sets of input parameters in a single call to
+        the solver. Each parameter set is solved by an independent IDA instance, and
+        the parameter sets are distributed over "num_threads" threads with the GIL
+        released.
+
+        Parameters
+        ----------
+        model : :class:`pybamm.BaseModel`
+            The model whose solution to calculate.
+        t_eval : numeric type
+            The times at which to compute the solution
+        inputs_list : list of dict
+            The input parameters for each solve. The initial conditions must not
+            depend on the input parameters.
+
+        Returns
+        -------
+        list of :class:`pybamm.Solution`
+            One solution per set of input parameters
+        """
+        if model.convert_to_format != "casadi":
+            raise pybamm.SolverError(
+                "Solving for a list of inputs in a single call to the IDAKLU solver "
+                'requires convert_to_format="casadi"'
+            )
+
+        # create the solvers on first use, one per thread
+        if "solver_group" not in self._setup:
+            self._setup["solver_group"] = idaklu.create_casadi_solver_group(
+                number_of_solvers=self._options["num_threads"],
+                **self._setup["solver_args"],
+            )
+
+        # one row of stacked inputs per parameter set
+        inputs = np.vstack(
+            [
+                self._stack_inputs(inputs_dict).reshape(1, -1)
+                for inputs_dict in inputs_list
+            ]
+        )
+
+        _, _, y0full, ydot0full = self._get_initial_state(model)
+
+        timer = pybamm.Timer()
+        sols = self._setup["solver_group"].solve(t_eval, y0full, ydot0full, inputs)
+        integration_time = timer.time()
+
+        length_of_return_vector = sols.y.shape[1] // len(t_eval)
+        solutions = []
+        for i, inputs_dict in enumerate(inputs_list):
+            number_of_timesteps = sols.number_of_timesteps[i]
+            solutions.append(
+                self._post_process_solution(
+                    model,
+                    sols.t[i, :number_of_timesteps],
+                    sols.y[i, : number_of_timesteps * length_of_return_vector],
+                    sols.yS[i],
+                    sols.flag[i],
+                    inputs_dict,
+                    integration_time,
+                )
+            )
+        return solutions
+
+    def _post_process_solution(
+        self, model, t, y, yS, flag, inputs_dict, integration_time
+    ):
+        """
+        Convert the raw output of the idaklu solver into a :class:`pybamm.Solution`
+        """
         number_of_sensitivity_parameters = self._setup[
             "number_of_sensitivity_parameters"
         ]
         sensitivity_names = self._setup["sensitivity_names"]
-        t = sol.t
         number_of_timesteps = t.size
-        number_of_states = y0.size
+        # there is one rhs/algebraic id per state
+        number_of_states = self._setup["ids"].size
         if self.output_variables:
             # Substitute empty vectors for state vector 'y'
             y_out = np.zeros((number_of_timesteps * number_of_states, 0))
         else:
-            y_out = sol.y.reshape((number_of_timesteps, number_of_states))
+            y_out = y.reshape((number_of_timesteps, number_of_states))
 
         # return sensitivity solution, we need to flatten yS to
         # (#timesteps * #states (where t is changing the quickest),)
@@ -611,24 +710,23 @@ class IDAKLUSolver(pybamm.BaseSolver):
         # note that yS is (n_p, n_t, n_y)
         if number_of_sensitivity_parameters != 0:
             yS_out = {
-                name: sol.yS[i].reshape(-1, 1)
-                for i, name in enumerate(sensitivity_names)
+                name: yS[i].reshape(-1, 1) for i, name in enumerate(sensitivity_names)
             }
             # add "all" stacked sensitivities ((#timesteps * #states,#sens_params))
             yS_out["all"] = np.hstack([yS_out[name] for name in sensitivity_names])
         else:
             yS_out = False
 
-        if sol.flag in [0, 2]:
+        if flag in [0, 2]:
             # 0 = solved for all t_eval
-            if sol.flag == 0:
+            if flag == 0:
                 termination = "final time"
             # 2 = found root(s)
-            elif sol.flag == 2:
+            elif flag == 2:
                 termination = "event"
 
             newsol = pybamm.Solution(
-                sol.t,
+                t,
                 np.transpose(y_out),
                 model,
                 inputs_dict,
@@ -640,8 +738,8 @@ class IDAKLUSolver(pybamm.BaseSolver):
             newsol.integration_time = integration_time
             if self.output_variables:
                 # Populate variables and sensititivies dictionaries directly
-                number_of_samples = sol.y.shape[0] // number_of_timesteps
-                sol.y = sol.y.reshape((number_of_timesteps, number_of_samples))
+                number_of_samples = y.shape[0] // number_of_timesteps
+                y = y.reshape((number_of_timesteps, number_of_samples))
                 startk = 0
                 for vark, var in enumerate(self.output_variables):
                     # ExplicitTimeIntegral's are not computed as part of the solver and
@@ -656,7 +754,7 @@ class IDAKLUSolver(pybamm.BaseSolver):
                     newsol._variables[var] = pybamm.ProcessedVariableComputed(
                         [model.variables_and_events[var]],
                         [self._setup["var_casadi_fcns"][var]],
-                        [sol.y[:, startk : (startk + len_of_var)]],
+                        [y[:, startk : (startk + len_of_var)]],
                         newsol,
                     )
                     # Add sensitivities
@@ -665,7 +763,7 @@ class IDAKLUSolver(pybamm.BaseSolver):
                         for paramk, param in enumerate(inputs_dict.keys()):
                             newsol[var].add_sensitivity(
                                 param,
-                                [sol.yS[:, startk : (startk + len_of_var), paramk]],
+                                [yS[:, startk : (startk + len_of_var), paramk]],
                             )
                     startk += len_of_var
             return newsol
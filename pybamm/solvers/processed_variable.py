@@ -110,20 +110,35 @@ class ProcessedVariable(object):
                             + "(note processing of 3D variables is not yet implemented)"
                         )
 
-    def initialise_0D(self):
-        # initialise empty array of the correct size
-        entries = np.empty(len(self.t_pts))
+    def _evaluate_base_variables(self):
+        """
+        Evaluate the base variables at all the time points of the solution, returning
+        an array of shape (base_eval_size, len(t_pts)).
+
+        Instead of calling the casadi function once per time point, the function is
+        mapped over blocks of time points (see :func:`_evaluate_casadi_map`), which
+        is much faster for long solutions.
+        """
+        entries = np.empty((int(self.base_eval_size), len(self.t_pts)))
+        # Mapped functions are shared between sub-solutions that use the same
+        # casadi function (e.g. repeated steps of an experiment)
+        mapped_functions = {}
         idx = 0
-        # Evaluate the base_variable index-by-index
         for ts, ys, inputs, base_var_casadi in zip(
             self.all_ts, self.all_ys, self.all_inputs_casadi, self.base_variables_casadi
         ):
-            for inner_idx, t in enumerate(ts):
-                t = ts[inner_idx]
-                y = ys[:, inner_idx]
-                entries[idx] = float(base_var_casadi(t, y, inputs))
+            entries[:, idx : idx + len(ts)] = _evaluate_casadi_map(
+                base_var_casadi,
+                ts,
+                ys,
+                inputs,
+                mapped_functions.setdefault(id(base_var_casadi), {}),
+            )
+            idx += len(ts)
+        return entries
 
-                idx += 1
+    def initialise_0D(self):
+        entries = self._evaluate_base_variables()[0]
 
         if self.cumtrapz_ic is not None:
             entries = cumulative_trapezoid(
@@ -137,19 +152,7 @@ class ProcessedVariable(object):
         self.dimensions = 0
 
     def initialise_1D(self, fixed_t=False):
-        len_space = self.base_eval_shape[0]
-        entries = np.empty((len_space, len(self.t_pts)))
-
-        # Evaluate the base_variable index-by-index
-        idx = 0
-        for ts, ys, inputs, base_var_casadi in zip(
-            self.all_ts, self.all_ys, self.all_inputs_casadi, self.base_variables_casadi
-        ):
-            for inner_idx, t in enumerate(ts):
-                t = ts[inner_idx]
-                y = ys[:, inner_idx]
-                entries[:, idx] = base_var_casadi(t, y, inputs).full()[:, 0]
-                idx += 1
+        entries = self._evaluate_base_variables()
 
         # Get node and edge values
         nodes = self.mesh.nodes
@@ -207,22 +210,11 @@ class ProcessedVariable(object):
         second_dim_pts = second_dim_nodes
         first_dim_size = len(first_dim_pts)
         second_dim_size = len(second_dim_pts)
-        entries = np.empty((first_dim_size, second_dim_size, len(self.t_pts)))
-
-        # Evaluate the base_variable index-by-index
-        idx = 0
-        for ts, ys, inputs, base_var_casadi in zip(
-            self.all_ts, self.all_ys, self.all_inputs_casadi, self.base_variables_casadi
-        ):
-            for inner_idx, t in enumerate(ts):
-                t = ts[inner_idx]
-                y = ys[:, inner_idx]
-                entries[:, :, idx] = np.reshape(
-                    base_var_casadi(t, y, inputs).full(),
-                    [first_dim_size, second_dim_size],
-                    order="F",
-                )
-                idx += 1
+        entries = np.reshape(
+            self._evaluate_base_variables(),
+            [first_dim_size, second_dim_size, len(self.t_pts)],
+            order="F",
+        )
 
         # add points outside first dimension domain for extrapolation to
         # boundaries
@@ -304,22 +296,9 @@ class ProcessedVariable(object):
         len_y = len(y_sol)
         z_sol = self.mesh.edges["z"]
         len_z = len(z_sol)
-        entries = np.empty((len_y, len_z, len(self.t_pts)))
-
-        # Evaluate the base_variable index-by-index
-        idx = 0
-        for ts, ys, inputs, base_var_casadi in zip(
-            self.all_ts, self.all_ys, self.all_inputs_casadi, self.base_variables_casadi
-        ):
-            for inner_idx, t in enumerate(ts):
-                t = ts[inner_idx]
-                y = ys[:, inner_idx]
-                entries[:, :, idx] = np.reshape(
-                    base_var_casadi(t, y, inputs).full(),
-                    [len_y, len_z],
-                    order="C",
-                )
-                idx += 1
+        entries = np.reshape(
+            self._evaluate_base_variables(), [len_y, len_z, len(self.t_pts)], order="C"
+        )
 
         # assign attributes for reference
         self.entries = entries
@@ -461,3 +440,53 @@ class ProcessedVariable(object):
 
         # Save attribute
         self._sensitivities = sensitivities
+
+
+def _evaluate_casadi_map(
+    base_var_casadi, ts, ys, inputs, mapped_functions, chunk_size=1000
+):
+    """
+    Evaluate a casadi function `f(t, y, inputs)` at each time `ts[i]` and state
+    `ys[:, i]`, returning an array with one column per time.
+
+    The function is mapped over chunks of up to `chunk_size` time points. Creating a
+    mapped function takes time proportional to the number of evaluations, so the
+    mapped functions are stored in `mapped_functions` (keyed by size) and reused for
+    every chunk. If `ys` is a numpy array, the result is written directly into a
+    numpy buffer, which avoids converting a potentially large casadi.DM to numpy.
+    """
+    n = len(ts)
+    t_row = np.ascontiguousarray(np.reshape(ts, (1, n)), dtype=float)
+    if isinstance(ys, casadi.DM) and base_var_casadi.numel_out(0) > ys.shape[0]:
+        # Converting the states to numpy is cheaper than converting the outputs
+        ys = ys.full()
+    use_buffer = not isinstance(ys, casadi.DM)
+    if use_buffer:
+        ys = np.asfortranarray(ys, dtype=float)
+        inputs = np.ascontiguousarray(casadi.DM(inputs).full(), dtype=float)
+    out = np.empty((base_var_casadi.numel_out(0), n), order="F")
+
+    for start in range(0, n, chunk_size):
+        stop = min(start + chunk_size, n)
+        size = stop - start
+        if size not in mapped_functions:
+            # Map over t and y but not the inputs (input 2)
+            mapped = base_var_casadi.map("mapped_variable", "serial", size, [2], [])
+            if mapped.sparsity_out(0).is_dense():
+                mapped_functions[size] = (mapped, mapped.buffer())
+            else:
+                mapped_functions[size] = (mapped, None)
+        mapped, buffer = mapped_functions[size]
+
+        if use_buffer and buffer is not None:
+            buffer, evaluate = buffer
+            buffer.set_arg(0, memoryview(t_row[:, start:stop]))
+            buffer.set_arg(1, memoryview(ys[:, start:stop]))
+            buffer.set_arg(2, memoryview(inputs))
+            buffer.set_res(0, memoryview(out[:, start:stop]))
+            evaluate()
+        else:
+            out[:, start:stop] = mapped(
+                t_row[:, start:stop], ys[:, start:stop], inputs
+            ).full()
+    return out
@@ -86,6 +86,8 @@ class Solution(object):
         self._all_ys = all_ys
         self._all_ys_and_sens = all_ys
         self._all_models = all_models
+        # The lists above may be shared with other solutions, see `append`
+        self._owns_lists = False
 
         # Set up inputs
         if not isinstance(all_inputs, list):
@@ -347,9 +349,15 @@ class Solution(object):
         """Model(s) used for solution"""
         return self._all_models
 
-    @cached_property
+    @property
     def all_inputs_casadi(self):
-        return [casadi.vertcat(*inp.values()) for inp in self.all_inputs]
+        try:
+            return self._all_inputs_casadi
+        except AttributeError:
+            self._all_inputs_casadi = [
+                casadi.vertcat(*inp.values()) for inp in self.all_inputs
+            ]
+            return self._all_inputs_casadi
 
     @property
     def t_event(self):
@@ -458,6 +466,53 @@ class Solution(object):
             {name: np.array(value) for name, value in summary_variables.items()}
         )
 
+    def calculate_esoh_summary_variables(self, esoh_solver):
+        """
+        Calculate the electrode SOH (eSOH) summary variables of all the cycles of an
+        experiment in a single batched solve (see
+        :meth:`pybamm.lithium_ion.ElectrodeSOHSolver.solve_batch`), and add them to
+        the summary variables. This can be used after the experiment has been solved
+        with `calc_esoh=False`, since the eSOH inputs are calculated from the
+        summary variables.
+
+        Parameters
+        ----------
+        esoh_solver : :class:`pybamm.lithium_ion.ElectrodeSOHSolver`
+            Solver to calculate the eSOH variables, e.g.
+            `simulation.get_esoh_solver(True)`
+        """
+        all_summary_variables = getattr(self, "all_summary_variables", None)
+        if not all_summary_variables:
+            raise ValueError(
+                "The solution has no summary variables, which are only calculated "
+                "for experiments"
+            )
+        Q_Li_per_mol = pybamm.constants.F.value / 3600
+        inputs = {
+            "Q_n": [
+                sum_vars["Negative electrode capacity [A.h]"]
+                for sum_vars in all_summary_variables
+            ],
+            "Q_p": [
+                sum_vars["Positive electrode capacity [A.h]"]
+                for sum_vars in all_summary_variables
+            ],
+            "Q_Li": [
+                sum_vars["Total lithium in particles [mol]"] * Q_Li_per_mol
+                for sum_vars in all_summary_variables
+            ],
+        }
+        try:
+            esoh_sol = esoh_solver.solve_batch(inputs)
+        except pybamm.SolverError:  # pragma: no cover
+            raise pybamm.SolverError(
+                "Could not solve for summary variables, run "
+                "`sim.solve(calc_esoh=False)` to skip this step"
+            )
+        for i, sum_vars in enumerate(all_summary_variables):
+            sum_vars.update({name: value[i] for name, value in esoh_sol.items()})
+        self.set_summary_variables(all_summary_variables)
+
     def update(self, variables):
         """Add ProcessedVariables to the dictionary of variables in the solution"""
         # make sure that sensitivities are extracted if required
@@ -517,6 +572,12 @@ class Solution(object):
         inputs_MX = casadi.vertcat(*[p for p in inputs_MX_dict.values()])
         var_sym = var_pybamm.to_casadi(t_MX, y_MX, inputs=inputs_MX_dict)
         var_casadi = casadi.Function("variable", [t_MX, y_MX, inputs_MX], [var_sym])
+        # Expand to an SX function where possible, as these are faster to evaluate
+        # at the many time points of a solution
+        try:
+            var_casadi = var_casadi.expand()
+        except RuntimeError:  # pragma: no cover
+            pass
         return var_casadi
 
     def __getitem__(self, key):
@@ -733,52 +794,128 @@ class Solution(object):
             raise pybamm.SolverError(
                 "Only a Solution or None can be added to a Solution"
             )
+        new_sol = self.copy()
+        new_sol.sensitivities = bool(self.sensitivities)
+        new_sol.set_up_time = None
+        new_sol.append(other)
+        return new_sol
+
+    def append(self, other):
+        """
+        Append another solution to this solution, in place, e.g. when stepping. This
+        has the same result as `self + other`, but the cost only depends on the
+        size of `other`, not on the size of this solution, so solutions can be built
+        up from many steps efficiently.
+
+        Parameters
+        ----------
+        other : :class:`pybamm.Solution` or :class:`pybamm.EmptySolution` or None
+            The solution to append. Appending None or an
+            :class:`pybamm.EmptySolution` has no effect.
+
+        Notes
+        -----
+        Solutions that were created from this one before it was appended to (e.g.
+        with `self + other`) may still refer to it in their
+        :attr:`sub_solutions`, so these will include the appended states.
+        """
+        if other is None or isinstance(other, EmptySolution):
+            return
+        if not isinstance(other, Solution):
+            raise pybamm.SolverError(
+                "Only a Solution or None can be added to a Solution"
+            )
+        if other is self:
+            other = self._snapshot()
         # Special case: new solution only has one timestep and it is already in the
-        # existing solution. In this case, return a copy of the existing solution
+        # existing solution. In this case, only update the termination
         if (
             len(other.all_ts) == 1
             and len(other.all_ts[0]) == 1
             and other.all_ts[0][0] == self.all_ts[-1][-1]
         ):
-            new_sol = self.copy()
-            # Update termination using the latter solution
-            new_sol._termination = other.termination
-            new_sol._t_event = other._t_event
-            new_sol._y_event = other._y_event
-            return new_sol
+            self._termination = other.termination
+            self._t_event = other._t_event
+            self._y_event = other._y_event
+            return
+
+        if not self._owns_lists:
+            # The lists may be shared with other solutions (e.g. after `copy`), so
+            # take a copy of them before extending them. A solution is its own
+            # first sub-solution, so that is replaced by a copy of its current state
+            self._sub_solutions = [
+                self._snapshot() if sol is self else sol for sol in self.sub_solutions
+            ]
+            self._all_ts = list(self._all_ts)
+            self._all_ys = list(self._all_ys)
+            self._all_ys_and_sens = self._all_ys
+            self._all_models = list(self._all_models)
+            self.all_inputs = list(self.all_inputs)
+            self._all_inputs_casadi = list(self.all_inputs_casadi)
+            self._owns_lists = True
 
         # Update list of sub-solutions
         if other.all_ts[0][0] == self.all_ts[-1][-1]:
             # Skip first time step if it is repeated
-            all_ts = self.all_ts + [other.all_ts[0][1:]] + other.all_ts[1:]
-            all_ys = self.all_ys + [other.all_ys[0][:, 1:]] + other.all_ys[1:]
+            new_ts = [other.all_ts[0][1:]] + other.all_ts[1:]
+            new_ys = [other.all_ys[0][:, 1:]] + other.all_ys[1:]
         else:
-            all_ts = self.all_ts + other.all_ts
-            all_ys = self.all_ys + other.all_ys
-
-        new_sol = Solution(
-            all_ts,
-            all_ys,
-            self.all_models + other.all_models,
-            self.all_inputs + other.all_inputs,
-            other.t_event,
-            other.y_event,
-            other.termination,
-            bool(self.sensitivities),
-        )
-
-        new_sol.closest_event_idx = other.closest_event_idx
-        new_sol._all_inputs_casadi = self.all_inputs_casadi + other.all_inputs_casadi
+            new_ts = other.all_ts
+            new_ys = other.all_ys
+        self._extend_t(new_ts)
+        self._all_ts.extend(new_ts)
+        self._all_ys.extend(new_ys)
+        self._all_models.extend(other.all_models)
+        self.all_inputs.extend(other.all_inputs)
+        self._all_inputs_casadi.extend(other.all_inputs_casadi)
+        self._sub_solutions.extend(other.sub_solutions)
+
+        self._t_event = other.t_event
+        self._y_event = other.y_event
+        self._termination = other.termination
+        self.closest_event_idx = other.closest_event_idx
 
         # Set solution time
-        new_sol.solve_time = self.solve_time + other.solve_time
-        new_sol.integration_time = self.integration_time + other.integration_time
+        self.solve_time = self.solve_time + other.solve_time
+        self.integration_time = self.integration_time + other.integration_time
+
+        # Clear values that depend on the previous states
+        for attr in ["_y", "last_state"]:
+            self.__dict__.pop(attr, None)
+        self._variables = pybamm.FuzzyDict()
+        self.data = pybamm.FuzzyDict()
 
-        # Set sub_solutions
-        new_sol._sub_solutions = self.sub_solutions + other.sub_solutions
+        self.check_ys_are_not_too_large()
 
+    def _snapshot(self):
+        """Copy of the solution that is its own (only) sub-solution"""
+        new_sol = self.copy()
+        new_sol._sub_solutions = [new_sol]
         return new_sol
 
+    def _extend_t(self, new_ts):
+        """
+        Extend the concatenated times, if these have already been computed, with
+        `new_ts`. Space for the times is allocated in blocks of increasing size so that
+        the amortised cost does not depend on the number of times already stored.
+        """
+        if "_t" not in self.__dict__:
+            return
+        t = self._t
+        new_t = np.concatenate(new_ts)
+        if len(new_t) > 0 and (new_t[0] <= t[-1] or any(np.diff(new_t) <= 0)):
+            # Leave the error to `set_t`
+            del self._t
+            return
+        n = len(t)
+        buffer = self.__dict__.get("_t_buffer")
+        if buffer is None or t.base is not buffer or n + len(new_t) > len(buffer):
+            buffer = np.empty(2 * (n + len(new_t)))
+            buffer[:n] = t
+            self._t_buffer = buffer
+        buffer[n : n + len(new_t)] = new_t
+        self._t = buffer[: n + len(new_t)]
+
     def __radd__(self, other):
         return self.__add__(other)
 
@@ -802,6 +939,106 @@ class Solution(object):
 
         return new_sol
 
+    def thin(self, tolerances):
+        """
+        Return a copy of the solution at a subset of its times, chosen so that
+        linear interpolation between the remaining times reproduces some variables to
+        within absolute tolerances. Fewer times are kept where the variables change
+        slowly (e.g. during rests) than where they change quickly.
+
+        The times are chosen by recursive bisection: the time at which a variable is
+        furthest (relative to its tolerance) from the linear interpolant between
+        two kept times is kept, until all the variables are within their tolerances.
+        The first and last times of each sub-solution, and the event, are always
+        kept.
+
+        Parameters
+        ----------
+        tolerances : dict
+            Absolute tolerances, with the names of the variables as keys
+
+        Returns
+        -------
+        :class:`pybamm.Solution`
+            The thinned solution
+        """
+        if self._sensitivities is not False and self._sensitivities != {}:
+            raise NotImplementedError("Cannot thin a solution with sensitivities")
+        if any(
+            isinstance(variable, pybamm.ProcessedVariableComputed)
+            for variable in self._variables.values()
+        ):
+            raise NotImplementedError(
+                "Cannot thin a solution whose variables were computed by the solver"
+            )
+
+        n_t = len(self.t)
+        values = []
+        atols = []
+        for name, atol in tolerances.items():
+            entries = np.reshape(self[name].entries, (-1, n_t))
+            values.append(entries)
+            atols.append(np.full(entries.shape[0], atol, dtype=float))
+        values = np.concatenate(values)
+        atols = np.concatenate(atols)
+
+        all_ts = []
+        all_ys = []
+        start = 0
+        for ts, ys in zip(self.all_ts, self.all_ys):
+            end = start + len(ts)
+            idx = _thinned_indices(ts, values[:, start:end], atols)
+            all_ts.append(ts[idx])
+            all_ys.append(ys[:, idx.tolist()])
+            start = end
+
+        new_sol = self.__class__(
+            all_ts,
+            all_ys,
+            self.all_models,
+            self.all_inputs,
+            self.t_event,
+            self.y_event,
+            self.termination,
+            check_solution=False,
+        )
+        new_sol._all_inputs_casadi = self.all_inputs_casadi
+        new_sol.closest_event_idx = self.closest_event_idx
+
+        new_sol.solve_time = self.solve_time
+        new_sol.integration_time = self.integration_time
+        new_sol.set_up_time = self.set_up_time
+
+        return new_sol
+
+
+def _thinned_indices(t, values, atols):
+    """
+    Indices of the times to keep when thinning a solution, see
+    :meth:`Solution.thin`
+    """
+    n_t = len(t)
+    keep = np.zeros(n_t, dtype=bool)
+    keep[[0, -1]] = n_t > 0
+    intervals = [(0, n_t - 1)]
+    while intervals:
+        i, j = intervals.pop()
+        if j - i < 2:
+            continue
+        s = (t[i + 1 : j] - t[i]) / (t[j] - t[i])
+        v_i = values[:, i : i + 1]
+        v_j = values[:, j : j + 1]
+        errors = np.abs(values[:, i + 1 : j] - (v_i + s * (v_j - v_i)))
+        errors = np.max(errors / atols[:, None], axis=0)
+        k = np.argmax(errors)
+        # Keep the time if the variables are not within the tolerances (a nan value
+        # also counts as not being within the tolerances)
+        if not errors[k] <= 1:
+            k += i + 1
+            keep[k] = True
+            intervals += [(i, k), (k, j)]
+    return np.flatnonzero(keep)
+
 
 class EmptySolution:
     def __init__(self, termination=None, t=None):
@@ -851,7 +1088,10 @@ def make_cycle_solution(step_solutions, esoh_solver=None, save_this_cycle=True):
     """
     sum_sols = step_solutions[0].copy()
     for step_solution in step_solutions[1:]:
-        sum_sols = sum_sols + step_solution
+        if isinstance(sum_sols, Solution):
+            sum_sols.append(step_solution)
+        else:
+            sum_sols = sum_sols + step_solution
 
     cycle_solution = Solution(
         sum_sols.all_ts,
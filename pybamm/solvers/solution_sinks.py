@@ -0,0 +1,122 @@
+#
+# Sinks to which the solutions of an experiment are streamed
+#
+import os
+
+import pybamm
+
+
+class SolutionSink:
+    """
+    Base class for sinks, to which :meth:`pybamm.Simulation.solve` hands the
+    solution of each step and cycle of an experiment as soon as it has been solved
+    (see the `sink` argument of :meth:`pybamm.Simulation.solve`). The solutions are
+    then released, so that only the state needed to continue the experiment and the
+    summary variables are kept in memory.
+
+    Subclasses can e.g. write the solutions to files, put them in a queue, or
+    process them in any other way. Each method should return `None`.
+
+    **EXPERIMENTAL** - this class is experimental and the sink interface may change
+    in future releases.
+    """
+
+    def write_step(self, step_solution, logs):
+        """
+        Called at the end of each step of the experiment.
+
+        Parameters
+        ----------
+        step_solution : :class:`pybamm.Solution` or :class:`pybamm.EmptySolution`
+            The solution of the step
+        logs : dict
+            Information about the simulation, as passed to the callbacks (see
+            :class:`pybamm.callbacks.Callback`)
+        """
+        pass
+
+    def write_cycle(self, cycle_solution, logs):
+        """
+        Called at the end of each cycle of the experiment, after the summary
+        variables have been calculated.
+
+        Parameters
+        ----------
+        cycle_solution : :class:`pybamm.Solution`
+            The solution of the cycle, with its steps (`cycle_solution.steps`) and
+            summary variables (`cycle_solution.cycle_summary_variables`)
+        logs : dict
+            Information about the simulation, as passed to the callbacks
+        """
+        pass
+
+    def close(self):
+        """
+        Called at the end of the experiment, including when the experiment is
+        stopped early by its termination conditions or by an infeasible step
+        """
+        pass
+
+
+class DataFileSink(SolutionSink):
+    """
+    Sink that writes some variables of the solution of each cycle (or each step) of
+    an experiment to a file, with :meth:`pybamm.Solution.save_data`.
+
+    The files are named `cycle_<cycle number>.<extension>`, or
+    `cycle_<cycle number>_step_<step number>.<extension>` if `per_step` is True,
+    with the cycle and step numbers starting from 1.
+
+    Parameters
+    ----------
+    directory : str
+        The directory in which to write the files. Created if it does not exist.
+    variables : list of str
+        The names of the variables to save
+    to_format : str, optional
+        The format of the files, see :meth:`pybamm.Solution.save_data`. Default is
+        "csv".
+    per_step : bool, optional
+        Whether to write one file per step rather than per cycle. Default is False.
+    short_names : dict, optional
+        Shortened names of the variables, see :meth:`pybamm.Solution.save_data`
+    """
+
+    _extensions = {"pickle": "pkl", "matlab": "mat", "csv": "csv", "json": "json"}
+
+    def __init__(
+        self, directory, variables, to_format="csv", per_step=False, short_names=None
+    ):
+        if to_format not in self._extensions:
+            raise ValueError("format '{}' not recognised".format(to_format))
+        self.directory = os.path.abspath(directory)
+        os.makedirs(self.directory, exist_ok=True)
+        self.variables = variables
+        self.to_format = to_format
+        self.per_step = per_step
+        self.short_names = short_names
+        self.filenames = []
+
+    def _write(self, solution, name):
+        filename = os.path.join(
+            self.directory, f"{name}.{self._extensions[self.to_format]}"
+        )
+        solution.save_data(
+            filename,
+            self.variables,
+            to_format=self.to_format,
+            short_names=self.short_names,
+        )
+        self.filenames.append(filename)
+
+    def write_step(self, step_solution, logs):
+        # Empty solutions (e.g. infeasible steps) have no variables to save
+        if self.per_step and isinstance(step_solution, pybamm.Solution):
+            cycle_num = logs["cycle number"][0]
+            step_num = logs["step number"][0]
+            self._write(step_solution, f"cycle_{cycle_num}_step_{step_num}")
+
+    def write_cycle(self, cycle_solution, logs):
+        if not self.per_step:
+            cycle_num = logs["cycle number"][0]
+            self._write(cycle_solution, f"cycle_{cycle_num}")
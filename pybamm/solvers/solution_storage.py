@@ -0,0 +1,135 @@
+#
+# Memory-mapped storage for solution states
+#
+import os
+import tempfile
+
+import casadi
+import numpy as np
+
+
+class MemmapStorage:
+    """
+    Storage for the states of solutions in memory-mapped files, so that long
+    simulations (e.g. thousands of ageing cycles) are not limited by the available
+    memory.
+
+    The states of each solution passed to :meth:`store_solution` are written to
+    segment files in `directory` and replaced by arrays that are backed by these
+    files. The operating system then only keeps the parts of the solution that are
+    being used in memory, and reads the rest from disk when required (e.g. when a
+    variable is processed).
+
+    The files are not deleted automatically. Solutions that use the storage must not
+    be used after calling :meth:`clear`.
+
+    Parameters
+    ----------
+    directory : str
+        The directory in which to store the segment files. Created if it does not
+        exist.
+    segment_size : int, optional
+        The size, in bytes, of each segment file. Arrays larger than this are stored
+        in a segment of their own. Default is 64 MiB.
+    """
+
+    def __init__(self, directory, segment_size=2**26):
+        self.directory = os.path.abspath(directory)
+        os.makedirs(self.directory, exist_ok=True)
+        self.segment_size = int(segment_size)
+        self._segment = None
+        self._offset = 0
+        self._filenames = []
+
+    def _new_segment(self, nbytes):
+        fd, filename = tempfile.mkstemp(
+            dir=self.directory, prefix="segment_", suffix=".dat"
+        )
+        os.close(fd)
+        self._filenames.append(filename)
+        return np.memmap(filename, dtype=np.uint8, mode="w+", shape=(nbytes,))
+
+    def store(self, array):
+        """
+        Write an array to the storage.
+
+        Parameters
+        ----------
+        array : :class:`numpy.ndarray`
+            The array to store
+
+        Returns
+        -------
+        :class:`numpy.memmap`
+            An array with the same values, shape and dtype as `array`, backed by a
+            segment file
+        """
+        array = np.asarray(array)
+        nbytes = max(array.nbytes, 1)
+        # Keep arrays aligned to cache lines
+        offset = -(-self._offset // 64) * 64
+        if self._segment is None or offset + nbytes > len(self._segment):
+            if nbytes > self.segment_size:
+                # Large arrays get a segment of their own, and the current segment
+                # is kept for the next arrays
+                segment, offset = self._new_segment(nbytes), 0
+            else:
+                self._segment = segment = self._new_segment(self.segment_size)
+                self._offset = offset = 0
+        else:
+            segment = self._segment
+        if segment is self._segment:
+            self._offset = offset + nbytes
+
+        stored = (
+            segment[offset : offset + array.nbytes]
+            .view(array.dtype)
+            .reshape(array.shape, order="F")
+        )
+        stored[...] = array
+        # Write the values to disk so that the pages can be released from memory
+        segment.flush()
+        return stored
+
+    def store_solution(self, solution):
+        """
+        Replace the states of a solution, and of its sub-solutions, by arrays in the
+        storage. Symbolic (MX) states are left unchanged, and CasADi DM states are
+        converted to numpy arrays.
+
+        Parameters
+        ----------
+        solution : :class:`pybamm.Solution`
+            The solution whose states to store. Modified in place.
+
+        Returns
+        -------
+        :class:`pybamm.Solution`
+            The same solution
+        """
+        stored = {}
+        for sol in [solution, *solution.sub_solutions]:
+            all_ys = sol._all_ys
+            for i, ys in enumerate(all_ys):
+                if isinstance(ys, np.memmap) or isinstance(ys, casadi.MX):
+                    continue
+                # The same array is usually shared with the sub-solutions
+                if id(ys) not in stored:
+                    if isinstance(ys, casadi.DM):
+                        array = ys.full()
+                    else:
+                        array = ys
+                    stored[id(ys)] = (ys, self.store(array))
+                all_ys[i] = stored[id(ys)][1]
+            # Cached concatenated states would keep the old arrays in memory
+            sol.__dict__.pop("_y", None)
+        return solution
+
+    def clear(self):
+        """Delete the segment files written by this storage"""
+        self._segment = None
+        self._offset = 0
+        for filename in self._filenames:
+            if os.path.exists(filename):
+                os.remove(filename)
+        self._filenames = []
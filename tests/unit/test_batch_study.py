@@ -5,6 +5,7 @@ from tests import TestCase
 import os
 import pybamm
 import unittest
+import numpy as np
 from tempfile import TemporaryDirectory
 
 spm = pybamm.lithium_ion.SPM()
@@ -90,6 +91,63 @@ class TestBatchStudy(TestCase):
             ]
             self.assertIn(output_experiment, experiments_list)
 
+    def test_solve_iter(self):
+        bs = pybamm.BatchStudy(
+            models={"SPM": spm, "SPM uniform": spm_uniform},
+            experiments={"exp1": exp1, "exp2": exp2},
+            permutations=True,
+        )
+        results = dict(bs.solve_iter(nproc=2))
+
+        # Simulations are yielded as they finish, and stored in order
+        self.assertEqual(sorted(results), [0, 1, 2, 3])
+        self.assertEqual(len(bs.sims), 4)
+        for index, sim in results.items():
+            self.assertIs(bs.sims[index], sim)
+            self.assertIsInstance(sim.solution, pybamm.Solution)
+        self.assertEqual(
+            bs.sims[1].experiment.operating_conditions_steps,
+            exp2.operating_conditions_steps,
+        )
+        self.assertEqual(bs.sims[2].model.name, spm_uniform.name)
+        self.assertTrue(all(time.value > 0 for time in bs.times))
+        self.assertEqual(bs.errors, {})
+        bs.plot(testing=True)
+
+        # Same results in series
+        bs_serial = pybamm.BatchStudy(
+            models={"SPM": spm, "SPM uniform": spm_uniform},
+            experiments={"exp1": exp1, "exp2": exp2},
+            permutations=True,
+        )
+        bs_serial.solve()
+        for sim, sim_serial in zip(bs.sims, bs_serial.sims):
+            np.testing.assert_array_almost_equal(
+                sim.solution["Voltage [V]"].entries,
+                sim_serial.solution["Voltage [V]"].entries,
+            )
+
+    def test_solve_iter_errors(self):
+        parameter_values = pybamm.ParameterValues("Chen2020")
+        bad_parameter_values = parameter_values.copy()
+        del bad_parameter_values["Negative electrode thickness [m]"]
+        bs = pybamm.BatchStudy(
+            models={"SPM": spm, "SPM uniform": spm_uniform},
+            parameter_values={"good": parameter_values, "bad": bad_parameter_values},
+        )
+
+        # Failed simulations are not yielded, and their errors are recorded
+        results = dict(bs.solve_iter(t_eval=[0, 3600], nproc=2))
+        self.assertEqual(list(results), [0])
+        self.assertEqual(list(bs.errors), [1])
+        self.assertIsInstance(bs.errors[1], KeyError)
+        self.assertIsNone(bs.sims[1].solution)
+        self.assertTrue(all(time.value > 0 for time in bs.times))
+
+        # In series, solve raises the error
+        with self.assertRaisesRegex(KeyError, "Negative electrode thickness"):
+            bs.solve(t_eval=[0, 3600])
+
     def test_create_gif(self):
         with TemporaryDirectory() as dir_name:
             bs = pybamm.BatchStudy({"spm": pybamm.lithium_ion.SPM()})
@@ -8,6 +8,7 @@ import numpy as np
 import os
 import unittest
 from datetime import datetime
+from tempfile import TemporaryDirectory
 
 
 class TestSimulationExperiment(TestCase):
@@ -57,6 +58,70 @@ class TestSimulationExperiment(TestCase):
         with self.assertRaisesRegex(TypeError, "experiment must be"):
             pybamm.Simulation(model, experiment=0)
 
+    def test_steps_share_models(self):
+        experiment = pybamm.Experiment(
+            [
+                (
+                    "Discharge at 1C until 3.3 V",
+                    "Discharge at 2 A until 3.2 V",
+                    "Charge at 1 A until 4.1 V",
+                    "Rest for 10 minutes",
+                    "Hold at 4.1 V until 50 mA",
+                    "Hold at 4 V until 20 mA",
+                    pybamm.step.current(1, duration=60, temperature="30oC"),
+                    pybamm.step.current(2, duration=60, temperature="35oC"),
+                )
+            ]
+        )
+        model = pybamm.lithium_ion.SPM()
+        sim = pybamm.Simulation(model, experiment=experiment)
+        sim.build_for_experiment()
+        C = model.default_parameter_values["Nominal cell capacity [A.h]"]
+
+        op_conds = [
+            op.basic_repr() for op in sim.experiment.operating_conditions_steps
+        ]
+        models = sim.op_conds_to_built_models
+        solvers = sim.op_conds_to_built_solvers
+        # steps that only differ in their values share a model and a solver
+        self.assertIs(models[op_conds[0]], models[op_conds[1]])
+        self.assertIs(solvers[op_conds[0]], solvers[op_conds[1]])
+        self.assertIs(models[op_conds[4]], models[op_conds[5]])
+        self.assertIs(models[op_conds[6]], models[op_conds[7]])
+        # charge, rest and steps without terminations need different models
+        self.assertEqual(len(set(map(id, models.values()))), 5)
+        self.assertEqual(
+            sim.experiment_unique_steps_to_inputs[op_conds[0]],
+            {"Current function [A]": C, "Voltage cut-off [V] [experiment]": 3.3},
+        )
+        self.assertEqual(
+            sim.experiment_unique_steps_to_inputs[op_conds[5]],
+            {
+                "Voltage function [V]": 4,
+                "Current cut-off [A] [experiment]": 0.02,
+            },
+        )
+        self.assertEqual(
+            sim.experiment_unique_steps_to_inputs[op_conds[7]],
+            {"Current function [A]": 2, "Ambient temperature [K]": 308.15},
+        )
+        self.assertEqual(sim.experiment_unique_steps_to_inputs[op_conds[3]], {})
+
+        sol = sim.solve(calc_esoh=False)
+        steps = sol.cycles[0].steps
+        np.testing.assert_array_almost_equal(steps[0]["Current [A]"].data, C)
+        np.testing.assert_array_almost_equal(steps[1]["Current [A]"].data, 2)
+        # the termination values are inputs too
+        for step, voltage in zip(steps[:2], [3.3, 3.2]):
+            self.assertEqual(
+                step.termination, "event: Discharge voltage cut-off [V] [experiment]"
+            )
+            self.assertAlmostEqual(step["Battery voltage [V]"].data[-1], voltage, 3)
+        np.testing.assert_array_almost_equal(steps[5]["Voltage [V]"].data, 4)
+        np.testing.assert_array_almost_equal(
+            steps[7]["Ambient temperature [K]"].data, 308.15
+        )
+
     def test_setup_experiment_string_or_list(self):
         model = pybamm.lithium_ion.SPM()
 
@@ -95,7 +160,9 @@ class TestSimulationExperiment(TestCase):
         self.assertEqual(len(sol.cycles), 1)
 
         # Test outputs
-        np.testing.assert_array_equal(sol.cycles[0].steps[0]["C-rate"].data, 1 / 20)
+        np.testing.assert_array_almost_equal(
+            sol.cycles[0].steps[0]["C-rate"].data, 1 / 20
+        )
         np.testing.assert_array_equal(sol.cycles[0].steps[1]["Current [A]"].data, -1)
         np.testing.assert_array_almost_equal(
             sol.cycles[0].steps[2]["Voltage [V]"].data, 4.1, decimal=5
@@ -358,6 +425,28 @@ class TestSimulationExperiment(TestCase):
         np.testing.assert_array_less(np.min(sol.cycles[1]["Voltage [V]"].data), 4)
         self.assertEqual(len(sol.cycles), 2)
 
+    def test_storage(self):
+        experiment = pybamm.Experiment(
+            [("Discharge at 1C for 10 minutes", "Rest for 10 minutes")] * 2
+        )
+        model = pybamm.lithium_ion.SPM()
+        sim = pybamm.Simulation(model, experiment=experiment)
+        sol = sim.solve()
+        with TemporaryDirectory() as dir_name:
+            storage = pybamm.MemmapStorage(dir_name)
+            sol_stored = sim.solve(storage=storage)
+            for ys in sol_stored.all_ys + sol_stored.cycles[1].steps[0].all_ys:
+                self.assertIsInstance(ys, np.memmap)
+            np.testing.assert_array_almost_equal(
+                sol_stored["Voltage [V]"].data, sol["Voltage [V]"].data
+            )
+
+            # without an experiment the final solution is stored
+            sim = pybamm.Simulation(model)
+            sol_stored = sim.solve([0, 600], storage=storage)
+            self.assertIsInstance(sol_stored.all_ys[0], np.memmap)
+            storage.clear()
+
     def test_save_at_cycles(self):
         experiment = pybamm.Experiment(
             [
@@ -471,6 +560,43 @@ class TestSimulationExperiment(TestCase):
         sim.solve(inputs={"Dsn": 2})
         np.testing.assert_array_equal(sim.solution.all_inputs[0]["Dsn"], 2)
 
+    def test_update_parameters(self):
+        experiment = pybamm.Experiment(
+            [
+                "Discharge at C/2 for 1 hour",
+                "Rest for 1 hour",
+                "Charge at 1 A for 1 hour",
+            ]
+        )
+        model = pybamm.lithium_ion.SPM()
+        param = pybamm.ParameterValues("Marquis2019")
+        name = "Negative electrode porosity"
+        sim = pybamm.Simulation(
+            model,
+            experiment=experiment,
+            parameter_values=param.copy(),
+            updatable_parameters=[name],
+        )
+        sim.solve()
+        templates = sim.op_conds_to_built_model_templates
+        built_models = sim.op_conds_to_built_models
+
+        sim.update_parameters({name: 0.35})
+        self.assertIs(sim.op_conds_to_built_model_templates, templates)
+        # steps that shared a model still share a model
+        models = list(sim.op_conds_to_built_models.values())
+        self.assertIs(models[0], models[2])
+        self.assertIsNot(models[0], next(iter(built_models.values())))
+        sol = sim.solve()
+
+        param[name] = 0.35
+        sol_new = pybamm.Simulation(
+            model, experiment=experiment, parameter_values=param
+        ).solve()
+        np.testing.assert_array_almost_equal(
+            sol["Voltage [V]"].entries, sol_new["Voltage [V]"].entries
+        )
+
     def test_run_experiment_skip_steps(self):
         # Test experiment with steps being skipped due to initial conditions
         # already satisfying the events
@@ -765,6 +891,212 @@ class TestSimulationExperiment(TestCase):
         # Check that there are only 3 built models (unique steps + padding rest)
         self.assertEqual(len(sim.op_conds_to_built_models), 3)
 
+    def test_sink(self):
+        class ListSink(pybamm.SolutionSink):
+            def __init__(self):
+                self.steps = []
+                self.cycles = []
+                self.closed = False
+
+            def write_step(self, step_solution, logs):
+                self.steps.append((logs["cycle number"][0], step_solution.t[-1]))
+
+            def write_cycle(self, cycle_solution, logs):
+                self.cycles.append(cycle_solution)
+
+            def close(self):
+                self.closed = True
+
+        experiment = pybamm.Experiment(
+            [("Discharge at 1C for 10 minutes", "Rest for 10 minutes")] * 3
+        )
+        sim = pybamm.Simulation(pybamm.lithium_ion.SPM(), experiment=experiment)
+        sol = sim.solve(calc_esoh=False)
+        sink = ListSink()
+        sol_streamed = sim.solve(calc_esoh=False, sink=sink)
+
+        # the steps and cycles are handed to the sink
+        self.assertEqual([cycle for cycle, _ in sink.steps], [1, 1, 2, 2, 3, 3])
+        self.assertEqual(len(sink.cycles), 3)
+        self.assertTrue(sink.closed)
+        for cycle, cycle_streamed in zip(sol.cycles, sink.cycles):
+            np.testing.assert_array_equal(cycle.t, cycle_streamed.t)
+            np.testing.assert_allclose(cycle.y, cycle_streamed.y)
+            self.assertEqual(len(cycle_streamed.steps), 2)
+
+        # only the last state and the summary variables are kept
+        self.assertEqual(sol_streamed.cycles, [None, None, None])
+        np.testing.assert_array_equal(sol_streamed.t, sol.t[-1:])
+        np.testing.assert_allclose(sol_streamed.y, sol.y[:, -1:])
+        np.testing.assert_allclose(
+            sol_streamed.summary_variables["Minimum voltage [V]"],
+            sol.summary_variables["Minimum voltage [V]"],
+        )
+        self.assertEqual(len(sol_streamed.all_first_states), 3)
+
+        # the experiment can be continued from the streamed solution
+        sol_continued = sim.solve(
+            calc_esoh=False, starting_solution=sol_streamed, sink=sink
+        )
+        self.assertEqual(len(sink.cycles), 6)
+        self.assertEqual(len(sol_continued.cycles), 6)
+        np.testing.assert_allclose(sink.cycles[3].t[0], sol.t[-1], rtol=1e-6)
+
+        # the sink is closed if the experiment fails or is interrupted
+        class Crash(pybamm.callbacks.Callback):
+            def __init__(self, error):
+                self.error = error
+
+            def on_step_end(self, logs):
+                if logs["cycle number"][0] == 2:
+                    raise self.error
+
+        for error in [RuntimeError, KeyboardInterrupt]:
+            sink = ListSink()
+            with self.assertRaises(error):
+                sim.solve(calc_esoh=False, sink=sink, callbacks=Crash(error))
+            self.assertEqual(len(sink.steps), 3)
+            self.assertTrue(sink.closed)
+
+        # a sink can only be used with an experiment
+        sim = pybamm.Simulation(pybamm.lithium_ion.SPM())
+        with self.assertRaisesRegex(ValueError, "only be used with an experiment"):
+            sim.solve([0, 600], sink=sink)
+
+    def test_checkpoint_and_resume(self):
+        class Crash(pybamm.callbacks.Callback):
+            def on_cycle_start(self, logs):
+                if logs["cycle number"][0] == 4:
+                    raise KeyboardInterrupt
+
+        experiment = pybamm.Experiment(
+            [("Discharge at 1C for 10 minutes", "Rest for 10 minutes")] * 5
+        )
+        sim = pybamm.Simulation(pybamm.lithium_ion.SPM(), experiment=experiment)
+        sol = sim.solve(calc_esoh=False)
+
+        with TemporaryDirectory() as dir_name:
+            checkpoint_file = os.path.join(dir_name, "checkpoint.pkl")
+            # crash during the 4th cycle, after a checkpoint at the end of cycle 2
+            sim = pybamm.Simulation(pybamm.lithium_ion.SPM(), experiment=experiment)
+            with self.assertRaises(KeyboardInterrupt):
+                sim.solve(
+                    calc_esoh=False,
+                    checkpoint_file=checkpoint_file,
+                    checkpoint_every=2,
+                    callbacks=Crash(),
+                )
+
+            # resume in a new simulation, from the start of cycle 3
+            class CycleNumbers(pybamm.callbacks.Callback):
+                def __init__(self):
+                    self.cycle_numbers = []
+
+                def on_cycle_start(self, logs):
+                    self.cycle_numbers.append(logs["cycle number"])
+
+            cycle_numbers = CycleNumbers()
+            sim = pybamm.Simulation(pybamm.lithium_ion.SPM(), experiment=experiment)
+            sol_resumed = sim.solve(
+                calc_esoh=False,
+                checkpoint_file=checkpoint_file,
+                resume_from=checkpoint_file,
+                callbacks=cycle_numbers,
+            )
+            self.assertEqual(cycle_numbers.cycle_numbers, [(3, 5), (4, 5), (5, 5)])
+            # only the cycles solved after resuming are returned
+            self.assertEqual(len(sol_resumed.cycles), 3)
+            for cycle, cycle_resumed in zip(sol.cycles[2:], sol_resumed.cycles):
+                np.testing.assert_allclose(cycle_resumed.t[0], cycle.t[0])
+            np.testing.assert_allclose(sol_resumed.t[-1], sol.t[-1])
+            np.testing.assert_allclose(sol_resumed.y[:, -1:], sol.y[:, -1:], rtol=1e-6)
+            np.testing.assert_allclose(
+                sol_resumed.summary_variables["Minimum voltage [V]"],
+                sol.summary_variables["Minimum voltage [V]"],
+                rtol=1e-6,
+            )
+            self.assertEqual(len(sol_resumed.all_first_states), 5)
+
+            # resuming from the final checkpoint has nothing left to solve
+            sol_finished = sim.solve(calc_esoh=False, resume_from=checkpoint_file)
+            np.testing.assert_allclose(sol_finished.t, sol.t[-1:])
+            self.assertEqual(len(sol_finished.all_summary_variables), 5)
+
+            # the checkpoint must belong to the same experiment
+            sim = pybamm.Simulation(
+                pybamm.lithium_ion.SPM(),
+                experiment=pybamm.Experiment(["Discharge at 1C for 10 minutes"]),
+            )
+            with self.assertRaisesRegex(ValueError, "different experiment"):
+                sim.solve(calc_esoh=False, resume_from=checkpoint_file)
+            with self.assertRaisesRegex(ValueError, "starting_solution"):
+                sim.solve(
+                    calc_esoh=False,
+                    resume_from=checkpoint_file,
+                    starting_solution=sol,
+                )
+
+        # checkpoints can only be used with an experiment
+        sim = pybamm.Simulation(pybamm.lithium_ion.SPM())
+        with self.assertRaisesRegex(ValueError, "only be used with an experiment"):
+            sim.solve([0, 600], checkpoint_file="checkpoint.pkl")
+
+    def test_batch_esoh(self):
+        experiment = pybamm.Experiment(
+            [("Discharge at 1C until 3.3 V", "Charge at C/3 until 4.1 V")] * 3
+        )
+        model = pybamm.lithium_ion.SPM({"SEI": "ec reaction limited"})
+        parameter_values = pybamm.ParameterValues("Mohtat2020")
+        sim = pybamm.Simulation(
+            model, experiment=experiment, parameter_values=parameter_values
+        )
+        sol = sim.solve()
+        sol_batch = sim.solve(calc_esoh="batch")
+        for name in ["x_100", "y_0", "Capacity [A.h]"]:
+            np.testing.assert_allclose(
+                sol_batch.summary_variables[name],
+                sol.summary_variables[name],
+                rtol=1e-5,
+            )
+        self.assertIn("x_100", sol_batch.cycles[-1].cycle_summary_variables)
+
+        # the eSOH variables can also be calculated after the experiment
+        sol_lazy = sim.solve(calc_esoh=False)
+        self.assertNotIn("x_100", sol_lazy.summary_variables)
+        sol_lazy.calculate_esoh_summary_variables(sim.get_esoh_solver(True))
+        np.testing.assert_allclose(
+            sol_lazy.summary_variables["x_100"],
+            sol.summary_variables["x_100"],
+            rtol=1e-5,
+        )
+
+        # only solutions of experiments have summary variables
+        sol = pybamm.Simulation(model).solve([0, 600])
+        with self.assertRaisesRegex(ValueError, "no summary variables"):
+            sol.calculate_esoh_summary_variables(sim.get_esoh_solver(True))
+
+    def test_output_tolerances(self):
+        experiment = pybamm.Experiment(
+            ["Discharge at 1C for 20 minutes", "Rest for 1 hour"], period="10 seconds"
+        )
+        sim = pybamm.Simulation(pybamm.lithium_ion.SPM(), experiment=experiment)
+        sol = sim.solve(calc_esoh=False)
+        tolerances = {"Voltage [V]": 1e-3}
+        sol_thinned = sim.solve(calc_esoh=False, output_tolerances=tolerances)
+
+        # fewer times are kept, especially during the rest
+        self.assertLess(len(sol_thinned.t), len(sol.t) / 4)
+        steps = sol.cycles[1].steps
+        thinned_steps = sol_thinned.cycles[1].steps
+        self.assertLess(len(thinned_steps[0].t), len(steps[0].t) / 10)
+        np.testing.assert_allclose(
+            sol_thinned["Voltage [V]"](sol.t),
+            sol["Voltage [V]"].entries,
+            rtol=0,
+            atol=1e-3,
+        )
+        self.assertEqual(sol_thinned.t[-1], sol.t[-1])
+
 
 if __name__ == "__main__":
     print("Add -v for more debug output")
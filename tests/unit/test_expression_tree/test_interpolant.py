@@ -288,6 +288,59 @@ class TestInterpolant(TestCase):
         evaluated_children = [1, 4, 7]
         value = interp._function_evaluate(evaluated_children)
 
+    def test_kernel(self):
+        # evaluating with the kernel gives the same results as the SciPy interpolator
+        values = np.array([-0.5, 0, 0.123, 0.5, 0.77, 1, 1.5, np.nan])
+        var = pybamm.StateVector(slice(0, 8))
+        for x in [np.linspace(0, 1, 20), np.linspace(0, 1, 20) ** 2]:
+            for extrapolate in [True, False]:
+                interp = pybamm.Interpolant(
+                    x, np.sin(5 * x), var, extrapolate=extrapolate
+                )
+                self.assertIsNotNone(interp.kernel)
+                np.testing.assert_allclose(
+                    interp.evaluate(y=values),
+                    interp.function(values)[:, np.newaxis],
+                    rtol=1e-12,
+                    atol=1e-14,
+                )
+
+        x = (np.linspace(0, 1, 5), np.linspace(0, 2, 4) ** 2, np.linspace(1, 3, 3))
+        data = np.random.default_rng(0).random((5, 4, 3))
+        y = pybamm.StateVector(slice(0, 4))
+        z = pybamm.StateVector(slice(4, 8))
+        points = np.array([[-0.1, 0.5, 0.6, 1.2], [0, 1, 3.9, 5], [0.5, 1, 2.5, 3.5]])
+        for extrapolate in [True, False]:
+            interp = pybamm.Interpolant(x, data, (var, y, z), extrapolate=extrapolate)
+            np.testing.assert_allclose(
+                interp.kernel(*points), interp.function(points.T), rtol=1e-12
+            )
+
+        # the kernel is used in python-format models, in 2D as well
+        a = pybamm.StateVector(slice(0, 2))
+        b = pybamm.StateVector(slice(2, 4))
+        interp = pybamm.Interpolant(x[:2], data[:, :, 0], (a, b))
+        evaluator = pybamm.EvaluatorPython(interp)
+        y_eval = np.array([0.2, 0.7, 1, 3])
+        np.testing.assert_allclose(
+            evaluator(y=y_eval[:, np.newaxis]),
+            interp.function(y_eval.reshape(2, 2).T)[:, np.newaxis],
+        )
+
+        # the kernel keeps the shape of its input
+        interp = pybamm.Interpolant(x[0], data[:, 0, 0], var)
+        self.assertEqual(interp.kernel(0.5).shape, ())
+        self.assertEqual(interp.kernel(np.ones((1, 3))).shape, (1, 3))
+
+        # cubic and pchip interpolation still use the SciPy interpolators
+        for interpolator in ["cubic", "pchip"]:
+            interp = pybamm.Interpolant(
+                x[0], data[:, 0, 0], var, interpolator=interpolator
+            )
+            self.assertIsNone(interp.kernel)
+        interp = pybamm.Interpolant(x[:2], data[:, :, 0], (a, b), interpolator="cubic")
+        self.assertIsNone(interp.kernel)
+
     def test_name(self):
         a = pybamm.Symbol("a")
         x = np.linspace(0, 1, 200)
@@ -9,6 +9,7 @@ import unittest
 import numpy as np
 import scipy.sparse
 from collections import OrderedDict
+import pickle
 
 if pybamm.have_jax():
     import jax
@@ -460,6 +461,44 @@ class TestEvaluate(TestCase):
             result = evaluator(t=t, y=y)
             np.testing.assert_allclose(result, expr.evaluate(t=t, y=y))
 
+    def test_evaluator_python_multiple_outputs(self):
+        a = pybamm.StateVector(slice(0, 1))
+        b = pybamm.StateVector(slice(1, 2))
+        shared = pybamm.exp(a * b)
+        exprs = [shared + a, shared * b, pybamm.Scalar(3), 2 * a]
+
+        # the shared subtree is only evaluated once
+        _, variable_str = pybamm.to_python(exprs)
+        self.assertEqual(variable_str.count("np.exp("), 1)
+
+        evaluator = pybamm.EvaluatorPython(exprs)
+        for t, y in zip([1, 2], [np.array([[2], [3]]), np.array([[1], [3]])]):
+            results = evaluator(t=t, y=y)
+            self.assertIsInstance(results, tuple)
+            self.assertEqual(len(results), len(exprs))
+            for result, expr in zip(results, exprs):
+                np.testing.assert_allclose(result, expr.evaluate(t=t, y=y))
+
+        # a single output in a list is returned in a tuple
+        evaluator = pybamm.EvaluatorPython([shared])
+        self.assertEqual(len(evaluator(y=np.array([[2], [3]]))), 1)
+
+        # evaluators can be pickled
+        evaluator = pickle.loads(pickle.dumps(pybamm.EvaluatorPython(exprs)))
+        y = np.array([[2], [3]])
+        np.testing.assert_allclose(evaluator(y=y)[1], exprs[1].evaluate(y=y))
+
+    def test_find_symbols_shared_subtrees(self):
+        # subtrees that appear several times are only visited once
+        a = pybamm.StateVector(slice(0, 1))
+        expr = a
+        for _ in range(50):
+            expr = expr * expr
+        constant_symbols = OrderedDict()
+        variable_symbols = OrderedDict()
+        pybamm.find_symbols(expr, constant_symbols, variable_symbols)
+        self.assertEqual(len(variable_symbols), 51)
+
     @unittest.skipIf(not pybamm.have_jax(), "jax or jaxlib is not installed")
     def test_find_symbols_jax(self):
         # test sparse conversion
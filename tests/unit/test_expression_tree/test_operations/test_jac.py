@@ -465,6 +465,83 @@ class TestJacobian(TestCase):
         ):
             conc.jac(y)
 
+    def test_jacobian_action(self):
+        y = pybamm.StateVector(slice(0, 4))
+        u = pybamm.StateVector(slice(0, 2))
+        v = pybamm.StateVector(slice(2, 4))
+        w = pybamm.StateVector(slice(4, 8))
+        jacobian_action = pybamm.JacobianAction(w)
+
+        y0 = np.array([1.0, 2.0, 3.0, 4.0])
+        w0 = np.array([0.5, -1.0, 2.0, 0.25])
+        y_and_w = np.concatenate([y0, w0])
+
+        A = pybamm.Matrix(np.array([[1, 2], [3, 4]]))
+        t = pybamm.t
+        a = pybamm.InputParameter("a")
+        uv = pybamm.numpy_concatenation(u, v)
+        for func in [
+            u,
+            -v,
+            3 * u + 4 * v,
+            A @ u - a * v,
+            u * v,
+            u / v + v**2 + 2**u,
+            v**u,
+            pybamm.exp(u) * pybamm.sin(t * v),
+            pybamm.minimum(u, v) + pybamm.maximum(u, 2 * v),
+            abs(u - v) + pybamm.sign(u) * pybamm.Floor(v),
+            (u < v) * u + pybamm.Index(uv, slice(1, 3)),
+            pybamm.numpy_concatenation(u, 3 * v, pybamm.Vector([1, 2])),
+            pybamm.Vector([1, 2]),
+            t * pybamm.Vector([1, 2]),
+        ]:
+            jac = func.jac(y).evaluate(t=2, y=y0, inputs={"a": 3})
+            jac = jac.toarray() if hasattr(jac, "toarray") else jac
+            jac_action = jacobian_action.jac(func, y)
+            np.testing.assert_allclose(
+                jac_action.evaluate(t=2, y=y_and_w, inputs={"a": 3}),
+                (jac @ w0).reshape(-1, 1),
+            )
+
+        # the vector must be a single slice
+        jacobian_action = pybamm.JacobianAction(
+            pybamm.StateVector(slice(4, 6), slice(6, 8))
+        )
+        with self.assertRaisesRegex(NotImplementedError, "single slice"):
+            jacobian_action.jac(u, y)
+
+        # state vectors outside the variable are not supported
+        jacobian_action = pybamm.JacobianAction(pybamm.StateVector(slice(4, 6)))
+        with self.assertRaisesRegex(NotImplementedError, "within the variable"):
+            jacobian_action.jac(v, u)
+
+    def test_jacobian_action_of_domain_concatenation(self):
+        mesh = get_mesh_for_testing()
+        a_dom = ["negative electrode"]
+        b_dom = ["separator"]
+        c_dom = ["positive electrode"]
+        a_npts = mesh[a_dom[0]].npts
+        b_npts = mesh[b_dom[0]].npts
+        c_npts = mesh[c_dom[0]].npts
+        n = a_npts + b_npts + c_npts
+        y = pybamm.StateVector(slice(0, n))
+        jacobian_action = pybamm.JacobianAction(pybamm.StateVector(slice(n, 2 * n)))
+
+        a = 2 * pybamm.StateVector(slice(0, a_npts), domain=a_dom) ** 2
+        b = pybamm.Vector(np.ones(b_npts), domain=b_dom)
+        c = 3 * pybamm.StateVector(slice(a_npts + b_npts, n), domain=c_dom)
+        conc = pybamm.DomainConcatenation([a, b, c], mesh)
+
+        y0 = np.linspace(1, 2, n)
+        w0 = np.linspace(-1, 1, n)
+        jac = conc.jac(y).evaluate(y=y0).toarray()
+        jac_action = jacobian_action.jac(conc, y)
+        np.testing.assert_allclose(
+            jac_action.evaluate(y=np.concatenate([y0, w0])),
+            (jac @ w0).reshape(-1, 1),
+        )
+
 
 if __name__ == "__main__":
     print("Add -v for more debug output")
@@ -0,0 +1,127 @@
+#
+# Tests for the Jacobian sparsity pattern
+#
+from tests import TestCase
+import pybamm
+
+import numpy as np
+import unittest
+from tests import get_mesh_for_testing
+
+
+class TestJacobianSparsity(TestCase):
+    def setUp(self):
+        pybamm.JacobianSparsity.clear_cache()
+
+    def assert_pattern_contains_jacobian(self, func, y, y0):
+        pattern = pybamm.JacobianSparsity().sparsity(func, y).toarray()
+        jac = func.jac(y).evaluate(t=1, y=y0, inputs={"a": 2})
+        if hasattr(jac, "toarray"):
+            jac = jac.toarray()
+            self.assertEqual(pattern.shape, jac.shape)
+        else:
+            # zero Jacobians are scalars
+            jac = np.broadcast_to(jac, pattern.shape)
+        np.testing.assert_array_equal(pattern[jac != 0], 1)
+        return pattern
+
+    def test_sparsity(self):
+        y = pybamm.StateVector(slice(0, 4))
+        u = pybamm.StateVector(slice(0, 2))
+        v = pybamm.StateVector(slice(2, 4))
+        y0 = np.array([1.0, 2.0, 3.0, 4.0])
+        A = pybamm.Matrix(np.array([[1, 0], [3, 4]]))
+        a = pybamm.InputParameter("a")
+        uv = pybamm.numpy_concatenation(u, v)
+
+        pattern = self.assert_pattern_contains_jacobian(u * v, y, y0)
+        np.testing.assert_array_equal(pattern, [[1, 0, 1, 0], [0, 1, 0, 1]])
+        pattern = self.assert_pattern_contains_jacobian(A @ u + a * v, y, y0)
+        np.testing.assert_array_equal(pattern, [[1, 0, 1, 0], [1, 1, 0, 1]])
+        # scalars are broadcast
+        pattern = pybamm.JacobianSparsity().sparsity(pybamm.Index(v, 1) * u, y)
+        pattern = pattern.toarray()
+        np.testing.assert_array_equal(pattern, [[1, 0, 0, 1], [0, 1, 0, 1]])
+        # heaviside functions have a zero Jacobian
+        pattern = self.assert_pattern_contains_jacobian(
+            (u < v) + pybamm.sign(u) + pybamm.Floor(v), y, y0
+        )
+        np.testing.assert_array_equal(pattern, np.zeros((2, 4)))
+
+        for func in [
+            -u / v + v**2 + 2**u,
+            pybamm.exp(u) * pybamm.sin(pybamm.t * v),
+            pybamm.minimum(u, v) + abs(u - v),
+            pybamm.Index(uv, slice(1, 3)),
+            pybamm.numpy_concatenation(u, pybamm.Vector([1, 2]), 3 * v),
+            pybamm.Scalar(2),
+        ]:
+            self.assert_pattern_contains_jacobian(func, y, y0)
+
+        # only the part of the state vector in the variable is included
+        pattern = pybamm.JacobianSparsity().sparsity(y, v).toarray()
+        np.testing.assert_array_equal(pattern, [[0, 0], [0, 0], [1, 0], [0, 1]])
+
+        with self.assertRaisesRegex(NotImplementedError, "constant left child"):
+            pybamm.JacobianSparsity().sparsity(u @ v, y)
+        w = pybamm.StateVector(slice(0, 2), domain="negative electrode")
+        with self.assertRaisesRegex(NotImplementedError, "Cannot calculate"):
+            pybamm.JacobianSparsity().sparsity(pybamm.Gradient(w), y)
+
+    def test_domain_concatenation(self):
+        mesh = get_mesh_for_testing()
+        a_dom = ["negative electrode"]
+        b_dom = ["separator"]
+        c_dom = ["positive electrode"]
+        a_npts = mesh[a_dom[0]].npts
+        b_npts = mesh[b_dom[0]].npts
+        n = a_npts + b_npts + mesh[c_dom[0]].npts
+        y = pybamm.StateVector(slice(0, n))
+
+        a = 2 * pybamm.StateVector(slice(0, a_npts), domain=a_dom) ** 2
+        b = pybamm.Vector(np.ones(b_npts), domain=b_dom)
+        c = 3 * pybamm.StateVector(slice(a_npts + b_npts, n), domain=c_dom)
+        conc = pybamm.DomainConcatenation([a, b, c], mesh)
+        pattern = self.assert_pattern_contains_jacobian(conc, y, np.ones(n))
+        np.testing.assert_array_equal(
+            np.diag(pattern),
+            np.concatenate(
+                [np.ones(a_npts), np.zeros(b_npts), np.ones(n - a_npts - b_npts)]
+            ),
+        )
+
+    def test_model(self):
+        model = pybamm.lithium_ion.SPMe()
+        sim = pybamm.Simulation(model)
+        sim.build()
+        model = sim.built_model
+        y = pybamm.StateVector(slice(0, model.len_rhs_and_alg))
+        y0 = model.concatenated_initial_conditions.evaluate()
+        rhs = model.concatenated_rhs
+        pattern = self.assert_pattern_contains_jacobian(rhs, y, y0)
+        self.assertEqual(pattern.shape, (model.len_rhs, model.len_rhs_and_alg))
+
+    def test_cache(self):
+        y = pybamm.StateVector(slice(0, 4))
+        func = pybamm.StateVector(slice(0, 2)) * pybamm.StateVector(slice(2, 4))
+        pattern = pybamm.JacobianSparsity().sparsity(func, y)
+        # a symbol with the same structure gets the same pattern from the cache
+        func_copy = func.create_copy()
+        self.assertIs(pybamm.JacobianSparsity().sparsity(func_copy, y), pattern)
+
+        jacobian_sparsity = pybamm.JacobianSparsity(cache_size=1)
+        jacobian_sparsity.sparsity(2 * func, y)
+        self.assertIsNot(jacobian_sparsity.sparsity(func, y), pattern)
+
+        pybamm.JacobianSparsity.clear_cache()
+        self.assertIsNot(pybamm.JacobianSparsity().sparsity(func, y), pattern)
+
+
+if __name__ == "__main__":
+    print("Add -v for more debug output")
+    import sys
+
+    if "-v" in sys.argv:
+        debug = True
+    pybamm.settings.debug_mode = True
+    unittest.main()
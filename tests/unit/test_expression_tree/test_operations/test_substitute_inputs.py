@@ -0,0 +1,92 @@
+#
+# Tests for the input substitution
+#
+from tests import TestCase
+import pybamm
+import numpy as np
+import unittest
+
+
+class TestInputSubstitution(TestCase):
+    def test_symbols(self):
+        a = pybamm.InputParameter("a")
+        b = pybamm.InputParameter("b")
+        y = pybamm.StateVector(slice(0, 3))
+        substitution = pybamm.InputSubstitution({"a": 2})
+
+        # input parameters are replaced by named scalars
+        new_a = substitution.process_symbol(a)
+        self.assertIsInstance(new_a, pybamm.Scalar)
+        self.assertEqual(new_a.value, 2)
+        self.assertEqual(new_a.name, "a")
+
+        # other symbols are left as they are
+        self.assertIs(substitution.process_symbol(b), b)
+        expr = pybamm.exp(b * y)
+        self.assertIs(substitution.process_symbol(expr), expr)
+
+        # the new symbols are simplified
+        expr = a * pybamm.Scalar(3) + y
+        new_expr = substitution.process_symbol(expr)
+        self.assertEqual(new_expr, pybamm.Scalar(6) + y)
+        expr = pybamm.Matrix(np.eye(3)) @ (a * y)
+        new_expr = substitution.process_symbol(expr)
+        self.assertFalse(new_expr.has_symbol_of_classes(pybamm.InputParameter))
+        np.testing.assert_array_equal(
+            new_expr.evaluate(y=np.ones(3)), 2 * np.ones((3, 1))
+        )
+
+        # concatenations and functions
+        expr = pybamm.numpy_concatenation(pybamm.sin(a * y), b * y)
+        new_expr = substitution.process_symbol(expr)
+        np.testing.assert_array_equal(
+            new_expr.evaluate(y=np.ones(3), inputs={"b": 3}),
+            np.concatenate([np.sin(2 * np.ones((3, 1))), 3 * np.ones((3, 1))]),
+        )
+
+        # vector values
+        substitution = pybamm.InputSubstitution({"a": np.array([1, 2, 3])})
+        new_expr = substitution.process_symbol(a * y)
+        np.testing.assert_array_equal(
+            new_expr.evaluate(y=np.ones(3)), np.array([[1], [2], [3]])
+        )
+
+    def test_model(self):
+        model = pybamm.lithium_ion.SPM()
+        param = model.default_parameter_values
+        param.update({"Current function [A]": "[input]"})
+        sim = pybamm.Simulation(model, parameter_values=param)
+        sim.build()
+        template = sim.built_model
+        self.assertEqual(
+            [p.name for p in template.input_parameters], ["Current function [A]"]
+        )
+
+        substitution = pybamm.InputSubstitution({"Current function [A]": 2})
+        new_model = substitution.process_model(template)
+        self.assertIsNot(new_model, template)
+        self.assertEqual(new_model.input_parameters, [])
+        # the template is not modified
+        self.assertEqual(len(template.input_parameters), 1)
+        # discretised variables keep their meshes
+        variable = new_model.variables["Negative particle concentration [mol.m-3]"]
+        self.assertIsNotNone(variable.mesh)
+
+        sol = pybamm.CasadiSolver().solve(new_model, [0, 600])
+        sol_inputs = pybamm.CasadiSolver().solve(
+            template, [0, 600], inputs={"Current function [A]": 2}
+        )
+        np.testing.assert_array_almost_equal(sol.y, sol_inputs.y)
+        np.testing.assert_array_almost_equal(
+            sol["Voltage [V]"].entries, sol_inputs["Voltage [V]"].entries
+        )
+
+
+if __name__ == "__main__":
+    print("Add -v for more debug output")
+    import sys
+
+    if "-v" in sys.argv:
+        debug = True
+    pybamm.settings.debug_mode = True
+    unittest.main()
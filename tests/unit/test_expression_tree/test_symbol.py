@@ -2,7 +2,10 @@
 # Test for the Symbol class
 #
 from tests import TestCase
+import hashlib
 import os
+import subprocess
+import sys
 import unittest
 import unittest.mock as mock
 from tempfile import TemporaryDirectory
@@ -387,6 +390,66 @@ class TestSymbol(TestCase):
             + r", grad, children\=\['c'\], domains\=\{'primary': \['test'\]}",
         )
 
+    def test_digest(self):
+        a = pybamm.Symbol("a")
+        b = pybamm.Symbol("b", domain="test")
+        self.assertIsInstance(a.digest, bytes)
+        self.assertEqual(a.digest, pybamm.Symbol("a").digest)
+        self.assertNotEqual(a.digest, b.digest)
+        self.assertNotEqual(b.digest, pybamm.Symbol("b").digest)
+        self.assertEqual((a + b).digest, (a + b).digest)
+        self.assertNotEqual((a + b).digest, (b + a).digest)
+        self.assertNotEqual((a + b).digest, (a - b).digest)
+
+        # data that is not in the name
+        self.assertNotEqual(
+            pybamm.Vector([1, 2]).digest, pybamm.Vector([1, 3]).digest
+        )
+        self.assertNotEqual(
+            pybamm.Matrix(csr_matrix(np.eye(2))).digest,
+            pybamm.Matrix(csr_matrix(2 * np.eye(2))).digest,
+        )
+        self.assertEqual(
+            pybamm.StateVector(slice(0, 2)).digest,
+            pybamm.StateVector(slice(0, 2)).digest,
+        )
+        self.assertNotEqual(
+            pybamm.Variable("x", scale=2).digest, pybamm.Variable("x").digest
+        )
+        x = np.linspace(0, 1, 3)
+        self.assertNotEqual(
+            pybamm.Interpolant(x, x, pybamm.t).digest,
+            pybamm.Interpolant(x, 2 * x, pybamm.t).digest,
+        )
+
+        # the digest follows changes to the id
+        c = pybamm.Symbol("c")
+        digest = c.digest
+        c.domains = {"primary": ["test"]}
+        self.assertNotEqual(c.digest, digest)
+
+        # the digest is the same in every process, unlike the id
+        code = (
+            "import pybamm; a = pybamm.Variable('a', domain='test'); "
+            "print((2 * pybamm.grad(a) + pybamm.Vector([1, 2])).digest.hex())"
+        )
+        digests = set()
+        for seed in ["1", "2"]:
+            env = dict(os.environ, PYTHONHASHSEED=seed)
+            out = subprocess.check_output([sys.executable, "-c", code], env=env)
+            digests.add(out.decode().strip())
+        self.assertEqual(len(digests), 1)
+
+    def test_update_digest(self):
+        h1, h2 = (hashlib.blake2b() for _ in range(2))
+        a = pybamm.Symbol("a")
+        b = pybamm.Symbol("b")
+        pybamm.update_digest(h1, {a: 1, b: (2, "x", None)})
+        pybamm.update_digest(h2, {b: (2, "x", None), a: 1})
+        self.assertEqual(h1.digest(), h2.digest())
+        with self.assertRaisesRegex(TypeError, "Cannot compute a digest"):
+            pybamm.update_digest(h1, object())
+
     def test_symbol_visualise(self):
         with TemporaryDirectory() as dir_name:
             test_stub = os.path.join(dir_name, "test_visualize")
@@ -549,7 +612,6 @@ class TestIsZero(TestCase):
 
 if __name__ == "__main__":
     print("Add -v for more debug output")
-    import sys
 
     if "-v" in sys.argv:
         debug = True
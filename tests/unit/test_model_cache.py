@@ -0,0 +1,219 @@
+#
+# Tests for the ModelCache class
+#
+import os
+import subprocess
+import sys
+import unittest
+from tempfile import TemporaryDirectory
+
+import numpy as np
+
+import pybamm
+from tests import TestCase
+
+
+def get_key(cache, model=None, parameter_values=None, var_pts=None):
+    model = model or pybamm.lithium_ion.SPM()
+    parameter_values = parameter_values or model.default_parameter_values
+    geometry = model.default_geometry
+    parameter_values.process_geometry(geometry)
+    return cache.key(
+        model,
+        parameter_values,
+        geometry,
+        model.default_submesh_types,
+        var_pts or model.default_var_pts,
+        model.default_spatial_methods,
+    )
+
+
+DIFFUSIVITY_SCALE = 1e-14
+
+
+def scaled_diffusivity(sto, T):
+    return DIFFUSIVITY_SCALE * pybamm.exp(-sto)
+
+
+class TestModelCache(TestCase):
+    def test_key(self):
+        with TemporaryDirectory() as dir_name:
+            cache = pybamm.ModelCache(dir_name)
+            key = get_key(cache)
+            self.assertEqual(key, get_key(cache))
+
+            # options
+            model = pybamm.lithium_ion.SPM({"thermal": "lumped"})
+            self.assertNotEqual(key, get_key(cache, model=model))
+
+            # parameter values
+            parameter_values = pybamm.ParameterValues("Marquis2019")
+            parameter_values["Current function [A]"] = 2
+            self.assertNotEqual(
+                key, get_key(cache, parameter_values=parameter_values)
+            )
+            parameter_values["Current function [A]"] = pybamm.Interpolant(
+                np.array([0, 1]), np.array([1, 2]), pybamm.t
+            )
+            key_interp = get_key(cache, parameter_values=parameter_values)
+            parameter_values["Current function [A]"] = pybamm.Interpolant(
+                np.array([0, 1]), np.array([1, 3]), pybamm.t
+            )
+            self.assertNotEqual(
+                key_interp, get_key(cache, parameter_values=parameter_values)
+            )
+            # functions promoted to inputs
+            parameter_values = pybamm.ParameterValues("Marquis2019")
+            parameter_values.promote_to_inputs(
+                ["Negative electrode diffusivity [m2.s-1]"]
+            )
+            key_scaled = get_key(cache, parameter_values=parameter_values)
+            parameter_values = pybamm.ParameterValues("Marquis2019")
+            parameter_values.promote_to_inputs(
+                ["Positive electrode diffusivity [m2.s-1]"]
+            )
+            self.assertNotEqual(
+                key_scaled, get_key(cache, parameter_values=parameter_values)
+            )
+
+            # mesh
+            var_pts = pybamm.lithium_ion.SPM().default_var_pts
+            var_pts["x_n"] = 7
+            self.assertNotEqual(key, get_key(cache, var_pts=var_pts))
+
+            # equations
+            model = pybamm.lithium_ion.SPM()
+            model.variables["New variable"] = 2 * model.variables["Voltage [V]"]
+            self.assertNotEqual(key, get_key(cache, model=model))
+            model = pybamm.lithium_ion.SPM()
+            model.events = model.events[:-1]
+            self.assertNotEqual(key, get_key(cache, model=model))
+
+            # settings
+            pybamm.settings.set_smoothing_parameters(10)
+            try:
+                self.assertNotEqual(key, get_key(cache))
+            finally:
+                pybamm.settings.set_smoothing_parameters("exact")
+
+    def test_key_functions(self):
+        def diffusivity_with_scale(scale):
+            def diffusivity(sto, T):
+                return scale * pybamm.exp(-sto)
+
+            return diffusivity
+
+        def diffusivity_with_default(sto, T, scale=1e-14):
+            return scale * pybamm.exp(-sto)
+
+        with TemporaryDirectory() as dir_name:
+            cache = pybamm.ModelCache(dir_name)
+            parameter_values = pybamm.ParameterValues("Chen2020")
+            keys = set()
+            # functions that only differ in a closure cell, default or global
+            for function in [
+                diffusivity_with_scale(1e-14),
+                diffusivity_with_scale(2e-14),
+                diffusivity_with_default,
+                lambda sto, T, scale=2e-14: scale * pybamm.exp(-sto),
+                scaled_diffusivity,
+            ]:
+                parameter_values["Negative electrode diffusivity [m2.s-1]"] = function
+                keys.add(get_key(cache, parameter_values=parameter_values))
+            global DIFFUSIVITY_SCALE
+            DIFFUSIVITY_SCALE = 2e-14
+            try:
+                keys.add(get_key(cache, parameter_values=parameter_values))
+            finally:
+                DIFFUSIVITY_SCALE = 1e-14
+            self.assertEqual(len(keys), 6)
+
+            # values that cannot be hashed deterministically give no key, and the
+            # simulation does not use the cache
+            parameter_values["Negative electrode diffusivity [m2.s-1]"] = object()
+            self.assertIsNone(get_key(cache, parameter_values=parameter_values))
+            self.assertIsNone(
+                pybamm.ModelCache.parameter_values_key(parameter_values)
+            )
+            model = pybamm.lithium_ion.SPM()
+            parameter_values = model.default_parameter_values
+            parameter_values["Negative electrode diffusivity [m2.s-1]"] = (
+                diffusivity_with_scale(1e-14)
+            )
+            parameter_values.update({"Unused": object()}, check_already_exists=False)
+            sim = pybamm.Simulation(
+                model, parameter_values=parameter_values, cache_dir=dir_name
+            )
+            sim.solve([0, 600])
+            self.assertIsNone(sim._cache_key)
+            self.assertEqual(os.listdir(dir_name), [])
+
+    def test_key_is_stable_between_processes(self):
+        with TemporaryDirectory() as dir_name:
+            cache = pybamm.ModelCache(dir_name)
+            code = (
+                "import pybamm; from tests.unit.test_model_cache import get_key; "
+                f"print(get_key(pybamm.ModelCache({dir_name!r})))"
+            )
+            keys = set()
+            for seed in ["1", "2"]:
+                env = dict(os.environ, PYTHONHASHSEED=seed)
+                out = subprocess.check_output(
+                    [sys.executable, "-c", code], env=env, cwd=pybamm.root_dir()
+                )
+                keys.add(out.decode().strip().splitlines()[-1])
+            self.assertEqual(keys, {get_key(cache)})
+
+    def test_solver_key(self):
+        key = pybamm.ModelCache.solver_key(pybamm.CasadiSolver())
+        self.assertEqual(key, pybamm.ModelCache.solver_key(pybamm.CasadiSolver()))
+        self.assertNotEqual(
+            key, pybamm.ModelCache.solver_key(pybamm.CasadiSolver(rtol=1e-3))
+        )
+        self.assertNotEqual(
+            key, pybamm.ModelCache.solver_key(pybamm.CasadiSolver(mode="fast"))
+        )
+        self.assertNotEqual(key, pybamm.ModelCache.solver_key(pybamm.ScipySolver()))
+        self.assertNotEqual(
+            key, pybamm.ModelCache.solver_key(pybamm.CasadiSolver(), {"a": 1})
+        )
+        self.assertNotEqual(
+            pybamm.ModelCache.solver_key(pybamm.CasadiSolver(), {"a": 1}),
+            pybamm.ModelCache.solver_key(pybamm.CasadiSolver(), {"a": 1}, ["a"]),
+        )
+
+        # solver state does not change the key
+        solver = pybamm.CasadiSolver()
+        model = pybamm.lithium_ion.SPM()
+        pybamm.Simulation(model, solver=solver).solve([0, 600])
+        self.assertEqual(key, pybamm.ModelCache.solver_key(solver))
+
+    def test_save_load_clear(self):
+        with TemporaryDirectory() as dir_name:
+            cache = pybamm.ModelCache(os.path.join(dir_name, "cache"))
+            self.assertNotIn("a", cache)
+            self.assertIsNone(cache.load("a"))
+
+            cache.save("a", {"x": 1})
+            self.assertIn("a", cache)
+            self.assertEqual(cache.load("a"), {"x": 1})
+            # no temporary files are left behind
+            self.assertEqual(os.listdir(cache.directory), ["a.pkl"])
+
+            # unreadable entries are treated as missing
+            with open(os.path.join(cache.directory, "b.pkl"), "w") as f:
+                f.write("not a pickle")
+            self.assertIsNone(cache.load("b"))
+
+            cache.clear()
+            self.assertNotIn("a", cache)
+            self.assertEqual(os.listdir(cache.directory), [])
+
+
+if __name__ == "__main__":
+    print("Add -v for more debug output")
+
+    if "-v" in sys.argv:
+        debug = True
+    pybamm.settings.debug_mode = True
+    unittest.main()
@@ -3,6 +3,7 @@
 #
 from tests import TestCase
 import pybamm
+import numpy as np
 import unittest
 
 
@@ -74,6 +75,37 @@ class TestElectrodeSOH(TestCase):
         self.assertAlmostEqual(sol["Up(y_0) - Un(x_0)"], Vmin, places=5)
         self.assertAlmostEqual(sol["Q"], Q, places=5)
 
+    def test_solve_batch(self):
+        param = pybamm.LithiumIonParameters()
+        parameter_values = pybamm.ParameterValues("Mohtat2020")
+
+        esoh_solver = pybamm.lithium_ion.ElectrodeSOHSolver(parameter_values, param)
+
+        Q_n = parameter_values.evaluate(param.n.Q_init)
+        Q_p = parameter_values.evaluate(param.p.Q_init)
+        Q_Li = parameter_values.evaluate(param.Q_Li_particles_init)
+
+        # capacities fading over the cycles of an experiment
+        inputs = {
+            "Q_Li": Q_Li * np.linspace(1, 0.8, 10),
+            "Q_n": Q_n * np.linspace(1, 0.9, 10),
+            "Q_p": Q_p * np.linspace(1, 0.95, 10),
+        }
+        sol = esoh_solver.solve_batch(inputs)
+        for i in range(10):
+            sol_i = esoh_solver.solve({k: v[i] for k, v in inputs.items()})
+            for key, value in sol_i.items():
+                self.assertAlmostEqual(sol[key][i], value, places=5)
+
+        # entries for which the batched solve does not converge are solved one by
+        # one (here all of them, as no residual can be below a tolerance of 0)
+        sol_one_by_one = esoh_solver.solve_batch(inputs, tol=0)
+        for key, value in sol_one_by_one.items():
+            np.testing.assert_allclose(sol[key], value, rtol=1e-5)
+
+        with self.assertRaisesRegex(ValueError, "same length"):
+            esoh_solver.solve_batch({"Q_Li": [Q_Li], "Q_n": [Q_n, Q_n], "Q_p": Q_p})
+
     def test_error(self):
         param = pybamm.LithiumIonParameters()
         parameter_values = pybamm.ParameterValues("Ai2020")
@@ -308,6 +340,81 @@ class TestGetInitialSOC(TestCase):
         V = parameter_values.evaluate(param.p.prim.U(y, T) - param.n.prim.U(x, T))
         self.assertAlmostEqual(V, 4)
 
+    def test_initial_soc_reused_solver(self):
+        param = pybamm.LithiumIonParameters()
+        parameter_values = pybamm.ParameterValues("Mohtat2020")
+        esoh_solver = pybamm.lithium_ion.ElectrodeSOHSolver(parameter_values, param)
+
+        # the min/max stoichiometries are only solved for once
+        self.assertEqual(
+            esoh_solver.get_min_max_stoichiometries(),
+            esoh_solver.get_min_max_stoichiometries(),
+        )
+        self.assertEqual(esoh_solver._solve_initial_values.cache_info().misses, 1)
+
+        for initial_value in [0.3, "3.5 V", "4.1 V"]:
+            x, y = esoh_solver.get_initial_stoichiometries(initial_value)
+            x_new, y_new = pybamm.lithium_ion.get_initial_stoichiometries(
+                initial_value, parameter_values, param
+            )
+            self.assertAlmostEqual(x, x_new)
+            self.assertAlmostEqual(y, y_new)
+
+            new_parameter_values = parameter_values.set_initial_stoichiometries(
+                initial_value, param=param, inplace=False, esoh_solver=esoh_solver
+            )
+            self.assertAlmostEqual(
+                new_parameter_values[
+                    "Initial concentration in negative electrode [mol.m-3]"
+                ],
+                x * parameter_values.evaluate(param.n.prim.c_max),
+            )
+
+        # the next solve is started from the last solution
+        Q_n = parameter_values.evaluate(param.n.Q_init)
+        Q_p = parameter_values.evaluate(param.p.Q_init)
+        Q_Li = parameter_values.evaluate(param.Q_Li_particles_init)
+        inputs = {"Q_Li": 0.9 * Q_Li, "Q_n": Q_n, "Q_p": Q_p}
+        self.assertIsNotNone(esoh_solver._solve_warm_started(inputs))
+        sol = esoh_solver.solve(inputs)
+        self.assertAlmostEqual(sol["Up(y_100) - Un(x_100)"], 4.2, places=5)
+        self.assertAlmostEqual(sol["Up(y_0) - Un(x_0)"], 2.8, places=5)
+        self.assertAlmostEqual(sol["Q_Li"], 0.9 * Q_Li, places=5)
+
+        # the solver keeps its own copy of the parameter values
+        parameter_values.update({"Open-circuit voltage at 100% SOC [V]": 4.1})
+        self.assertEqual(
+            esoh_solver.parameter_values["Open-circuit voltage at 100% SOC [V]"], 4.2
+        )
+
+        # the solver must have been set up with the same arguments
+        with self.assertRaisesRegex(ValueError, "parameter values of the eSOH"):
+            parameter_values.set_initial_stoichiometries(
+                0.5, param=param, inplace=False, esoh_solver=esoh_solver
+            )
+        parameter_values = pybamm.ParameterValues("Mohtat2020")
+        with self.assertRaisesRegex(ValueError, "param of the eSOH"):
+            parameter_values.set_initial_stoichiometries(
+                0.5,
+                param=pybamm.LithiumIonParameters(),
+                inplace=False,
+                esoh_solver=esoh_solver,
+            )
+        with self.assertRaisesRegex(ValueError, "known_value of the eSOH"):
+            parameter_values.set_initial_stoichiometries(
+                0.5,
+                inplace=False,
+                known_value="cell capacity",
+                esoh_solver=esoh_solver,
+            )
+        with self.assertRaisesRegex(ValueError, "options of the eSOH"):
+            parameter_values.set_initial_stoichiometries(
+                0.5,
+                inplace=False,
+                options={"thermal": "lumped"},
+                esoh_solver=esoh_solver,
+            )
+
     def test_min_max_stoich(self):
         param = pybamm.LithiumIonParameters()
         parameter_values = pybamm.ParameterValues("Mohtat2020")
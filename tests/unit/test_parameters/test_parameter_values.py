@@ -189,6 +189,27 @@ class TestParameterValues(TestCase):
         Up_100 = param_100["Initial voltage in positive electrode [V]"]
         self.assertAlmostEqual(Up_100 - Un_100, 4.2)
 
+    def test_promote_to_inputs(self):
+        param = pybamm.ParameterValues(
+            {"a": 2, "b": lambda x: 3 * x, "c": 4, "d": 2 * pybamm.Parameter("a")}
+        )
+        new_param, inputs = param.promote_to_inputs(["a", "b"], inplace=False)
+        self.assertEqual(inputs, {"a": 2, "b scaling factor": 1})
+        self.assertEqual(param["a"], 2)
+        self.assertIsInstance(new_param["a"], pybamm.InputParameter)
+        self.assertEqual(new_param["c"], 4)
+
+        x = pybamm.Scalar(5)
+        a = new_param.process_symbol(pybamm.Parameter("a"))
+        self.assertEqual(a.evaluate(inputs={"a": 7}), 7)
+        b = new_param.process_symbol(pybamm.FunctionParameter("b", {"x": x}))
+        self.assertEqual(b.evaluate(inputs={"b scaling factor": 2}), 30)
+
+        param.promote_to_inputs(["c"])
+        self.assertIsInstance(param["c"], pybamm.InputParameter)
+        with self.assertRaisesRegex(TypeError, "Cannot replace parameter 'd'"):
+            param.promote_to_inputs(["d"])
+
     def test_check_parameter_values(self):
         with self.assertRaisesRegex(ValueError, "propotional term"):
             pybamm.ParameterValues(
@@ -4,6 +4,7 @@
 from tests import TestCase
 
 import os
+import tempfile
 import numpy as np
 import pybamm
 
@@ -53,6 +54,84 @@ class TestProcessParameterData(TestCase):
         self.assertIsInstance(processed[1][0][2], np.ndarray)
         self.assertIsInstance(processed[1][1], np.ndarray)
 
+    def test_process_1D_data_cache(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            filename = os.path.join(tmp_dir, "cycle.csv")
+            data = np.column_stack([np.arange(5.0), np.arange(5.0) ** 2])
+            np.savetxt(filename, data, delimiter=",", header="x,y")
+
+            name, ([x], y) = pybamm.parameters.process_1D_data(filename)
+            self.assertEqual(name, "cycle")
+            np.testing.assert_array_equal(x, data[:, 0])
+            np.testing.assert_array_equal(y, data[:, 1])
+            # the cached data is returned while the file is unchanged, and it
+            # cannot be modified
+            _, ([x_cached], _) = pybamm.parameters.process_1D_data(filename)
+            self.assertIs(x_cached.base, x.base)
+            with self.assertRaisesRegex(ValueError, "read-only"):
+                x[0] = 1
+
+            # changing the file gives new data
+            np.savetxt(filename, 2 * data, delimiter=",", header="x,y")
+            os.utime(filename, ns=(0, os.stat(filename).st_mtime_ns + 1))
+            _, (_, y) = pybamm.parameters.process_1D_data(filename)
+            np.testing.assert_array_equal(y, 2 * data[:, 1])
+
+            # the parsed data is saved in the cache directory and memory mapped
+            cache_dir = os.path.join(tmp_dir, "cache")
+            pybamm.parameters.process_1D_data(filename, cache_dir=cache_dir)
+            self.assertEqual(len(os.listdir(cache_dir)), 1)
+            pybamm.parameters.process_parameter_data._tables.clear()
+            _, ([x], y) = pybamm.parameters.process_1D_data(
+                filename, cache_dir=cache_dir
+            )
+            self.assertIsInstance(y.base, np.memmap)
+            self.assertTrue(x.flags.c_contiguous)
+            np.testing.assert_array_equal(y, 2 * data[:, 1])
+
+            # npy files are memory mapped
+            np.save(os.path.join(tmp_dir, "cycle_npy.npy"), data)
+            name, ([x], y) = pybamm.parameters.process_1D_data(
+                "cycle_npy.npy", path=tmp_dir
+            )
+            self.assertEqual(name, "cycle_npy")
+            self.assertIsInstance(y.base, np.memmap)
+            np.testing.assert_array_equal(y, data[:, 1])
+
+            # missing values are read as NaN
+            with open(filename, "w") as f:
+                f.write("x,y\n0,1\n1,\n")
+            _, (_, y) = pybamm.parameters.process_1D_data(filename)
+            np.testing.assert_array_equal(y, [1, np.nan])
+
+    def test_decimate_1D_data(self):
+        x = np.arange(1000.0)
+        y = np.repeat(np.random.default_rng(0).normal(0, 2, 100), 10)
+        y += np.random.default_rng(1).normal(0, 0.001, 1000)
+
+        # linear: the interpolant of the compressed data is within the tolerance
+        x_new, y_new = pybamm.parameters.decimate_1D_data(x, y, 0.01)
+        self.assertLess(len(x_new), 300)
+        self.assertEqual((x_new[0], x_new[-1]), (x[0], x[-1]))
+        np.testing.assert_array_less(np.abs(np.interp(x, x_new, y_new) - y), 0.01)
+        x_new, y_new = pybamm.parameters.decimate_1D_data(x, 3 * x + 1, 1e-12)
+        np.testing.assert_array_equal(x_new, [0, 999])
+
+        # constant: each data point is within the tolerance of its segment
+        x_new, y_new = pybamm.parameters.decimate_1D_data(x, y, 0.01, "constant")
+        self.assertEqual(len(x_new), 100)
+        segments = np.searchsorted(x_new, x, side="right") - 1
+        np.testing.assert_array_less(np.abs(y_new[segments] - y), 0.01)
+
+        # the piecewise-constant function steps at the start of each segment
+        function = pybamm.parameters.piecewise_constant_function(x_new, y_new)
+        for t in [0, 9.5, 10, 505, 999]:
+            segment = np.searchsorted(x_new, t, side="right") - 1
+            self.assertAlmostEqual(function.evaluate(t=t), y_new[segment])
+
+        with self.assertRaisesRegex(ValueError, "not recognised"):
+            pybamm.parameters.decimate_1D_data(x, y, 0.01, "cubic")
+
     def test_error(self):
         with self.assertRaisesRegex(FileNotFoundError, "Could not find file"):
             pybamm.parameters.process_1D_data("not_a_real_file", "not_a_real_path")
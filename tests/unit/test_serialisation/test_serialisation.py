@@ -528,6 +528,64 @@ class TestSerialise(TestCase):
         newest_solver = newest_model.default_solver
         newest_solver.solve(newest_model, [0, 3600])
 
+    def test_save_load_model_binary(self):
+        model = pybamm.lithium_ion.SPM(name="test_spm_binary")
+        geometry = model.default_geometry
+        param = model.default_parameter_values
+        param.process_model(model)
+        param.process_geometry(geometry)
+        mesh = pybamm.Mesh(geometry, model.default_submesh_types, model.default_var_pts)
+        disc = pybamm.Discretisation(mesh, model.default_spatial_methods)
+        disc.process_model(model)
+        solution = model.default_solver.solve(model, [0, 3600])
+
+        for compress in [True, False]:
+            Serialise().save_model(
+                model,
+                mesh=mesh,
+                variables=model.variables,
+                filename="test_model_binary",
+                binary=True,
+                compress=compress,
+            )
+            self.assertTrue(os.path.exists("test_model_binary.npz"))
+            new_model = Serialise().load_model("test_model_binary.npz")
+            os.remove("test_model_binary.npz")
+
+            # check the expression trees and matrices are reconstructed
+            self.assertEqual(new_model.name, "test_spm_binary_saved")
+            self.assertEqual(
+                new_model.concatenated_rhs.id, model.concatenated_rhs.id
+            )
+            self.assertEqual(
+                new_model.mass_matrix.entries.nnz, model.mass_matrix.entries.nnz
+            )
+
+            # check new model solves and plots
+            new_solution = new_model.default_solver.solve(new_model, [0, 3600])
+            testing.assert_array_almost_equal(
+                new_solution["Voltage [V]"].entries, solution["Voltage [V]"].entries
+            )
+            self.assertEqual(new_solution.termination, solution.termination)
+            new_solution.plot(testing=True)
+
+        # shared symbols are only stored once
+        table = Serialise._SymbolTable()
+        a = pybamm.Vector(np.array([1.0, 2.0]))
+        a_position = table.add(a)
+        position = table.add(pybamm.Addition(a, a))
+        self.assertEqual(table.nodes[position]["children"], [a_position, a_position])
+        self.assertEqual(len(table.nodes), 2)
+        self.assertEqual(list(table.arrays), ["array_0"])
+
+        # the model can also be saved from a simulation
+        sim = pybamm.Simulation(pybamm.lithium_ion.SPM())
+        sim.build()
+        sim.save_model("test_sim_binary", mesh=True, variables=True, binary=True)
+        new_model = pybamm.load_model("test_sim_binary.npz")
+        os.remove("test_sim_binary.npz")
+        new_model.default_solver.solve(new_model, [0, 3600])
+
     def test_save_experiment_model_error(self):
         model = pybamm.lithium_ion.SPM()
         experiment = pybamm.Experiment(["Discharge at 1C for 1 hour"])
@@ -6,6 +6,7 @@ import os
 import sys
 import unittest
 import uuid
+from unittest import mock
 from tempfile import TemporaryDirectory
 
 
@@ -176,8 +177,19 @@ class TestSimulation(TestCase):
         sim = pybamm.Simulation(model, parameter_values=param)
         sim.solve(t_eval=[0, 600], initial_soc=1)
         self.assertEqual(sim._built_initial_soc, 1)
+        esoh_solver = sim._initial_soc_esoh_solver
         sim.solve(t_eval=[0, 600], initial_soc=0.5)
         self.assertEqual(sim._built_initial_soc, 0.5)
+        # the eSOH solver is reused until the parameter values change
+        self.assertIs(sim._initial_soc_esoh_solver, esoh_solver)
+        sim.update_parameters({"Ambient temperature [K]": 300})
+        sim.solve(t_eval=[0, 600], initial_soc=0.5)
+        self.assertIsNot(sim._initial_soc_esoh_solver, esoh_solver)
+        # changing the parameter values in place also gives a new solver
+        esoh_solver = sim._initial_soc_esoh_solver
+        sim._unprocessed_parameter_values["Ambient temperature [K]"] = 298.15
+        sim.solve(t_eval=[0, 600], initial_soc=0.8)
+        self.assertIsNot(sim._initial_soc_esoh_solver, esoh_solver)
         exp = pybamm.Experiment(
             [pybamm.step.string("Discharge at 1C until 3.6V", period="1 minute")]
         )
@@ -248,6 +260,26 @@ class TestSimulation(TestCase):
             sim.solution.all_inputs[0]["Current function [A]"], 1
         )
 
+    def test_solve_with_output_tolerances(self):
+        sim = pybamm.Simulation(pybamm.lithium_ion.SPM())
+        t_eval = np.linspace(0, 3600, 1001)
+        sol = sim.solve(t_eval, output_tolerances={"Voltage [V]": 1e-3})
+        self.assertLess(len(sol.t), 100)
+        self.assertEqual(sol.t[-1], 3600)
+
+        # list of inputs
+        model = pybamm.lithium_ion.SPM()
+        param = model.default_parameter_values
+        param.update({"Current function [A]": "[input]"})
+        sim = pybamm.Simulation(model, parameter_values=param)
+        sols = sim.solve(
+            t_eval,
+            inputs=[{"Current function [A]": 1}, {"Current function [A]": 2}],
+            output_tolerances={"Voltage [V]": 1e-3},
+        )
+        for sol in sols:
+            self.assertLess(len(sol.t), 100)
+
     def test_step_with_inputs(self):
         dt = 0.001
         model = pybamm.lithium_ion.SPM()
@@ -308,6 +340,222 @@ class TestSimulation(TestCase):
                 sim.save(test_name)
 
 
+    def test_model_cache(self):
+        with TemporaryDirectory() as dir_name:
+            model = pybamm.lithium_ion.SPM()
+            sim = pybamm.Simulation(model, cache_dir=dir_name)
+            sol = sim.solve([0, 600])
+            self.assertEqual(len(os.listdir(dir_name)), 1)
+            self.assertIsNotNone(sim._cache_solver_key)
+
+            # a new simulation loads the built and set-up model from the cache
+            sim_cached = pybamm.Simulation(model, cache_dir=dir_name)
+            sim_cached.build()
+            self.assertIsNotNone(sim_cached.model_with_set_params)
+            self.assertIsNotNone(sim_cached.mesh)
+            self.assertTrue(sim_cached.built_model.is_discretised)
+            self.assertIsNot(sim_cached.built_model, sim.built_model)
+            self.assertTrue(hasattr(sim_cached.built_model, "casadi_rhs"))
+            set_up = pybamm.BaseSolver.set_up
+            with mock.patch.object(
+                pybamm.BaseSolver, "set_up", autospec=True, side_effect=set_up
+            ) as mock_set_up:
+                sol_cached = sim_cached.solve([0, 600])
+                mock_set_up.assert_not_called()
+
+                # a solver with different settings sets the model up again
+                sim_rtol = pybamm.Simulation(
+                    model, cache_dir=dir_name, solver=pybamm.CasadiSolver(rtol=1e-5)
+                )
+                sim_rtol.solve([0, 600])
+                mock_set_up.assert_called_once()
+            np.testing.assert_array_equal(sol.y, sol_cached.y)
+            self.assertEqual(len(os.listdir(dir_name)), 1)
+
+            # different parameters give a different entry
+            param = model.default_parameter_values
+            param["Current function [A]"] = 2
+            sim_param = pybamm.Simulation(
+                model, parameter_values=param, cache_dir=dir_name
+            )
+            sim_param.solve([0, 600])
+            self.assertEqual(len(os.listdir(dir_name)), 2)
+
+            # models in the python format are not set up from the cache
+            model.convert_to_format = "python"
+            sim_python = pybamm.Simulation(model, cache_dir=dir_name)
+            sim_python.solve([0, 600])
+            self.assertIsNone(sim_python._cache_solver_key)
+            self.assertEqual(len(os.listdir(dir_name)), 3)
+
+    def test_update_parameters(self):
+        model = pybamm.lithium_ion.SPM()
+        param = model.default_parameter_values
+        names = [
+            "Current function [A]",
+            "Initial concentration in negative electrode [mol.m-3]",
+        ]
+        sim = pybamm.Simulation(
+            model, parameter_values=param.copy(), updatable_parameters=names
+        )
+        sim.solve([0, 600])
+        self.assertEqual(sim.built_model.input_parameters, [])
+        template = sim._built_model_template
+        self.assertEqual({p.name for p in template.input_parameters}, set(names))
+
+        def solve_new_simulation(values):
+            new_param = param.copy()
+            new_param.update(values)
+            return pybamm.Simulation(model, parameter_values=new_param).solve(
+                [0, 600]
+            )
+
+        # new values are substituted in the built model
+        values = {"Current function [A]": 1.5}
+        sol = sim.solution
+        sol["Voltage [V]"]
+        sol["Negative particle concentration [mol.m-3]"]
+        old_model = sim.built_model
+        sim.update_parameters(values)
+        self.assertIs(sim._built_model_template, template)
+        self.assertIsNot(sim.built_model, old_model)
+        self.assertEqual(sim.parameter_values["Current function [A]"], 1.5)
+        # only the variables that depend on the current are processed again
+        self.assertEqual(
+            list(sim.built_model._variables_casadi.keys()),
+            ["Negative particle concentration [mol.m-3]"],
+        )
+        sol = sim.solve([0, 600])
+        np.testing.assert_array_almost_equal(
+            sol["Voltage [V]"].entries,
+            solve_new_simulation(values)["Voltage [V]"].entries,
+        )
+
+        # when only the initial conditions change, the solver set-up is kept
+        values["Initial concentration in negative electrode [mol.m-3]"] = 15000
+        set_up = pybamm.BaseSolver.set_up
+        with mock.patch.object(
+            pybamm.BaseSolver, "set_up", autospec=True, side_effect=set_up
+        ) as mock_set_up:
+            sim.update_parameters(values)
+            sol = sim.solve([0, 600])
+            mock_set_up.assert_called_once()
+            self.assertTrue(mock_set_up.call_args.kwargs["ics_only"])
+        self.assertEqual(list(sim.solver._model_set_up), [sim.built_model])
+        np.testing.assert_array_almost_equal(
+            sol["Voltage [V]"].entries,
+            solve_new_simulation(values)["Voltage [V]"].entries,
+        )
+
+        # other parameters build the simulation again
+        values["Negative electrode porosity"] = 0.35
+        sim.update_parameters(values)
+        self.assertIsNone(sim.built_model)
+        sol = sim.solve([0, 600])
+        np.testing.assert_array_almost_equal(
+            sol["Voltage [V]"].entries,
+            solve_new_simulation(values)["Voltage [V]"].entries,
+        )
+
+        # the values of updatable parameters must be numbers
+        with self.assertRaisesRegex(ValueError, "must have a numerical value"):
+            sim.update_parameters({"Current function [A]": "[input]"})
+
+    def test_updatable_parameters_errors(self):
+        model = pybamm.lithium_ion.SPM()
+        with self.assertRaisesRegex(ValueError, "must have a numerical value"):
+            pybamm.Simulation(
+                model,
+                updatable_parameters=["Negative electrode diffusivity [m2.s-1]"],
+            )
+        with self.assertRaisesRegex(ValueError, "used in the geometry"):
+            pybamm.Simulation(
+                model, updatable_parameters=["Negative electrode thickness [m]"]
+            )
+        with self.assertRaisesRegex(ValueError, "used in the geometry"):
+            pybamm.Simulation(
+                model, updatable_parameters=["Negative particle radius [m]"]
+            )
+        with self.assertRaisesRegex(ValueError, "set by the experiment"):
+            pybamm.Simulation(
+                model,
+                experiment="Discharge at 1C for 1 hour",
+                updatable_parameters=["Current function [A]"],
+            )
+        sim = pybamm.Simulation(model)
+        sim.build()
+        with self.assertRaisesRegex(ValueError, "already discretised"):
+            pybamm.Simulation(
+                sim.built_model, updatable_parameters=["Current function [A]"]
+            )
+
+    def test_sweep(self):
+        model = pybamm.lithium_ion.SPM()
+        param = model.default_parameter_values
+        names = ["Current function [A]", "Negative electrode diffusivity [m2.s-1]"]
+        sim = pybamm.Simulation(
+            model, parameter_values=param.copy(), sweep_parameters=names
+        )
+        scale_name = "Negative electrode diffusivity [m2.s-1] scaling factor"
+        self.assertEqual(
+            sim._get_sweep_inputs(),
+            {"Current function [A]": param["Current function [A]"], scale_name: 1},
+        )
+
+        sols = sim.sweep(
+            {"Current function [A]": [0.5, 1], scale_name: [2, 3]}, t_eval=[0, 600]
+        )
+        self.assertEqual(len(sols), 2)
+        built_model = sim.built_model
+        self.assertEqual(
+            {p.name for p in built_model.input_parameters},
+            {"Current function [A]", scale_name},
+        )
+        for sol, current, scale in zip(sols, [0.5, 1], [2, 3]):
+            new_param = param.copy()
+            diffusivity = new_param["Negative electrode diffusivity [m2.s-1]"]
+            new_param.update(
+                {
+                    "Current function [A]": current,
+                    "Negative electrode diffusivity [m2.s-1]": (
+                        lambda sto, T, diffusivity=diffusivity, scale=scale: scale
+                        * diffusivity(sto, T)
+                    ),
+                }
+            )
+            sol_new = pybamm.Simulation(model, parameter_values=new_param).solve(
+                [0, 600]
+            )
+            np.testing.assert_array_almost_equal(
+                sol["Voltage [V]"].entries, sol_new["Voltage [V]"].entries
+            )
+
+        # the inputs that are not given take the values of the parameters
+        sols = sim.sweep({scale_name: [1]}, t_eval=[0, 600])
+        self.assertIs(sim.built_model, built_model)
+        sol = sim.solve([0, 600])
+        np.testing.assert_array_almost_equal(
+            sols[0]["Voltage [V]"].entries, sol["Voltage [V]"].entries
+        )
+        self.assertEqual(
+            sol.all_inputs[0]["Current function [A]"], param["Current function [A]"]
+        )
+
+        with self.assertRaisesRegex(ValueError, "not the input of a sweep parameter"):
+            sim.sweep({"Negative electrode diffusivity [m2.s-1]": [1]})
+        with self.assertRaisesRegex(ValueError, "same number of values"):
+            sim.sweep({"Current function [A]": [1, 2], scale_name: [1]})
+        with self.assertRaisesRegex(ValueError, "both an updatable and a sweep"):
+            pybamm.Simulation(
+                model,
+                updatable_parameters=["Current function [A]"],
+                sweep_parameters=["Current function [A]"],
+            )
+        with self.assertRaisesRegex(ValueError, "used in the geometry"):
+            pybamm.Simulation(
+                model, sweep_parameters=["Negative electrode thickness [m]"]
+            )
+
     def test_load_param(self):
         # Test load_sim for parameters imports
         filename = f"{uuid.uuid4()}.p"
@@ -385,6 +385,30 @@ class TestBaseSolver(TestCase):
                     sens_b, exact_diff_b(y, inputs["a"], inputs["b"])
                 )
 
+    def test_jacobian_action_python(self):
+        model = pybamm.lithium_ion.SPMe()
+        model.convert_to_format = "python"
+        sim = pybamm.Simulation(model)
+        sim.build()
+        model = sim.built_model
+        solver = pybamm.BaseSolver()
+        solver.set_up(model)
+
+        rng = np.random.default_rng(0)
+        y0 = model.concatenated_initial_conditions.evaluate().reshape(-1)
+        y = y0 * (1 + 0.01 * rng.random(y0.size))
+        v = rng.random(y0.size)
+        jac = model.jac_rhs_algebraic_eval(0, y, {})
+        jac_action = model.jac_rhs_algebraic_action_eval(0, y, v, {})
+        self.assertEqual(jac_action.shape, (y0.size, 1))
+        np.testing.assert_allclose(jac_action[:, 0], jac @ v, rtol=1e-10)
+
+        # column vectors are also accepted
+        jac_action = model.jac_rhs_algebraic_action_eval(
+            0, y.reshape(-1, 1), v.reshape(-1, 1), {}
+        )
+        np.testing.assert_allclose(jac_action[:, 0], jac @ v, rtol=1e-10)
+
 
 if __name__ == "__main__":
     print("Add -v for more debug output")
@@ -4,6 +4,7 @@
 from tests import TestCase
 import pybamm
 import unittest
+import unittest.mock as mock
 import numpy as np
 from tests import get_mesh_for_testing, get_discretisation_for_testing
 from scipy.sparse import eye
@@ -267,6 +268,67 @@ class TestCasadiSolver(TestCase):
         np.testing.assert_array_less(solution.y.full()[0], 1.02 + 1e-10)
         np.testing.assert_array_almost_equal(solution.y[0, -1], 1.02, decimal=2)
 
+    def test_model_solver_events_coarse_t_eval(self):
+        # The event is located accurately even when the points in t_eval are far
+        # apart
+        model = pybamm.BaseModel()
+        var1 = pybamm.Variable("var1")
+        var2 = pybamm.Variable("var2")
+        model.rhs = {var1: 0.1 * var1}
+        model.algebraic = {var2: 2 * var1 - var2}
+        model.initial_conditions = {var1: 1, var2: 2}
+        model.events = [pybamm.Event("var2 = 2.5", 2.5 - var2)]
+        t_event = 10 * np.log(1.25)
+
+        for mode in ["safe", "fast with events", "safe without grid"]:
+            solver = pybamm.CasadiSolver(mode=mode, rtol=1e-8, atol=1e-8)
+            solution = solver.solve(model, [0, 5])
+            self.assertEqual(solution.termination, "event: var2 = 2.5")
+            np.testing.assert_allclose(solution.t_event[0], t_event, rtol=1e-4)
+            # the algebraic state is consistent with the differential state
+            y_event = solution.y_event[:, 0]
+            np.testing.assert_allclose(y_event[1], 2 * y_event[0], rtol=1e-8)
+            np.testing.assert_allclose(y_event[1], 2.5 - 1e-5, rtol=1e-6)
+
+        # The cubic Hermite dense output is exact for a quadratic solution, so the
+        # event is found without integrating again over a dense window
+        model = pybamm.BaseModel()
+        model.rhs = {var1: pybamm.t}
+        model.algebraic = {var2: 2 * var1 - var2}
+        model.initial_conditions = {var1: 1, var2: 2}
+        model.events = [pybamm.Event("var2 = 2.5", 2.5 - var2)]
+        # (the event is located at 2.5 - 1e-5, see CasadiSolver._solve_for_event)
+        t_event = np.sqrt(0.5 - 1e-5)
+        for mode in ["safe", "safe without grid"]:
+            solver = pybamm.CasadiSolver(mode=mode, rtol=1e-8, atol=1e-8)
+            with mock.patch.object(
+                solver, "_integrate_window", wraps=solver._integrate_window
+            ) as integrate_window:
+                solution = solver.solve(model, [0, 5])
+            self.assertEqual(
+                [len(call.args[-1]) for call in integrate_window.call_args_list], [2]
+            )
+            np.testing.assert_allclose(solution.t_event[0], t_event, rtol=1e-7)
+            np.testing.assert_allclose(solution.y_event[1, 0], 2.5 - 1e-5, rtol=1e-6)
+
+    def test_model_solver_events_coarse_t_eval_dfn(self):
+        # With a single interval in t_eval, the dense output is not accurate enough
+        # to locate the event of a DFN, which is then found as before by integrating
+        # again over a dense window, at 1703.29 s ("fast with events") and
+        # 1703.07 s ("safe")
+        param = pybamm.ParameterValues("Chen2020")
+        param["Current function [A]"] = 10
+        sim = pybamm.Simulation(pybamm.lithium_ion.DFN(), parameter_values=param)
+        sim.build()
+        model = sim.built_model
+        for mode, t_event in [("fast with events", 1703.29), ("safe", 1703.07)]:
+            solver = pybamm.CasadiSolver(mode=mode)
+            coarse = solver.solve(model, [0, 5000])
+            fine = solver.solve(model, np.linspace(0, 5000, 101))
+            self.assertEqual(coarse.termination, "event: Minimum voltage [V]")
+            np.testing.assert_allclose(coarse.t_event, fine.t_event, atol=0.01)
+            np.testing.assert_allclose(coarse.t_event, t_event, atol=0.05)
+
     def test_model_step(self):
         # Create model
         model = pybamm.BaseModel()
@@ -539,6 +601,51 @@ class TestCasadiSolver(TestCase):
         with self.assertRaisesRegex(pybamm.SolverError, "interpolation bounds"):
             solver.solve(model, t_eval=[0, 1])
 
+    def test_output_variables(self):
+        model = pybamm.lithium_ion.SPM()
+        param = model.default_parameter_values
+        param["Current function [A]"] = 2 * param["Nominal cell capacity [A.h]"]
+        param.process_model(model)
+        geometry = model.default_geometry
+        param.process_geometry(geometry)
+        mesh = pybamm.Mesh(geometry, model.default_submesh_types, model.default_var_pts)
+        disc = pybamm.Discretisation(mesh, model.default_spatial_methods)
+        disc.process_model(model)
+        t_eval = np.linspace(0, 3600, 100)
+
+        output_variables = [
+            "Voltage [V]",
+            "Current [A]",
+            "x [m]",
+            "Negative particle concentration [mol.m-3]",
+            "Discharge capacity [A.h]",  # ExplicitTimeIntegral
+        ]
+        for mode in ["fast", "safe", "safe without grid"]:
+            sol_all = pybamm.CasadiSolver(mode=mode).solve(model, t_eval)
+            solver = pybamm.CasadiSolver(mode=mode, output_variables=output_variables)
+            sol = solver.solve(model, t_eval)
+
+            # The states are not returned, but the event is found
+            self.assertEqual(sol.y.shape, (0, len(sol_all.t)))
+            self.assertEqual(sol.termination, "event: Minimum voltage [V]")
+            np.testing.assert_array_equal(sol.t, sol_all.t)
+            for varname in output_variables:
+                np.testing.assert_allclose(
+                    sol[varname].entries, sol_all[varname].entries, rtol=1e-6
+                )
+
+        # Sensitivities are not supported
+        model = pybamm.BaseModel()
+        var = pybamm.Variable("var")
+        model.rhs = {var: -pybamm.InputParameter("a") * var}
+        model.initial_conditions = {var: 1}
+        model.variables = {"var": var}
+        solver = pybamm.CasadiSolver(output_variables=["var"])
+        with self.assertRaisesRegex(pybamm.SolverError, "output_variables"):
+            solver.solve(
+                model, t_eval, inputs={"a": 1}, calculate_sensitivities=["a"]
+            )
+
 
 class TestCasadiSolverODEsWithForwardSensitivityEquations(TestCase):
     def test_solve_sensitivity_scalar_var_scalar_input(self):
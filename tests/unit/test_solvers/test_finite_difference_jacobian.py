@@ -0,0 +1,86 @@
+#
+# Tests for the finite difference Jacobian
+#
+from tests import TestCase
+import pybamm
+
+import numpy as np
+import unittest
+from scipy.sparse import csr_matrix, diags
+
+
+class TestFiniteDifferenceJacobian(TestCase):
+    def test_colour_columns(self):
+        # tridiagonal matrices need three colours, whatever their size
+        sparsity = diags([1, 1, 1], [-1, 0, 1], shape=(50, 50))
+        colours = pybamm.solvers.finite_difference_jacobian.colour_columns(sparsity)
+        self.assertEqual(colours.max(), 2)
+        # columns of the same colour never share a row
+        pattern = csr_matrix(sparsity).toarray() != 0
+        for colour in range(3):
+            self.assertTrue(np.all(pattern[:, colours == colour].sum(axis=1) <= 1))
+
+        # dense matrices need one colour per column
+        colours = pybamm.solvers.finite_difference_jacobian.colour_columns(
+            np.ones((3, 4))
+        )
+        np.testing.assert_array_equal(colours, [0, 1, 2, 3])
+
+    def test_jacobian(self):
+        y = pybamm.StateVector(slice(0, 20))
+        a = pybamm.InputParameter("a")
+        D = pybamm.Matrix(diags([1, -2, 1], [-1, 0, 1], shape=(20, 20)))
+        symbol = D @ y + a * pybamm.exp(y) * y + pybamm.t
+        function = pybamm.EvaluatorPython(symbol)
+        sparsity = pybamm.JacobianSparsity().sparsity(symbol, y)
+        jac = pybamm.FiniteDifferenceJacobian(function, sparsity)
+        self.assertEqual(jac.n_colours, 3)
+
+        y0 = np.linspace(-1, 2, 20)
+        inputs = {"a": 3}
+        jac_exact = symbol.jac(y).evaluate(t=1, y=y0, inputs=inputs).toarray()
+        jac_eval = jac(1, y0, inputs)
+        self.assertEqual(jac_eval.nnz, sparsity.nnz)
+        np.testing.assert_allclose(jac_eval.toarray(), jac_exact, rtol=1e-6, atol=1e-7)
+
+        v = np.linspace(1, -1, 20)
+        np.testing.assert_allclose(
+            jac.jvp(1, y0, v, inputs)[:, 0], jac_exact @ v, rtol=1e-6, atol=1e-7
+        )
+        np.testing.assert_array_equal(jac.jvp(1, y0, np.zeros(20), inputs), 0)
+
+    def test_solve(self):
+        model = pybamm.lithium_ion.SPMe()
+        model.convert_to_format = "python"
+        sim = pybamm.Simulation(model, solver=pybamm.ScipySolver())
+        sol = sim.solve([0, 3600])
+
+        model = pybamm.lithium_ion.SPMe()
+        model.convert_to_format = "python"
+        model.jacobian_method = "finite difference"
+        sim = pybamm.Simulation(model, solver=pybamm.ScipySolver())
+        sol_fd = sim.solve([0, 3600])
+        self.assertIsInstance(
+            sim.built_model.jac_rhs_algebraic_eval, pybamm.FiniteDifferenceJacobian
+        )
+        np.testing.assert_allclose(
+            sol_fd["Voltage [V]"].entries, sol["Voltage [V]"].entries, rtol=1e-4
+        )
+
+    def test_unknown_method(self):
+        model = pybamm.lithium_ion.SPM()
+        model.convert_to_format = "python"
+        model.jacobian_method = "bad method"
+        sim = pybamm.Simulation(model, solver=pybamm.ScipySolver())
+        with self.assertRaisesRegex(pybamm.SolverError, "Unknown jacobian method"):
+            sim.solve([0, 3600])
+
+
+if __name__ == "__main__":
+    print("Add -v for more debug output")
+    import sys
+
+    if "-v" in sys.argv:
+        debug = True
+    pybamm.settings.debug_mode = True
+    unittest.main()
@@ -185,6 +185,79 @@ class TestIDAKLUSolver(TestCase):
             true_solution = b_value * sol.t
             np.testing.assert_array_almost_equal(sol.y[1:3], true_solution)
 
+    def test_multiple_inputs(self):
+        model = pybamm.BaseModel()
+        model.convert_to_format = "casadi"
+        u = pybamm.Variable("u")
+        v = pybamm.Variable("v")
+        a = pybamm.InputParameter("a")
+        model.rhs = {u: a * v}
+        model.algebraic = {v: 1 - v}
+        model.initial_conditions = {u: 0, v: 1}
+        model.events = [pybamm.Event("u=0.2", 0.2 - u)]
+
+        disc = pybamm.Discretisation()
+        disc.process_model(model)
+
+        t_eval = np.linspace(0, 3, 100)
+        inputs_list = [{"a": 0.01 * (i + 1)} for i in range(10)]
+        for num_threads in [1, 3]:
+            solver = pybamm.IDAKLUSolver(options={"num_threads": num_threads})
+            solutions = solver.solve(model, t_eval, inputs=inputs_list)
+            self.assertEqual(len(solutions), len(inputs_list))
+            for inputs, solution in zip(inputs_list, solutions):
+                true_solution = inputs["a"] * solution.t
+                np.testing.assert_array_almost_equal(solution.y[0], true_solution)
+                np.testing.assert_array_almost_equal(
+                    solution.y[1], np.ones(solution.t.shape)
+                )
+                self.assertEqual(solution.all_inputs[0], inputs)
+                # only the largest rates reach the event before the final time
+                if inputs["a"] * t_eval[-1] > 0.2:
+                    self.assertEqual(solution.termination, "event: u=0.2")
+                    np.testing.assert_array_almost_equal(
+                        solution.t[-1], 0.2 / inputs["a"]
+                    )
+                else:
+                    self.assertEqual(solution.termination, "final time")
+                    np.testing.assert_array_equal(solution.t, t_eval)
+
+    def test_multiple_inputs_against_sequential(self):
+        # a nonlinear DAE, whose solution depends on several inputs
+        model = pybamm.BaseModel()
+        model.convert_to_format = "casadi"
+        u = pybamm.Variable("u")
+        v = pybamm.Variable("v")
+        a = pybamm.InputParameter("a")
+        b = pybamm.InputParameter("b")
+        model.rhs = {u: -a * u * v + b}
+        model.algebraic = {v: v - pybamm.exp(-u)}
+        model.initial_conditions = {u: 1, v: np.exp(-1)}
+        model.variables = {"u": u, "v": v}
+
+        disc = pybamm.Discretisation()
+        disc.process_model(model)
+
+        t_eval = np.linspace(0, 5, 50)
+        inputs_list = [
+            {"a": a_value, "b": b_value}
+            for a_value in [0.5, 1, 2]
+            for b_value in [0, 0.1, 0.3]
+        ]
+        solver = pybamm.IDAKLUSolver(options={"num_threads": 2})
+        # solving for the list of inputs uses a group of solvers in C++
+        solutions = solver.solve(model, t_eval, inputs=inputs_list)
+        self.assertIn("solver_group", solver._setup)
+        for inputs, solution in zip(inputs_list, solutions):
+            sequential_solution = pybamm.IDAKLUSolver().solve(
+                model, t_eval, inputs=inputs
+            )
+            np.testing.assert_array_equal(solution.t, sequential_solution.t)
+            np.testing.assert_allclose(
+                solution.y, sequential_solution.y, rtol=1e-8, atol=1e-10
+            )
+            self.assertEqual(solution.termination, sequential_solution.termination)
+
     def test_sensitivites_initial_condition(self):
         for output_variables in [[], ["2v"]]:
             model = pybamm.BaseModel()
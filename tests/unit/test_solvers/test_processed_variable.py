@@ -133,6 +133,49 @@ class TestProcessedVariable(TestCase):
         with self.assertRaisesRegex(ValueError, "Cannot compute sensitivities"):
             print(processed_var.sensitivities)
 
+    def test_processed_variable_0D_sub_solutions(self):
+        # several sub-solutions, sharing a casadi function, with different inputs
+        # and both numpy and casadi states
+        t = pybamm.t
+        y = pybamm.StateVector(slice(0, 1))
+        a = pybamm.InputParameter("a")
+        var = t * y * a
+        var.mesh = None
+        all_ts = [np.linspace(0, 1), np.linspace(1.5, 2, 7), np.linspace(2.5, 3)]
+        all_ys = [
+            np.array([np.linspace(0, 5)]),
+            casadi.DM(np.array([np.linspace(5, 6, 7)])),
+            np.array([np.linspace(6, 7)]),
+        ]
+        all_inputs = [{"a": np.array([i + 1.0])} for i in range(3)]
+        var_casadi = to_casadi(var, all_ys[0], inputs=all_inputs[0])
+        processed_var = pybamm.ProcessedVariable(
+            [var] * 3,
+            [var_casadi] * 3,
+            pybamm.Solution(all_ts, all_ys, [pybamm.BaseModel()] * 3, all_inputs),
+            warn=False,
+        )
+        expected = np.concatenate(
+            [
+                ts * np.array(ys)[0] * (i + 1)
+                for i, (ts, ys) in enumerate(zip(all_ts, all_ys))
+            ]
+        )
+        np.testing.assert_array_almost_equal(processed_var.entries, expected)
+
+        # chunks of time points, with a remainder
+        mapped_functions = {}
+        entries = pybamm.solvers.processed_variable._evaluate_casadi_map(
+            var_casadi,
+            all_ts[0],
+            all_ys[0],
+            casadi.DM(1.0),
+            mapped_functions,
+            chunk_size=7,
+        )
+        np.testing.assert_array_almost_equal(entries[0], expected[:50])
+        self.assertEqual(set(mapped_functions.keys()), {7, 1})
+
     def test_processed_variable_1D(self):
         t = pybamm.t
         var = pybamm.Variable("var", domain=["negative electrode", "separator"])
@@ -4,6 +4,7 @@ import pybamm
 from tests import TestCase
 import unittest
 import numpy as np
+import pickle
 from tests import get_mesh_for_testing, get_discretisation_for_testing
 import warnings
 import sys
@@ -278,6 +279,56 @@ class TestScipySolver(TestCase):
                         solution.y[0], np.exp(-0.01 * (i + 1) * solution.t)
                     )
 
+    def test_model_solver_multiple_inputs_persistent_pool(self):
+        # Create model
+        model = pybamm.BaseModel()
+        model.convert_to_format = "casadi"
+        var = pybamm.Variable("var")
+        model.rhs = {var: -pybamm.InputParameter("rate") * var}
+        model.initial_conditions = {var: 1}
+        disc = pybamm.Discretisation()
+        disc.process_model(model)
+
+        solver = pybamm.ScipySolver(rtol=1e-8, atol=1e-8, method="RK45")
+        t_eval = np.linspace(0, 10, 100)
+        inputs_list = [{"rate": 0.01 * (i + 1)} for i in range(4)]
+
+        solutions = solver.solve(model, t_eval, inputs=inputs_list, nproc=2)
+        pool = solver._pool
+        self.assertIsNotNone(pool)
+
+        # The same pool is reused for a second solve with different inputs
+        inputs_list = [{"rate": 0.02 * (i + 1)} for i in range(6)]
+        solutions = solver.solve(model, t_eval, inputs=inputs_list, nproc=2)
+        self.assertIs(solver._pool, pool)
+        for i, solution in enumerate(solutions):
+            np.testing.assert_allclose(
+                solution.y[0], np.exp(-0.02 * (i + 1) * solution.t)
+            )
+
+        # A different number of processes starts a new pool
+        solver.solve(model, t_eval, inputs=inputs_list, nproc=3)
+        self.assertIsNot(solver._pool, pool)
+
+        # Changing the tolerances starts a new pool, whose workers use them
+        pool = solver._pool
+        solver.rtol = solver.atol = 1e-2
+        solutions = solver.solve(model, t_eval, inputs=inputs_list, nproc=3)
+        self.assertIsNot(solver._pool, pool)
+        for inputs, solution in zip(inputs_list, solutions):
+            np.testing.assert_array_equal(
+                solution.y, solver.solve(model, t_eval, inputs=inputs).y
+            )
+
+        # Copies and pickles of the solver do not share the pool
+        self.assertIsNone(solver.copy()._pool)
+        self.assertIsNone(pickle.loads(pickle.dumps(solver))._pool)
+
+        solver.close_pool()
+        self.assertIsNone(solver._pool)
+        # Closing twice does nothing
+        solver.close_pool()
+
     def test_model_solver_multiple_inputs_discontinuity_error(self):
         # Create model
         model = pybamm.BaseModel()
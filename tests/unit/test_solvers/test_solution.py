@@ -111,6 +111,74 @@ class TestSolution(TestCase):
         ):
             2 + sol3
 
+    def test_append(self):
+        t1 = np.linspace(0, 1)
+        y1 = np.tile(t1, (20, 1))
+        sol1 = pybamm.Solution(t1, y1, pybamm.BaseModel(), {"a": 1})
+        sol1.solve_time = 1.5
+        sol1.integration_time = 0.3
+        t2 = np.linspace(1, 2)
+        y2 = np.tile(t2, (20, 1))
+        sol2 = pybamm.Solution(t2, y2, pybamm.BaseModel(), {"a": 2})
+        sol2.solve_time = 1
+        sol2.integration_time = 0.5
+        t3 = np.linspace(3, 4)
+        y3 = np.tile(t3, (20, 1))
+        sol3 = pybamm.Solution(t3, y3, pybamm.BaseModel(), {"a": 3})
+        sol3.solve_time = 1
+        sol3.integration_time = 0.5
+
+        sol_sum = sol1 + sol2 + sol3
+
+        sol = sol1.copy()
+        self.assertEqual(sol.t[-1], 1)
+        last_state = sol.last_state
+        sol.append(sol2)
+        sol.append(sol3)
+        sol.append(None)
+        sol.append(pybamm.EmptySolution())
+
+        np.testing.assert_array_equal(sol.t, sol_sum.t)
+        np.testing.assert_array_equal(sol.y, sol_sum.y)
+        self.assertEqual(sol.all_inputs, sol_sum.all_inputs)
+        self.assertEqual(sol.all_inputs_casadi, sol_sum.all_inputs_casadi)
+        self.assertEqual(len(sol.sub_solutions), 3)
+        self.assertEqual(sol.integration_time, sol_sum.integration_time)
+        self.assertIsNot(sol.last_state, last_state)
+        self.assertEqual(sol.last_state.all_ts[0], 4)
+
+        # the solutions that were appended are unchanged
+        np.testing.assert_array_equal(sol1.t, t1)
+        self.assertEqual(len(sol1.all_ts), 1)
+        self.assertEqual(len(sol1.sub_solutions), 1)
+
+        # a fresh solution is replaced by a copy in its own sub-solutions
+        sol = pybamm.Solution(t1, y1, pybamm.BaseModel(), {"a": 1})
+        sol.solve_time = sol.integration_time = 0
+        sol.append(sol2)
+        self.assertIsNot(sol.sub_solutions[0], sol)
+        np.testing.assert_array_equal(sol.sub_solutions[0].t, t1)
+        np.testing.assert_array_equal(sol.t, np.concatenate([t1, t2[1:]]))
+
+        # appending a solution to itself
+        sol = sol1.copy()
+        sol.append(sol)
+        self.assertEqual(len(sol.all_ts), 2)
+
+        # times that are not increasing are only checked when `t` is computed
+        sol = sol3.copy()
+        sol.t
+        sol.append(sol1)
+        with self.assertRaisesRegex(
+            ValueError, "Solution time vector must be strictly increasing"
+        ):
+            sol.t
+
+        with self.assertRaisesRegex(
+            pybamm.SolverError, "Only a Solution or None can be added to a Solution"
+        ):
+            sol.append(2)
+
     def test_add_solutions_different_models(self):
         # Set up first solution
         t1 = np.linspace(0, 1)
@@ -153,6 +221,39 @@ class TestSolution(TestCase):
         self.assertEqual(sol_copy.solve_time, sol1.solve_time)
         self.assertEqual(sol_copy.integration_time, sol1.integration_time)
 
+    def test_thin(self):
+        model = pybamm.BaseModel()
+        c = pybamm.Variable("c")
+        model.rhs = {c: -c}
+        model.initial_conditions = {c: 1}
+        model.variables["c"] = c
+        solver = pybamm.ScipySolver(rtol=1e-8, atol=1e-8)
+        solution = solver.solve(model, np.linspace(0, 1, 1001))
+        # second sub-solution
+        solution = solver.step(solution, model, 1, npts=101)
+
+        thinned = solution.thin({"c": 1e-4})
+        self.assertEqual(len(thinned.all_ts), 2)
+        self.assertLess(len(thinned.t), 100)
+        # the ends of each sub-solution are kept
+        self.assertEqual(thinned.all_ts[0][0], 0)
+        self.assertEqual(thinned.all_ts[0][-1], 1)
+        self.assertEqual(thinned.t[-1], 2)
+        np.testing.assert_array_equal(thinned.y, solution["c"](thinned.t)[None, :])
+        # linear interpolation is within the tolerance
+        np.testing.assert_allclose(
+            thinned["c"](solution.t), solution["c"].entries, rtol=0, atol=1e-4
+        )
+        # a tighter tolerance keeps more times
+        self.assertGreater(len(solution.thin({"c": 1e-6}).t), len(thinned.t))
+
+        # errors
+        solution = pybamm.Solution(
+            np.array([0, 1]), np.zeros((1, 2)), model, {}, sensitivities={"a": 1}
+        )
+        with self.assertRaisesRegex(NotImplementedError, "sensitivities"):
+            solution.thin({"c": 1e-4})
+
     def test_last_state(self):
         # Set up first solution
         t1 = [np.linspace(0, 1), np.linspace(1, 2, 5)]
@@ -0,0 +1,62 @@
+#
+# Tests for the solution sinks
+#
+from tests import TestCase
+import os
+import pybamm
+import unittest
+import numpy as np
+import pandas as pd
+from tempfile import TemporaryDirectory
+
+
+class TestSolutionSinks(TestCase):
+    def test_base_sink(self):
+        sink = pybamm.SolutionSink()
+        self.assertIsNone(sink.write_step(None, {}))
+        self.assertIsNone(sink.write_cycle(None, {}))
+        self.assertIsNone(sink.close())
+
+    def test_data_file_sink(self):
+        model = pybamm.BaseModel()
+        c = pybamm.Variable("c")
+        model.rhs = {c: -c}
+        model.initial_conditions = {c: 1}
+        model.variables["c"] = c
+        solution = pybamm.ScipySolver().solve(model, np.linspace(0, 1, 11))
+        logs = {"cycle number": (2, 3), "step number": (1, 2)}
+
+        with TemporaryDirectory() as dir_name:
+            # one file per cycle
+            sink = pybamm.DataFileSink(os.path.join(dir_name, "cycles"), ["c"])
+            sink.write_step(solution, logs)
+            self.assertEqual(sink.filenames, [])
+            sink.write_cycle(solution, logs)
+            self.assertEqual(
+                sink.filenames, [os.path.join(dir_name, "cycles", "cycle_2.csv")]
+            )
+            data = pd.read_csv(sink.filenames[0])
+            np.testing.assert_allclose(data["c"], solution["c"].entries)
+
+            # one file per step
+            sink = pybamm.DataFileSink(dir_name, ["c"], to_format="json", per_step=True)
+            sink.write_step(pybamm.EmptySolution(), logs)
+            self.assertEqual(sink.filenames, [])
+            sink.write_step(solution, logs)
+            sink.write_cycle(solution, logs)
+            self.assertEqual(
+                sink.filenames, [os.path.join(dir_name, "cycle_2_step_1.json")]
+            )
+
+        with self.assertRaisesRegex(ValueError, "format 'hdf5' not recognised"):
+            pybamm.DataFileSink(dir_name, ["c"], to_format="hdf5")
+
+
+if __name__ == "__main__":
+    print("Add -v for more debug output")
+    import sys
+
+    if "-v" in sys.argv:
+        debug = True
+    pybamm.settings.debug_mode = True
+    unittest.main()
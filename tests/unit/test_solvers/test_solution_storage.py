@@ -0,0 +1,90 @@
+#
+# Tests for the MemmapStorage class
+#
+from tests import TestCase
+import os
+import casadi
+import pybamm
+import unittest
+import numpy as np
+from tempfile import TemporaryDirectory
+
+
+class TestMemmapStorage(TestCase):
+    def test_store(self):
+        with TemporaryDirectory() as dir_name:
+            storage = pybamm.MemmapStorage(dir_name, segment_size=1000)
+
+            # small arrays share a segment
+            y1 = np.arange(20.0).reshape(4, 5)
+            y2 = np.arange(12.0).reshape(3, 4)
+            stored1 = storage.store(y1)
+            stored2 = storage.store(y2)
+            self.assertIsInstance(stored1, np.memmap)
+            np.testing.assert_array_equal(stored1, y1)
+            np.testing.assert_array_equal(stored2, y2)
+            self.assertTrue(stored1.flags["F_CONTIGUOUS"])
+            self.assertEqual(len(os.listdir(dir_name)), 1)
+
+            # a new segment is created when the current one is full, and large
+            # arrays get a segment of their own
+            y3 = np.ones((10, 10))
+            y4 = np.ones((20, 20))
+            y5 = np.zeros(3)
+            np.testing.assert_array_equal(storage.store(y3), y3)
+            np.testing.assert_array_equal(storage.store(y4), y4)
+            np.testing.assert_array_equal(storage.store(y5), y5)
+            self.assertEqual(len(os.listdir(dir_name)), 3)
+
+            # earlier arrays are unchanged
+            np.testing.assert_array_equal(stored1, y1)
+            np.testing.assert_array_equal(stored2, y2)
+
+            # storages sharing a directory do not overwrite each other's files
+            other_storage = pybamm.MemmapStorage(dir_name, segment_size=1000)
+            other_storage.store(np.zeros((4, 5)))
+            np.testing.assert_array_equal(stored1, y1)
+
+            storage.clear()
+            self.assertEqual(len(os.listdir(dir_name)), 1)
+            other_storage.clear()
+            self.assertEqual(os.listdir(dir_name), [])
+
+    def test_store_solution(self):
+        model = pybamm.BaseModel()
+        t1 = np.linspace(0, 1)
+        y1 = np.tile(t1, (2, 1))
+        t2 = np.linspace(2, 3)
+        y2 = casadi.DM(np.tile(t2, (2, 1)))
+        sol1 = pybamm.Solution(t1, y1, model, {})
+        sol2 = pybamm.Solution(t2, y2, model, {})
+        for s in [sol1, sol2]:
+            s.solve_time = s.integration_time = 0
+        sol = sol1 + sol2
+        y = sol.y
+
+        with TemporaryDirectory() as dir_name:
+            storage = pybamm.MemmapStorage(dir_name)
+            self.assertIs(storage.store_solution(sol), sol)
+            for ys in sol.all_ys + [s for sub in sol.sub_solutions for s in sub.all_ys]:
+                self.assertIsInstance(ys, np.memmap)
+            # arrays shared with sub-solutions are only stored once
+            self.assertIs(sol.all_ys[0], sol.sub_solutions[0].all_ys[0])
+            np.testing.assert_array_equal(sol.y, y)
+
+            # storing again does not copy
+            all_ys = list(sol.all_ys)
+            storage.store_solution(sol)
+            self.assertEqual(sol.all_ys, all_ys)
+
+            storage.clear()
+
+
+if __name__ == "__main__":
+    print("Add -v for more debug output")
+    import sys
+
+    if "-v" in sys.argv:
+        debug = True
+    pybamm.settings.debug_mode = True
+    unittest.main()